@@ -0,0 +1,216 @@
+# backend/app/batch.py
+import asyncio
+import io
+import os
+import posixpath
+import zipfile
+from typing import Any, AsyncIterator, Dict, Iterator, List, NamedTuple, Optional
+
+from app.metrics import observe_parse
+from app.parser.cache import result_cache, content_key, cache_parse_result
+from app.parser.extractor import parse_pdf, PdfSource
+from app.pool import parse_pool, ParsePool, PoolOverloaded, ParseTimeout, PARSE_JOB_TIMEOUT
+from app.uploads import (
+    BadUpload, SpooledPdf, UploadTooLarge, iter_uploads, too_large_message, MAX_UPLOAD_BYTES, UPLOAD_CHUNK_BYTES,
+)
+
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "0")) or 500
+BATCH_FILE_TIMEOUT = float(os.getenv("BATCH_FILE_TIMEOUT", "0")) or PARSE_JOB_TIMEOUT  # seconds per file
+BATCH_TIMEOUT = float(os.getenv("BATCH_TIMEOUT", "900"))  # seconds for the whole batch
+# files handed to the pool at once; the rest of the pool's queue stays free for /parse traffic
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "0")) or parse_pool.size
+BATCH_RETRY_DELAY = 0.5  # seconds to wait when the shared pool is full
+
+UNSUPPORTED_FILE_ERROR = "Only PDF files (or ZIP archives of PDFs) are supported."
+
+
+class BatchFile(NamedTuple):
+    name: str
+    contents: Optional[PdfSource]
+    error: Optional[str] = None  # set when the file was rejected before parsing
+    digest: Optional[str] = None
+    upload: Optional[SpooledPdf] = None  # spooled upload backing `contents`, closed by close_files()
+
+
+class BatchResult(NamedTuple):
+    index: int
+    name: str
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+
+class TooManyFiles(Exception):
+    """Raised when an upload expands to more than BATCH_MAX_FILES statements."""
+
+
+def _zip_members(name: str, source: PdfSource, max_member_bytes: int = MAX_UPLOAD_BYTES) -> Iterator[BatchFile]:
+    """
+    The PDFs inside a ZIP upload, named "archive.zip/member.pdf", extracted one at a time: each
+    member is decompressed in chunks into its own SpooledPdf, so only the member being extracted
+    is ever in flight and large ones go to temp files whose paths the workers open.
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(source) if isinstance(source, bytes) else source)
+    except zipfile.BadZipFile:
+        yield BatchFile(name, None, "Not a valid ZIP archive.")
+        return
+    with archive:
+        for info in archive.infolist():
+            member = info.filename
+            if info.is_dir() or posixpath.basename(member).startswith(".") or member.startswith("__MACOSX/"):
+                continue
+            if not member.lower().endswith(".pdf"):
+                yield BatchFile(f"{name}/{member}", None, UNSUPPORTED_FILE_ERROR)
+                continue
+            if info.file_size > max_member_bytes:
+                yield BatchFile(f"{name}/{member}", None, too_large_message(max_member_bytes))
+                continue
+            spool = SpooledPdf(max_member_bytes)
+            try:
+                with archive.open(info) as f:
+                    for chunk in iter(lambda: f.read(UPLOAD_CHUNK_BYTES), b""):
+                        spool.write(chunk)
+                spool.finish()
+            except UploadTooLarge as e:
+                # the header under-declared the size
+                spool.close()
+                yield BatchFile(f"{name}/{member}", None, str(e))
+            except (zipfile.BadZipFile, RuntimeError, NotImplementedError) as e:
+                # corrupt member, encrypted member, unsupported compression
+                spool.close()
+                yield BatchFile(f"{name}/{member}", None, f"Could not read from ZIP: {e}")
+            except BaseException:
+                spool.close()
+                raise
+            else:
+                yield BatchFile(f"{name}/{member}", spool.source, digest=spool.digest, upload=spool)
+
+
+def _batch_limit(max_files: int):
+    """Per-file byte cap for a batch upload; other file types are not stored at all."""
+    def limit(filename: str) -> Optional[int]:
+        lower = filename.lower()
+        if lower.endswith(".pdf"):
+            return MAX_UPLOAD_BYTES
+        if lower.endswith(".zip"):
+            return MAX_UPLOAD_BYTES * max_files
+        return None
+    return limit
+
+
+async def collect_files(request, field: str = "files", max_files: int = BATCH_MAX_FILES) -> List[BatchFile]:
+    """
+    Read the `field` files of a multipart request into BatchFiles as they arrive, expanding ZIP
+    archives. Anything that isn't a PDF, or is over MAX_UPLOAD_BYTES, is kept as a rejected entry
+    so it still gets a result line. Raises TooManyFiles as soon as the batch passes `max_files`,
+    BadUpload if it has no files. Call close_files() on the result when done.
+    """
+    files: List[BatchFile] = []
+    parts = iter_uploads(request, _batch_limit(max_files))
+    try:
+        async for part in parts:
+            if part.field != field:
+                part.close()
+                continue
+            name = part.filename or "upload"
+            if part.error is not None:
+                files.append(BatchFile(name, None, part.error))
+            elif part.spool is None:
+                files.append(BatchFile(name, None, UNSUPPORTED_FILE_ERROR))
+            elif name.lower().endswith(".zip"):
+                with part.spool:
+                    members = _zip_members(name, part.spool.source)
+                    try:
+                        for f in members:
+                            files.append(f)
+                            if len(files) > max_files:
+                                break
+                    finally:
+                        members.close()
+            else:
+                files.append(BatchFile(name, part.spool.source, digest=part.spool.digest, upload=part.spool))
+            if len(files) > max_files:
+                raise TooManyFiles(f"A batch may contain at most {max_files} files.")
+    except BaseException:
+        close_files(files)
+        raise
+    finally:
+        await parts.aclose()
+    if not files:
+        raise BadUpload(f'Missing the "{field}" files.')
+    return files
+
+
+def close_files(files: List[BatchFile]) -> None:
+    """Delete the temp files behind a batch."""
+    for f in files:
+        if f.upload is not None:
+            f.upload.close()
+
+
+async def _parse_one(f: BatchFile, timeout: float, deadline: float, pool: ParsePool) -> Dict[str, Any]:
+    """Cached parse of one PDF; waits for room if the shared pool is full, until the batch deadline."""
+    cache_key = content_key(f.contents, digest=f.digest)
+    result = result_cache.get(cache_key)
+    if result is not None:
+        observe_parse(result, cached=True)
+        return result
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            result = await pool.run(parse_pdf, f.contents, None, f.digest, timeout=min(timeout, deadline - loop.time()))
+            break
+        except PoolOverloaded:
+            if loop.time() + BATCH_RETRY_DELAY >= deadline:
+                raise ParseTimeout("Batch time limit reached while waiting for a free worker")
+            await asyncio.sleep(BATCH_RETRY_DELAY)
+    observe_parse(result, cached=False)
+    cache_parse_result(cache_key, result)
+    return result
+
+
+async def parse_batch(files: List[BatchFile], file_timeout: float = BATCH_FILE_TIMEOUT,
+                      timeout: float = BATCH_TIMEOUT, concurrency: int = BATCH_CONCURRENCY,
+                      pool: ParsePool = parse_pool) -> AsyncIterator[BatchResult]:
+    """
+    Parse `files` concurrently on the pool and yield a BatchResult for each as soon as it finishes.
+    A failing file only fails its own result. Files still unfinished when `timeout` expires are
+    cancelled and reported as timed out.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(index: int, f: BatchFile) -> BatchResult:
+        if f.error is not None:
+            return BatchResult(index, f.name, None, f.error)
+        try:
+            async with slots:
+                result = await _parse_one(f, file_timeout, deadline, pool)
+            return BatchResult(index, f.name, result, None)
+        except ParseTimeout as e:
+            return BatchResult(index, f.name, None, str(e))
+        except Exception as e:
+            return BatchResult(index, f.name, None, f"Failed to parse: {e}")
+
+    tasks = [asyncio.ensure_future(_run(i, f)) for i, f in enumerate(files)]
+    reported = set()
+    try:
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=max(0.0, deadline - loop.time())):
+                item = await next_done
+                reported.add(item.index)
+                yield item
+        except asyncio.TimeoutError:
+            for index, task in enumerate(tasks):
+                if index in reported:
+                    continue
+                if task.done() and not task.cancelled():
+                    yield task.result()
+                else:
+                    task.cancel()
+                    yield BatchResult(index, files[index].name, None, f"Batch did not finish within {timeout:g}s")
+    finally:
+        # client went away or the batch timed out: drop whatever is still queued
+        for task in tasks:
+            task.cancel()
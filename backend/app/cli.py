@@ -0,0 +1,385 @@
+# backend/app/cli.py
+"""
+Offline batch parsing: statements straight from disk, no HTTP.
+
+    cd backend && python -m app.cli ARCHIVE_DIR "more/**/*.pdf" --out results.jsonl
+    python -m app.cli ARCHIVE_DIR --format csv --out transactions.csv --workers 8
+    python -m app.cli ARCHIVE_DIR --format parquet --out transactions/     (needs pyarrow)
+
+Inputs are files, directories (searched recursively for *.pdf) or glob patterns. Files are parsed
+on a process pool and written as they finish:
+
+    jsonl    one line per statement, the same bank/confidence/fields the API returns
+    csv      one row per transaction, statement columns repeated (statements without rows get one)
+    parquet  the csv rows as a directory of part-NNNNN.parquet files, one per --row-group statements;
+             workers hand back transactions as columns (TransactionColumns), tx_date is a date
+
+Every statement that reaches the output is recorded in a checkpoint file (<out>.checkpoint); a
+rerun with the same --out skips those and appends the rest, so an interrupted run can simply be
+started again. --fresh discards the checkpoint and output. Throughput (files/sec) is reported on
+stderr while running.
+
+A file that kills its worker process (a crash in a native PDF/OCR library, the OOM killer) breaks
+the whole pool: the pool is restarted and the files that were in flight are re-run one at a time,
+so only the file that kills a worker again is recorded as failed.
+"""
+import argparse
+import csv
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.parser.cache import document_digest
+from app.parser.columnar import TYPE_NAMES, TransactionColumns
+from app.parser.extractor import parse_pdf
+
+STATEMENT_COLUMNS = [
+    "file", "digest", "success", "error", "bank", "confidence", "last4", "statement_date",
+    "billing_cycle_start", "billing_cycle_end", "payment_due_date",
+    "total_balance", "total_balance_paise", "minimum_due", "minimum_due_paise",
+]
+TRANSACTION_COLUMNS = ["tx_index", "tx_date", "tx_description", "tx_amount", "tx_amount_paise", "tx_type"]
+ROW_COLUMNS = STATEMENT_COLUMNS + TRANSACTION_COLUMNS
+
+UNKNOWN_BANK_ERROR = "Bank not recognised."
+WORKER_DIED_ERROR = "Worker process died while parsing this file."
+
+
+# ---------------------- inputs ----------------------
+def find_pdfs(inputs: Iterable[str]) -> List[str]:
+    """Expand files, directories and glob patterns into a sorted, de-duplicated list of PDF paths."""
+    found: Set[str] = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _dirs, names in os.walk(item):
+                found.update(os.path.join(root, n) for n in names if n.lower().endswith(".pdf"))
+        elif os.path.isfile(item):
+            found.add(item)
+        else:
+            found.update(p for p in glob.glob(item, recursive=True) if os.path.isfile(p) and p.lower().endswith(".pdf"))
+    return sorted(os.path.abspath(p) for p in found)
+
+
+# ---------------------- worker ----------------------
+def _init_worker(log_level: str) -> None:
+    # the extractor logs per-document details at INFO/DEBUG; keep the terminal for progress by default
+    logging.basicConfig(level=log_level, format="%(levelname)s %(name)s: %(message)s")
+
+
+def parse_file(path: str, columnar: bool = False) -> Dict[str, Any]:
+    """
+    Worker entry point: parse one PDF from disk into an output record (never raises).
+    columnar=True returns the transactions as a TransactionColumns, which also pickles far smaller.
+    """
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"file": path, "digest": None, "success": False, "error": None}
+    try:
+        record["digest"] = document_digest(path)
+        result = parse_pdf(path, digest=record["digest"], columnar=columnar)
+        record["bank"] = result.get("bank", "UNKNOWN")
+        record["confidence"] = result.get("confidence")
+        record["fields"] = result.get("fields") or {}
+        record["timings"] = result.get("timings")
+        if record["bank"] == "UNKNOWN":
+            record["error"] = UNKNOWN_BANK_ERROR
+        else:
+            record["success"] = True
+    except Exception as e:
+        record["error"] = f"Failed to parse: {e}"
+    record["seconds"] = round(time.perf_counter() - started, 3)
+    return record
+
+
+# ---------------------- writers ----------------------
+def statement_rows(record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Flatten a record into one row per transaction (one row with empty tx_* if it has none)."""
+    fields = record.get("fields") or {}
+    base = {c: record.get(c, fields.get(c)) for c in STATEMENT_COLUMNS}
+    txs = fields.get("transactions") or []
+    if not txs:
+        yield dict(base, **{c: None for c in TRANSACTION_COLUMNS})
+        return
+    for i, tx in enumerate(txs):
+        yield dict(base, tx_index=i, tx_date=tx.get("date"), tx_description=tx.get("description"),
+                   tx_amount=tx.get("amount"), tx_amount_paise=tx.get("amount_paise"), tx_type=tx.get("type"))
+
+
+class JsonlWriter:
+    flush_every = 1
+    columnar = False  # whether records should carry TransactionColumns rather than row dicts
+
+    def __init__(self, out: str):
+        self._f = open(out, "a", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def flush(self) -> None:
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        self.flush()
+        self._f.close()
+
+
+class CsvWriter(JsonlWriter):
+    def __init__(self, out: str):
+        new = not os.path.exists(out) or os.path.getsize(out) == 0
+        self._f = open(out, "a", encoding="utf-8", newline="")
+        self._csv = csv.DictWriter(self._f, fieldnames=ROW_COLUMNS)
+        if new:
+            self._csv.writeheader()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._csv.writerows(statement_rows(record))
+
+
+def parquet_schema():
+    """One schema for every part file, so a column's type never depends on the values in a part."""
+    import pyarrow as pa
+
+    types = {
+        "success": pa.bool_(), "confidence": pa.float64(),
+        "total_balance_paise": pa.int64(), "minimum_due_paise": pa.int64(),
+        "tx_index": pa.int32(), "tx_date": pa.date32(), "tx_amount_paise": pa.int64(),
+    }
+    return pa.schema([(c, types.get(c, pa.string())) for c in ROW_COLUMNS])
+
+
+class ParquetWriter:
+    """
+    Buffers statements and writes each flush as a new part file, so a resumed run only adds parts.
+    Transactions stay in their TransactionColumns until the part's tx_* columns are built.
+    """
+    columnar = True
+
+    def __init__(self, out: str, flush_every: int):
+        self.schema = parquet_schema()  # fails before any parsing if pyarrow is missing
+        os.makedirs(out, exist_ok=True)
+        self.out = out
+        self.flush_every = flush_every
+        self._statements: List[Tuple[Dict[str, Any], TransactionColumns]] = []
+        self._part = len([n for n in os.listdir(out) if n.startswith("part-") and n.endswith(".parquet")])
+
+    def write(self, record: Dict[str, Any]) -> None:
+        fields = record.get("fields") or {}
+        txs = fields.get("transactions")
+        if not isinstance(txs, TransactionColumns):
+            txs = TransactionColumns.from_dicts(txs or [])  # failed parses have no columns
+        self._statements.append(({c: record.get(c, fields.get(c)) for c in STATEMENT_COLUMNS}, txs))
+
+    def _table(self, base: Dict[str, Any], txs: TransactionColumns):
+        """One statement's rows: its transactions, or a single row with null tx_* if it has none."""
+        import pyarrow as pa
+
+        n = len(txs)
+        types = {field.name: field.type for field in self.schema}
+        columns = {c: pa.array([base[c]] * max(1, n), type=types[c]) for c in STATEMENT_COLUMNS}
+        if n:
+            tx = txs.to_arrow()
+            columns.update(
+                tx_index=pa.array(range(n), type=types["tx_index"]),
+                tx_date=tx["date"],
+                tx_description=tx["description"],
+                tx_amount=pa.array([txs.amount_at(i) for i in range(n)], type=types["tx_amount"]),
+                tx_amount_paise=tx["amount_paise"],
+                tx_type=pa.array([TYPE_NAMES[code] for code in txs.types], type=types["tx_type"]),
+            )
+        else:
+            columns.update({c: pa.nulls(1, type=types[c]) for c in TRANSACTION_COLUMNS})
+        return pa.table(columns, schema=self.schema)
+
+    def flush(self) -> None:
+        if not self._statements:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.concat_tables([self._table(base, txs) for base, txs in self._statements])
+        path = os.path.join(self.out, f"part-{self._part:05d}.parquet")
+        pq.write_table(table, path + ".tmp")
+        os.replace(path + ".tmp", path)  # a part is either complete or absent
+        self._part += 1
+        self._statements = []
+
+    def close(self) -> None:
+        self.flush()
+
+
+def open_writer(fmt: str, out: str, row_group: int):
+    if fmt == "jsonl":
+        return JsonlWriter(out)
+    if fmt == "csv":
+        return CsvWriter(out)
+    return ParquetWriter(out, row_group)
+
+
+# ---------------------- checkpoint ----------------------
+class Checkpoint:
+    """Append-only list of input paths whose results are safely in the output."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done = {line.rstrip("\n") for line in f if line.strip()}
+        self._f = open(path, "a", encoding="utf-8")
+
+    def record(self, paths: Iterable[str]) -> None:
+        self._f.writelines(p + "\n" for p in paths)
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def _discard(path: str) -> None:
+    if os.path.isdir(path):
+        for name in os.listdir(path):
+            if name.startswith("part-") and name.endswith(".parquet"):
+                os.remove(os.path.join(path, name))
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+# ---------------------- run ----------------------
+def _start_pool(workers: int, log_level: str) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(log_level,))
+
+
+def run(inputs: List[str], out: str, fmt: str = "jsonl", workers: Optional[int] = None,
+        checkpoint: Optional[str] = None, fresh: bool = False, row_group: int = 500,
+        log_level: str = "WARNING", progress_every: float = 5.0) -> Dict[str, Any]:
+    """Parse every PDF under `inputs` into `out`; returns the run's counters."""
+    checkpoint = checkpoint or out.rstrip("/\\") + ".checkpoint"
+    if fresh:
+        _discard(out)
+        _discard(checkpoint)
+    workers = workers or os.cpu_count() or 1
+
+    writer = open_writer(fmt, out, row_group)
+    ckpt = Checkpoint(checkpoint)
+    files = find_pdfs(inputs)
+    todo = [p for p in files if p not in ckpt.done]
+    stats = {"found": len(files), "skipped": len(files) - len(todo), "parsed": 0, "failed": 0}
+    print(f"📂 {len(files)} PDFs found, {stats['skipped']} already done, {len(todo)} to parse", file=sys.stderr)
+
+    started = last_report = time.monotonic()
+    unflushed: List[str] = []
+    in_flight: Dict[Future, str] = {}
+    suspects: List[str] = []      # in flight when a worker died, re-run one at a time
+    solo: Optional[Future] = None  # the suspect running alone, if any
+    queue = iter(todo)
+    pool = _start_pool(workers, log_level)
+    try:
+        while True:
+            # keep a couple of files per worker in flight rather than submitting the whole archive
+            while solo is None and len(in_flight) < workers * 2:
+                if suspects:
+                    if not in_flight:
+                        solo = pool.submit(parse_file, suspects[0], writer.columnar)
+                        in_flight[solo] = suspects.pop(0)
+                    break
+                nxt = next(queue, None)
+                if nxt is None:
+                    break
+                in_flight[pool.submit(parse_file, nxt, writer.columnar)] = nxt
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            broken = False
+            for fut in finished:
+                path = in_flight.pop(fut)
+                alone = fut is solo
+                if alone:
+                    solo = None
+                try:
+                    record = fut.result()
+                except BrokenProcessPool:
+                    broken = True
+                    if not alone:
+                        suspects.append(path)
+                        continue
+                    # it killed a worker with nothing else running: this file is the cause
+                    record = {"file": path, "digest": None, "success": False, "error": WORKER_DIED_ERROR}
+                writer.write(record)
+                unflushed.append(record["file"])
+                stats["parsed"] += 1
+                stats["failed"] += not record["success"]
+            if broken:
+                # every future of a broken pool fails; re-run the rest of the in-flight files too
+                suspects.extend(in_flight.values())
+                in_flight.clear()
+                pool.shutdown(wait=False, cancel_futures=True)
+                if suspects:
+                    print(f"⚠️ A worker process died; re-running {len(suspects)} file(s) one at a time",
+                          file=sys.stderr)
+                pool = _start_pool(workers, log_level)
+
+            if len(unflushed) >= writer.flush_every:
+                writer.flush()
+                ckpt.record(unflushed)
+                unflushed = []
+            now = time.monotonic()
+            if now - last_report >= progress_every:
+                last_report = now
+                rate = stats["parsed"] / (now - started)
+                print(f"⏱️ {stats['parsed']}/{len(todo)} parsed, {stats['failed']} failed, {rate:.2f} files/sec",
+                      file=sys.stderr)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        writer.close()
+        if unflushed:
+            ckpt.record(unflushed)
+        ckpt.close()
+
+    elapsed = time.monotonic() - started
+    stats["seconds"] = round(elapsed, 3)
+    stats["files_per_sec"] = round(stats["parsed"] / elapsed, 2) if elapsed > 0 else 0.0
+    print(f"✅ {stats['parsed']} parsed ({stats['failed']} failed) in {elapsed:.1f}s, "
+          f"{stats['files_per_sec']} files/sec", file=sys.stderr)
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("inputs", nargs="+", help="PDF files, directories or glob patterns")
+    ap.add_argument("--out", required=True, help="output file (jsonl, csv) or directory (parquet)")
+    ap.add_argument("--format", choices=["jsonl", "csv", "parquet"], help="default: from --out's extension, else jsonl")
+    ap.add_argument("--workers", type=int, help="parse processes (default: CPU count)")
+    ap.add_argument("--checkpoint", help="checkpoint file (default: <out>.checkpoint)")
+    ap.add_argument("--fresh", action="store_true", help="ignore and discard an existing checkpoint and output")
+    ap.add_argument("--row-group", type=int, default=500, help="statements per parquet part file")
+    ap.add_argument("--log-level", default="WARNING", type=str.upper,
+                    choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="extractor log level (default: WARNING)")
+    args = ap.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        ext = os.path.splitext(args.out.rstrip("/\\"))[1].lower().lstrip(".")
+        fmt = ext if ext in ("jsonl", "csv", "parquet") else "jsonl"
+    try:
+        stats = run(args.inputs, args.out, fmt=fmt, workers=args.workers, checkpoint=args.checkpoint,
+                    fresh=args.fresh, row_group=max(1, args.row_group), log_level=args.log_level)
+    except ImportError as e:
+        print(f"❌ {fmt} output needs an optional dependency: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("⏹️ Interrupted; rerun the same command to resume.", file=sys.stderr)
+        return 130
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
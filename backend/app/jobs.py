@@ -0,0 +1,223 @@
+# backend/app/jobs.py
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+from app.metrics import observe_parse
+from app.parser.cache import result_cache, content_key, cache_parse_result
+from app.parser.extractor import parse_pdf, PdfSource
+from app.pool import parse_pool, ParsePool, PoolOverloaded, time_limit, PARSE_POOL_SIZE
+from app.uploads import SpooledPdf
+
+# Jobs run on the shared parse pool, at most JOB_WORKERS at a time, so a backlog of jobs leaves
+# the rest of the pool to /parse and never adds processes of its own.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "0")) or max(1, PARSE_POOL_SIZE // 2)
+JOB_MAX_PENDING = int(os.getenv("JOB_MAX_PENDING", "0")) or JOB_WORKERS * 16
+JOB_RESULT_TTL = float(os.getenv("JOB_RESULT_TTL", "3600"))  # seconds a finished job stays readable
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", "600"))  # seconds a job may run before it is failed
+
+
+def run_job(job_id: str, pdf: PdfSource, digest: Optional[str], progress_queue, timeout: float = 0) -> Dict[str, Any]:
+    """Worker entry point: parse one statement and stream page progress back to the parent."""
+    progress_queue.put((job_id, "started", 0, 0))
+
+    def _progress(stage: str, page: int, pages: int) -> None:
+        progress_queue.put((job_id, stage, page, pages))
+
+    with time_limit(timeout):
+        return parse_pdf(pdf, progress=_progress, digest=digest)
+
+
+class Job:
+    def __init__(self, job_id: str, cache_key: str = ""):
+        self.id = job_id
+        self.cache_key = cache_key
+        self.status = "queued"  # queued -> running -> done | failed
+        self.stage = ""
+        self.page = 0
+        self.pages = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.timings: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "progress": {"stage": self.stage, "page": self.page, "pages": self.pages},
+            "error": self.error,
+        }
+
+
+# a job waiting for a slot: (job, pdf source, digest, spooled upload to close when it is done)
+Waiting = Tuple[Job, PdfSource, Optional[str], Optional[SpooledPdf]]
+
+
+class JobQueue:
+    """
+    In-process job store. Jobs wait here and at most `workers` of them at a time run on the shared
+    parse pool; each one that finishes starts the next. Workers report per-page progress through a
+    shared queue that a listener thread applies to the jobs.
+    """
+
+    def __init__(self, pool: ParsePool = parse_pool, workers: int = JOB_WORKERS, max_pending: int = JOB_MAX_PENDING,
+                 ttl: float = JOB_RESULT_TTL, timeout: float = JOB_TIMEOUT):
+        self.pool = pool
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.ttl = ttl
+        self.timeout = timeout
+        self._jobs: Dict[str, Job] = {}
+        self._waiting: Deque[Waiting] = deque()
+        self._running = 0
+        self._lock = threading.Lock()
+        self._progress = None
+        self._listener: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._progress is not None:
+            return
+        self._progress = self.pool.make_queue()
+        self._listener = threading.Thread(target=self._listen, name="job-progress", daemon=True)
+        self._listener.start()
+
+    def shutdown(self) -> None:
+        """Stop taking progress and drop waiting jobs; the pool itself belongs to the app."""
+        with self._lock:
+            waiting, self._waiting = list(self._waiting), deque()
+        for job, _, _, upload in waiting:
+            job.status, job.error, job.finished_at = "failed", "Server shut down before the job ran.", time.time()
+            if upload is not None:
+                upload.close()
+        if self._progress is not None:
+            self._progress.put(None)
+            self._listener.join(timeout=5)
+            self._progress = None
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                msg = self._progress.get()
+            except (EOFError, OSError):
+                return
+            if msg is None:
+                return
+            job_id, stage, page, pages = msg
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                # progress can arrive after the job finished; status only ever moves forward
+                if job.status == "queued":
+                    job.status = "running"
+                if job.status == "running" and stage != "started":
+                    job.stage, job.page, job.pages = stage, page, pages
+
+    def _dispatch(self) -> None:
+        """Start waiting jobs while fewer than `workers` are running."""
+        while True:
+            with self._lock:
+                if self._running >= self.workers or not self._waiting:
+                    return
+                job, source, digest, upload = self._waiting.popleft()
+                self._running += 1
+            job.started_at = time.time()
+            try:
+                # this queue caps its own in-flight jobs, so the pool's /parse queue limit does not apply
+                fut = self.pool.submit(run_job, job.id, source, digest, self._progress, self.timeout, bounded=False)
+            except Exception as e:
+                with self._lock:
+                    self._running -= 1
+                    job.status, job.error, job.finished_at = "failed", f"Parsing failed: {e}", time.time()
+                if upload is not None:
+                    upload.close()
+                continue
+            fut.add_done_callback(lambda f, job=job, upload=upload: self._finish(job, f, upload))
+
+    def _finish(self, job: Job, fut: Future, upload: Optional[SpooledPdf] = None) -> None:
+        with self._lock:
+            self._running -= 1
+        try:
+            self._complete(job, fut, upload)
+        finally:
+            self._dispatch()
+
+    def _complete(self, job: Job, fut: Future, upload: Optional[SpooledPdf]) -> None:
+        if upload is not None:
+            upload.close()
+        if job.status == "failed":
+            return  # already reported as timed out
+        job.finished_at = time.time()
+        if fut.cancelled():
+            job.status, job.error = "failed", "Job was cancelled."
+            return
+        exc = fut.exception()
+        if exc is not None:
+            job.status, job.error = "failed", f"Parsing failed: {exc}"
+            return
+        job.result = fut.result()
+        job.timings = observe_parse(job.result, cached=False)
+        job.status = "done"
+        if job.cache_key:
+            cache_parse_result(job.cache_key, job.result)
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        cutoff = now - self.ttl
+        with self._lock:
+            for job_id in [j.id for j in self._jobs.values() if j.finished_at and j.finished_at < cutoff]:
+                del self._jobs[job_id]
+            if self.timeout <= 0:
+                return
+            for job in self._jobs.values():
+                # in process mode the worker aborts the parse itself (time_limit); threads cannot be
+                # interrupted, so there the job is only reported as failed and its slot stays taken
+                if job.status in ("queued", "running") and job.started_at and now - job.started_at > self.timeout:
+                    job.status, job.finished_at = "failed", now
+                    job.error = f"Parsing did not finish within {self.timeout:g}s"
+
+    def submit(self, pdf: Union[bytes, SpooledPdf]) -> Job:
+        """
+        Queue a statement for parsing. Raises PoolOverloaded when too many jobs are pending.
+        A SpooledPdf is owned by the job from here on and closed once the job finishes.
+        """
+        upload = pdf if isinstance(pdf, SpooledPdf) else None
+        source, digest = (upload.source, upload.digest) if upload else (pdf, None)
+        try:
+            self.start()
+            self._evict_expired()
+            job = Job(uuid.uuid4().hex, content_key(source, digest=digest))
+            cached = result_cache.get(job.cache_key)
+            if cached is not None:
+                observe_parse(cached, cached=True)
+                job.result, job.status, job.finished_at = cached, "done", time.time()
+                with self._lock:
+                    self._jobs[job.id] = job
+                if upload:
+                    upload.close()
+                return job
+            with self._lock:
+                if len(self._waiting) + self._running >= self.max_pending:
+                    raise PoolOverloaded(f"{len(self._waiting) + self._running} jobs pending (limit {self.max_pending})")
+                self._jobs[job.id] = job
+                self._waiting.append((job, source, digest, upload))
+        except Exception:
+            if upload:
+                upload.close()
+            raise
+        self._dispatch()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._evict_expired()
+        return self._jobs.get(job_id)
+
+
+job_queue = JobQueue()
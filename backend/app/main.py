@@ -1,10 +1,27 @@
 # backend/app/main.py
-from fastapi import FastAPI, File, UploadFile, HTTPException
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from app.parser.extractor import parse_pdf_bytes
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from app.parser.extractor import parse_pdf, result_events, PARSE_MODES
+from app.parser.cache import result_cache, content_key, cache_parse_result
+from app.pool import parse_pool, PoolOverloaded, ParseTimeout
+from app.jobs import job_queue
+from app.streaming import event_hub, run_stream
+from app.batch import collect_files, close_files, parse_batch, TooManyFiles
+from app.uploads import BadUpload, SpooledPdf, spool_request, too_large_message, UploadTooLarge, MAX_UPLOAD_BYTES
+from app.metrics import registry, observe_parse, REQUEST_SECONDS
 import uvicorn
 
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
 app = FastAPI(title="Credit Card Statement Parser")
 app.add_middleware(
     CORSMiddleware,
@@ -13,23 +30,285 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-@app.post("/parse")
-async def parse(file: UploadFile = File(...)):
-    if not file.filename.lower().endswith(".pdf"):
+
+SUPPORTED_BANKS = ["KOTAK", "ICICI", "AXIS", "HDFC", "SBI"]
+UNSUPPORTED_BANK_ERROR = "Only Kotak, ICICI, Axis, HDFC, and SBI Bank statements are supported."
+BUSY_ERROR = "Server is busy parsing other statements. Please retry shortly."
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # boundaries and part headers around a single file
+SINGLE_FILE_ENDPOINTS = ("/parse", "/parse-stream", "/jobs")
+
+
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    """Answer 413 before reading the body when a single-file upload declares a size over the cap."""
+    length = request.headers.get("content-length", "")
+    if (request.method == "POST" and request.url.path in SINGLE_FILE_ENDPOINTS and length.isdigit()
+            and int(length) > MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES):
+        return JSONResponse(status_code=413, content={"error": too_large_message(MAX_UPLOAD_BYTES)})
+    return await call_next(request)
+
+
+@app.exception_handler(UploadTooLarge)
+async def upload_too_large(request: Request, exc: UploadTooLarge):
+    return JSONResponse(status_code=413, content={"error": str(exc)})
+
+
+@app.exception_handler(BadUpload)
+async def bad_upload(request: Request, exc: BadUpload):
+    return JSONResponse(status_code=422, content={"error": str(exc)})
+
+
+def upload_body(field: str, many: bool = False) -> Dict[str, Any]:
+    """OpenAPI request body of a route that reads its multipart upload itself (uploads.iter_uploads)."""
+    file_schema = {"type": "string", "format": "binary"}
+    schema = {"type": "array", "items": file_schema} if many else file_schema
+    return {"requestBody": {"required": True, "content": {"multipart/form-data": {"schema": {
+        "type": "object", "properties": {field: schema}, "required": [field],
+    }}}}}
+
+
+async def read_pdf_upload(request: Request) -> SpooledPdf:
+    """
+    The request's "file" PDF, spooled while the body arrives. Over MAX_UPLOAD_BYTES it is cut off
+    at the cap with a 413, chunked uploads included (see the handlers above).
+    """
+    part = await spool_request(request, "file")
+    if part.spool is None:
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
+    return part.spool
 
-    contents = await file.read()
-    result = parse_pdf_bytes(contents)
 
-    bank = result.get("bank", "").upper()
-    if bank not in ["KOTAK", "ICICI", "AXIS", "HDFC", "SBI"]:
+@app.on_event("startup")
+def start_parse_pool():
+    parse_pool.start()
+
+
+@app.on_event("shutdown")
+def stop_parse_pool():
+    # the job and stream queues live in the pool's Manager, so stop their listeners first
+    job_queue.shutdown()
+    event_hub.shutdown()
+    parse_pool.shutdown()
+
+
+@app.get("/metrics")
+def metrics():
+    """Prometheus scrape endpoint: stage histograms, OCR fallback, bank mix and cache counters."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.post("/parse", openapi_extra=upload_body("file"))
+async def parse(request: Request, mode: str = "full", timings: bool = False):
+    """mode=summary returns the header fields only, reading no further into the PDF than it needs."""
+    started = time.perf_counter()
+    if mode not in PARSE_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of: {', '.join(PARSE_MODES)}.")
+    upload = await read_pdf_upload(request)
+
+    with upload:
+        cache_key = content_key(upload.source, digest=upload.digest, mode=mode)
+        result = result_cache.get(cache_key)
+        if result is None and mode == "summary":
+            result = summary_of(result_cache.get(content_key(upload.source, digest=upload.digest)))
+        cached = result is not None
+        if not cached:
+            try:
+                result = await parse_pool.run(parse_pdf, upload.source, None, upload.digest, mode)
+            except PoolOverloaded:
+                return JSONResponse(
+                    status_code=503,
+                    content={"error": BUSY_ERROR},
+                    headers={"Retry-After": "5"},
+                )
+            except ParseTimeout as e:
+                return JSONResponse(status_code=504, content={"error": str(e)})
+        stages = observe_parse(result, cached)
+        if not cached:
+            cache_parse_result(cache_key, result)
+
+    body = statement_body(result)
+    elapsed = time.perf_counter() - started
+    REQUEST_SECONDS.observe(elapsed, endpoint="/parse")
+    if timings:
+        body["timings"] = {"cache": "hit" if cached else "miss", "request_ms": round(elapsed * 1000, 2), **(stages or {})}
+    if "error" in body:
         return JSONResponse(
             status_code=400,
-            content={"error": "Only Kotak, ICICI, Axis, HDFC, and SBI Bank statements are supported."}
+            content=body
         )
 
 
-    return {"success": True, "bank": bank, "fields": result.get("fields")}
+    return body
+
+
+def summary_of(result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """A cached full parse answers a summary request too: the same result without its transactions."""
+    if result is None:
+        return None
+    fields = {k: v for k, v in (result.get("fields") or {}).items() if k != "transactions"}
+    return {**result, "fields": fields}
+
+
+def statement_body(result: Dict[str, Any]) -> Dict[str, Any]:
+    """/parse response body for a parse result, or {"error": ...} if the bank isn't supported."""
+    bank = result.get("bank", "").upper()
+    if bank not in SUPPORTED_BANKS:
+        return {"error": UNSUPPORTED_BANK_ERROR}
+    return {"success": True, "bank": bank, "confidence": result.get("confidence"), "fields": result.get("fields")}
+
+
+@app.post("/parse-stream", openapi_extra=upload_body("file"))
+async def parse_stream(request: Request, timings: bool = False):
+    """
+    /parse as NDJSON events, sent as the statement is read: "bank", then "summary", then
+    "transactions" rows page by page, and last "done" (or "error" if parsing failed or timed out).
+    """
+    started = time.perf_counter()
+    upload = await read_pdf_upload(request)
+
+    cache_key = content_key(upload.source, digest=upload.digest)
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        upload.close()
+        observe_parse(cached, cached=True)
+
+        def replay():
+            for event in result_events(cached):
+                yield json.dumps(event) + "\n"
+            yield json.dumps(stream_done(cached, started)) + "\n"
+
+        return StreamingResponse(replay(), media_type="application/x-ndjson")
+
+    stream_id, events = event_hub.open()
+    try:
+        fut = parse_pool.submit(run_stream, stream_id, upload.source, upload.digest, event_hub.events)
+    except PoolOverloaded:
+        event_hub.close(stream_id)
+        upload.close()
+        return JSONResponse(status_code=503, content={"error": BUSY_ERROR}, headers={"Retry-After": "5"})
+    loop = asyncio.get_running_loop()
+    # the spooled file must outlive this request if the client disconnects mid-parse
+    fut.add_done_callback(lambda f: upload.close())
+
+    def _worker_died(f) -> None:
+        # a worker that dies never sends its end-of-stream marker; end the stream for it
+        if not f.cancelled() and f.exception() is not None:
+            loop.call_soon_threadsafe(events.put_nowait, None)
+
+    fut.add_done_callback(_worker_died)
+
+    async def lines():
+        deadline = loop.time() + parse_pool.timeout
+        timed_out = {"event": "error", "error": f"Parsing did not finish within {parse_pool.timeout:g}s"}
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(events.get(), timeout=max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    yield json.dumps(timed_out) + "\n"
+                    return
+                if event is None:
+                    break
+                yield json.dumps(event) + "\n"
+            try:
+                result = await asyncio.wait_for(asyncio.wrap_future(fut), timeout=max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                yield json.dumps(timed_out) + "\n"
+                return
+            except Exception as e:
+                yield json.dumps({"event": "error", "error": f"Failed to parse: {e}"}) + "\n"
+                return
+            stages = observe_parse(result, cached=False)
+            cache_parse_result(cache_key, result)
+            yield json.dumps(stream_done(result, started, stages if timings else None)) + "\n"
+        finally:
+            event_hub.close(stream_id)
+            fut.cancel()  # drops it if still queued; a running parse finishes in its worker
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def stream_done(result: Dict[str, Any], started: float, stages: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Final /parse-stream event: success (or the unsupported-bank error), row count and timings."""
+    elapsed = time.perf_counter() - started
+    REQUEST_SECONDS.observe(elapsed, endpoint="/parse-stream")
+    body = statement_body(result)
+    done = {"event": "done", "success": "error" not in body}
+    if "error" in body:
+        done["error"] = body["error"]
+    done["transactions"] = len((result.get("fields") or {}).get("transactions") or [])
+    done["elapsed"] = round(elapsed, 3)
+    if stages:
+        done["timings"] = stages
+    return done
+
+
+@app.post("/parse-batch", openapi_extra=upload_body("files", many=True))
+async def parse_batch_endpoint(request: Request):
+    """
+    Parse many statements (PDFs and/or ZIPs of PDFs) in one call.
+    Streams NDJSON: one line per file as it finishes, with the same body as /parse plus
+    "index" and "file", then a final {"done": true, ...} summary line.
+    """
+    try:
+        batch = await collect_files(request, "files")
+    except TooManyFiles as e:
+        return JSONResponse(status_code=413, content={"error": str(e)})
+
+    async def lines():
+        started = time.monotonic()
+        succeeded = 0
+        try:
+            async for item in parse_batch(batch):
+                if item.error is not None:
+                    body = {"success": False, "error": item.error}
+                else:
+                    body = statement_body(item.result)
+                    body.setdefault("success", False)
+                succeeded += body["success"]
+                yield json.dumps({"index": item.index, "file": item.name, **body}) + "\n"
+        finally:
+            close_files(batch)
+        yield json.dumps({
+            "done": True,
+            "files": len(batch),
+            "succeeded": succeeded,
+            "failed": len(batch) - succeeded,
+            "elapsed": round(time.monotonic() - started, 3),
+        }) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/jobs", status_code=202, openapi_extra=upload_body("file"))
+async def create_job(request: Request):
+    """Queue a statement for background parsing and return its job id immediately."""
+    upload = await read_pdf_upload(request)
+    try:
+        job = job_queue.submit(upload)
+    except PoolOverloaded:
+        return JSONResponse(status_code=503, content={"error": BUSY_ERROR}, headers={"Retry-After": "5"})
+
+    return {"success": True, "job_id": job.id, "status": job.status}
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, timings: bool = False):
+    job = job_queue.get(job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "Job not found or expired."})
+
+    body = job.to_dict()
+    if job.status == "done":
+        bank = job.result.get("bank", "").upper()
+        if bank not in SUPPORTED_BANKS:
+            body.update({"status": "failed", "error": UNSUPPORTED_BANK_ERROR})
+        else:
+            body.update({"bank": bank, "confidence": job.result.get("confidence"), "fields": job.result.get("fields")})
+        if timings:
+            body["timings"] = {"cache": "miss" if job.timings else "hit", **(job.timings or {})}
+    body["success"] = body["status"] != "failed"
+    return body
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,171 @@
+# backend/app/metrics.py
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Seconds; parsing a digital statement is ~10 ms, OCR of a scanned one runs to tens of seconds.
+STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+LabelValues = Tuple[str, ...]
+INF_LABEL = 'le="+Inf"'
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def _label_text(self, key: LabelValues, extra: str = "") -> str:
+        parts = [f'{name}="{value}"' for name, value in zip(self.labels, key)]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{self._label_text(key)} {value:g}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = STAGE_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, List[Any]] = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            if i < len(self.buckets):
+                series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets, series):
+                    cumulative += n
+                    le = 'le="%g"' % bound
+                    lines.append(f"{self.name}_bucket{self._label_text(key, le)} {cumulative}")
+                labels = self._label_text(key)
+                lines.append(f"{self.name}_bucket{self._label_text(key, INF_LABEL)} {series[-1]}")
+                lines.append(f"{self.name}_sum{labels} {series[-2]:.6f}")
+                lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        return "\n".join(line for m in self._metrics for line in m.render()) + "\n"
+
+
+registry = Registry()
+
+STAGE_SECONDS = registry.register(Histogram(
+    "surefinance_parse_stage_seconds",
+    "Time spent per parsing stage (extract, ocr, ocr_page, detect, summary, transactions, total).",
+    labels=["stage"],
+))
+REQUEST_SECONDS = registry.register(Histogram(
+    "surefinance_request_seconds", "End-to-end time of parse requests, cache hits included.", labels=["endpoint"],
+))
+DOCUMENTS = registry.register(Counter(
+    "surefinance_documents_parsed_total",
+    "Documents run through the extractor, by whether any page needed OCR (the OCR fallback rate).",
+    labels=["ocr"],
+))
+OCR_PAGES = registry.register(Counter("surefinance_ocr_pages_total", "Pages routed to the OCR fallback."))
+OCR_RERENDERS = registry.register(Counter(
+    "surefinance_ocr_rerendered_pages_total", "Pages re-rendered at high DPI after low OCR confidence (adaptive OCR).",
+))
+OCR_BLANK_PAGES = registry.register(Counter(
+    "surefinance_ocr_blank_pages_total", "Rendered pages found blank and skipped before OCR.",
+))
+STATEMENTS = registry.register(Counter(
+    "surefinance_statements_total", "Statements served, by detected bank (UNKNOWN included).", labels=["bank"],
+))
+CACHE_LOOKUPS = registry.register(Counter(
+    "surefinance_cache_lookups_total",
+    "Cache lookups: parse results (result), document page text (text) and OCR'd page text (ocr_page).",
+    labels=["cache", "result"],
+))
+
+
+def observe_parse(result: Dict[str, Any], cached: bool) -> Optional[Dict[str, Any]]:
+    """
+    Record one served statement: cache hits/misses, bank mix and, for a fresh parse, its stage
+    timings. Removes and returns the result's "timings" block (so it is never cached).
+    """
+    CACHE_LOOKUPS.inc(cache="result", result="hit" if cached else "miss")
+    STATEMENTS.inc(bank=str(result.get("bank") or "UNKNOWN").upper())
+    timings = None if cached else result.pop("timings", None)
+    if timings:
+        for key, value in timings.items():
+            if not key.endswith("_ms"):
+                continue
+            stage = key[:-3]
+            for ms in value if isinstance(value, list) else [value]:
+                STAGE_SECONDS.observe(ms / 1000, stage=stage)
+        if timings.get("text_cache_hits"):
+            CACHE_LOOKUPS.inc(timings["text_cache_hits"], cache="text", result="hit")
+        if timings.get("text_cache_misses"):
+            CACHE_LOOKUPS.inc(timings["text_cache_misses"], cache="text", result="miss")
+        ocr_pages = timings.get("ocr_pages", 0)  # every page OCR'd missed the OCR page cache
+        if timings.get("ocr_cache_hits"):
+            CACHE_LOOKUPS.inc(timings["ocr_cache_hits"], cache="ocr_page", result="hit")
+        if ocr_pages:
+            CACHE_LOOKUPS.inc(ocr_pages, cache="ocr_page", result="miss")
+        if not timings.get("text_cache_hits"):
+            DOCUMENTS.inc(ocr="yes" if ocr_pages else "no")
+        if ocr_pages:
+            OCR_PAGES.inc(ocr_pages)
+        if timings.get("ocr_rerendered"):
+            OCR_RERENDERS.inc(timings["ocr_rerendered"])
+        if timings.get("ocr_blank_pages"):
+            OCR_BLANK_PAGES.inc(timings["ocr_blank_pages"])
+    return timings
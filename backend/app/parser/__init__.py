@@ -0,0 +1,2 @@
+# Bump whenever parser output changes so cached results from older parsers are not served.
+PARSER_VERSION = "4"
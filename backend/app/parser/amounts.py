@@ -0,0 +1,104 @@
+# backend/app/parser/amounts.py
+"""
+Exact amount parsing.
+
+Every bank spells money differently ("Rs. 1,234.50", "INR 1234.5", "₹ 1,23,456.00 Cr",
+HDFC's "C 2,000.00" where the rupee glyph extracts as "C", a stray backtick, SBI's trailing C/D).
+This module turns all of them into integer paise so totals can be summed without float drift.
+
+The parsers parse each captured amount once: summary fields through money(), which gives both the
+display string they have always returned ("₹1234.50", "1234.50", ...) and the `*_paise` value
+stored next to it, transaction rows a statement at a time through parse_amounts() (the sinks'
+add_rows() in columnar.py).
+Transaction paise are signed: credits (payments, refunds, Cr/C rows) are negative, so a
+statement's rows sum to its net charge.
+"""
+from decimal import Decimal
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from .patterns import AMOUNT
+
+
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+class Amount(NamedTuple):
+    paise: int
+    credit: Optional[bool]  # True for Cr/C, False for Dr/D, None when the text doesn't say
+
+
+def _from_match(m) -> Amount:
+    rupees = m.group("rupees").replace(",", "")
+    frac = m.group("frac") or ""
+    paise = int(rupees) * 100
+    if frac:
+        # round half up past the second decimal
+        paise += int((frac + "0")[:2])
+        if len(frac) > 2 and frac[2] >= "5":
+            paise += 1
+    if m.group("neg") or m.group("paren"):
+        paise = -paise
+    flag = (m.group("flag") or "").lower()
+    credit = True if flag in ("cr", "c") else False if flag in ("dr", "d") else None
+    return Amount(paise, credit)
+
+
+def parse_amount(s: str) -> Optional[Amount]:
+    """'₹ 1,234.5 Cr' -> Amount(paise=123450, credit=True); None if `s` is not an amount."""
+    if not s:
+        return None
+    m = AMOUNT["amount"].fullmatch(s)
+    return _from_match(m) if m else None
+
+
+def to_paise(s: str) -> Optional[int]:
+    a = parse_amount(s)
+    return a.paise if a else None
+
+
+def to_decimal(s: str) -> Optional[Decimal]:
+    """Exact rupee value, e.g. '1,234.5' -> Decimal('1234.50')."""
+    a = parse_amount(s)
+    return Decimal(a.paise).scaleb(-2) if a else None
+
+
+def parse_amounts(values: Iterable[Optional[str]]) -> List[Optional[int]]:
+    """
+    Batch form of to_paise() for a whole column (e.g. every transaction amount).
+    Amounts repeat a lot less than dates, so this is no memo: plain amounts with two decimals
+    ("5,150.00", the tokens the extractors capture) are read with str.replace and int(), anything
+    else goes through one precompiled fullmatch.
+    """
+    fullmatch = AMOUNT["amount"].fullmatch
+    out: List[Optional[int]] = []
+    for v in values:
+        if v and v[0] in _ASCII_DIGITS and v[-3:-2] == ".":
+            digits = v[:-3].replace(",", "") + v[-2:]
+            if digits.isascii() and digits.isdigit():
+                out.append(int(digits))
+                continue
+        m = fullmatch(v) if v else None
+        a = _from_match(m) if m else None
+        out.append(a.paise if a else None)
+    return out
+
+
+def format_paise(paise: int, symbol: str = "₹") -> str:
+    """123450 -> '₹1234.50'."""
+    sign = "-" if paise < 0 else ""
+    whole, frac = divmod(abs(paise), 100)
+    return f"{sign}{symbol}{whole}.{frac:02d}"
+
+
+def money(raw: Optional[str], symbol: str = "₹", credit: bool = False) -> Tuple[str, Optional[int]]:
+    """
+    One parse of a captured amount: its display string -- `symbol` + rupees with two decimals and no
+    digit grouping -- and its paise, negative for a credit (`credit=True`, or a Cr/C flag in `raw`).
+    '1,234.5' -> ('₹1234.50', 123450); ("", None) if `raw` is not an amount.
+    """
+    m = AMOUNT["amount"].fullmatch(raw) if raw else None
+    if m is None:
+        return "", None
+    paise, flagged = _from_match(m)
+    display = format_paise(paise, symbol)
+    return display, -abs(paise) if credit or flagged else paise
@@ -1,51 +1,129 @@
-import re
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
+from .utils import normalize_date, find_last4
+from .dates import DATE_CACHE_SIZE, normalize_date_icici, normalize_date_hdfc
+from .patterns import COMMON, KOTAK, ICICI, AXIS, HDFC, SBI, GENERIC, label_pattern, label_then_date_pattern
+from .amounts import money
+from .columnar import transaction_sink
+from .lines import Line
+from .scanner import FieldScanner
+from .detect import detect_bank
+from .sections import SectionIndex
+from .timing import StageTimer
+
 
 def find_date_near_label(text: str, label_regex: str, window_after: int = 220, window_before: int = 40):
-    date_token = r"([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4}|\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}/\d{1,2}/\d{4})"
-    m = re.search(label_regex, text, re.IGNORECASE)
+    date_token = COMMON["near_label_date"]
+    m = label_pattern(label_regex).search(text)
     if not m:
         # try global pattern: label followed by date anywhere nearby
-        m2 = re.search(rf"{label_regex}[\s\S]{{0,{window_after}}}{date_token}", text, re.IGNORECASE)
+        m2 = label_then_date_pattern(label_regex, window_after).search(text)
         if m2:
             return m2.group(m2.lastindex).strip()
         return None
     after = text[m.end(): m.end() + window_after]
-    m_after = re.search(date_token, after, re.IGNORECASE)
+    m_after = date_token.search(after)
     if m_after:
         return m_after.group(1).strip()
     before = text[max(0, m.start() - window_before): m.start()]
-    m_before = re.search(date_token, before, re.IGNORECASE)
+    m_before = date_token.search(before)
     if m_before:
         return m_before.group(1).strip()
-    m_near = re.search(rf"{label_regex}[\s\S]{{0,{window_after}}}{date_token}", text, re.IGNORECASE)
+    m_near = label_then_date_pattern(label_regex, window_after).search(text)
     if m_near:
         return m_near.group(m_near.lastindex).strip()
     return None
-from typing import Dict, Any ,List
-from .utils import normalize_date, find_last4
-from datetime import datetime
-from typing import Dict, Any
-from .utils import normalize_date, find_last4
+
+
+# Which Line records (lines.py) can open a row: the date shapes and amount flags of each bank's rows
+_GENERIC_FLAGS = ("", "Cr")
+_SBI_FLAGS = ("", "C", "D", "M")
+
+
+def _is_dmy_date(date: str) -> bool:
+    """dd/mm/yyyy (Kotak/ICICI and HDFC rows)."""
+    return date.count("/") == 2 and date.rfind("/") == len(date) - 5
+
+
+def _is_dmon_date(date: str) -> bool:
+    """"30 Sep 25" or "30Sep2025": a three-letter month and no apostrophe (SBI rows)."""
+    month = date.strip("0123456789").strip()
+    return len(month) == 3 and month.isalpha() and "'" not in date
+
+
+def _is_axis_date_line(line: Line, raw: List[str]) -> bool:
+    """
+    AXIS["tx_date_line"]: a date in column 0 of a line started by a newline (raw is TextLines.raw),
+    its parts apart if the month is spelt out, then a word break.
+    """
+    date, i = line.date, line.index
+    if not date or not raw[i][:1].isdecimal() or (i and raw[i - 1][-1] not in "\r\n"):
+        return False
+    if date.lstrip("0123456789")[:1] not in ("/", "-", ".") and len(date.split()) != 3:
+        return False
+    after = line.body[:1]
+    return not (after.isalnum() or after == "_")
+
 
 # ✅ Detect bank and route to correct parser
-def detect_bank_and_parse(text: str) -> Dict[str, Any]:
-    text_upper = text.upper()
-    if "ICICI BANK" in text_upper:
-        return {"bank": "ICICI", "fields": parse_icici(text)}
-    elif "KOTAK" in text_upper:
-        return {"bank": "KOTAK", "fields": parse_kotak(text)}
-    elif "AXIS BANK" in text_upper:
-        return {"bank": "AXIS", "fields": parse_axis(text)}
-    elif "HDFC BANK" in text_upper:
-        return {"bank": "HDFC", "fields": parse_hdfc(text)}
-    elif "SBI" in text_upper:
-        return {"bank": "SBI", "fields": parse_sbi(text)}
-    else:
-        return {"bank": "UNKNOWN", "fields": {}}
+def detect_bank_and_parse(text: str, columnar: bool = False, timer: Optional[StageTimer] = None,
+                          transactions: bool = True, partial: bool = False) -> Dict[str, Any]:
+    """
+    columnar=True returns fields["transactions"] as a TransactionColumns (filled directly by the
+    bank's extractor) instead of a list of dicts.
+    transactions=False parses the summary fields only; the result has no "transactions" key.
+    partial=True is for text that is only the first pages of a statement: summary fields that
+    depend on the whole document (Axis's cycle taken from its rows) are left empty.
+    The document's SectionIndex is built once here and handed to the bank parser.
+    `timer`, if given, collects the "detect", "summary" and "transactions" stage times.
+    """
+    timer = timer or StageTimer()
+    with timer.stage("detect"):
+        bank, confidence = detect_bank(text)
+    parser = PARSERS.get(bank)
+    if parser is None:
+        return {"bank": "UNKNOWN", "fields": {}, "confidence": confidence}
+    before = timer.seconds.get("transactions", 0.0)
+    with timer.stage("parse"):
+        fields = parser(text, SectionIndex(text, partial), timer, transactions, columnar)
+    # everything the bank parser did besides extracting transactions is summary-field work
+    timer.add("summary", timer.seconds.pop("parse") - (timer.seconds.get("transactions", 0.0) - before))
+    if not transactions:
+        fields.pop("transactions", None)
+    return {"bank": bank, "fields": fields, "confidence": confidence}
+
+
+# header fields a summary-only parse reads pages until it has found
+SUMMARY_FIELDS = ("last4", "statement_date", "payment_due_date", "total_balance", "minimum_due")
+# the ICICI parser only sets statement_date when a "Statement Month"/"Statement Date" label parses;
+# Axis falls back to the rows' dates for its cycle, so a summary parse needs the printed cycle
+BANK_SUMMARY_FIELDS = {
+    "ICICI": ("last4", "payment_due_date", "total_balance", "minimum_due"),
+    "AXIS": SUMMARY_FIELDS + ("billing_cycle_start", "billing_cycle_end"),
+}
+
+
+def summary_complete(result: Dict[str, Any]) -> bool:
+    """True once the bank is known and each of its summary fields has a value."""
+    bank = result.get("bank", "UNKNOWN")
+    fields = result.get("fields") or {}
+    return bank != "UNKNOWN" and all(fields.get(name) for name in BANK_SUMMARY_FIELDS.get(bank, SUMMARY_FIELDS))
 
 
 # ---------------------- kotak bank PARSER-----------------
-def parse_kotak(text: str) -> Dict[str, Any]:
+KOTAK_SUMMARY = FieldScanner({
+    "statement_date": [KOTAK["statement_date"]],
+    "billing_cycle": [KOTAK["billing_cycle"]],
+    "payment_due_date": [KOTAK["payment_due_date"]],
+    "total_balance": [KOTAK["total_balance"]],
+    "minimum_due": [KOTAK["minimum_due"]],
+})
+
+
+def parse_kotak(text: str, sections: Optional[SectionIndex] = None,
+               timer: Optional[StageTimer] = None, transactions: bool = True,
+               columnar: bool = False) -> Dict[str, Any]:
     fields = {
         "last4": "",
         "statement_date": "",
@@ -53,112 +131,74 @@ def parse_kotak(text: str) -> Dict[str, Any]:
         "billing_cycle_end": "",
         "payment_due_date": "",
         "total_balance": "",
+        "total_balance_paise": None,
         "minimum_due": "",
+        "minimum_due_paise": None,
         "transactions": [],
     }
 
+    sections = sections or SectionIndex(text)
+    timer = timer or StageTimer()
+
     # ---- Last 4 digits ----
     fields["last4"] = find_last4(text) or ""
 
 
     # ---- Statement Date ----
-    m = re.search(r"Statement\s+Date\s+([0-9]{1,2}[-/A-Za-z]+[-/0-9]+)", text)
+    hits = KOTAK_SUMMARY.scan(text, before=sections.summary_end)
+    m = hits.get("statement_date")
     if m:
         fields["statement_date"] = normalize_date(m.group(1))
 
     # ---- Billing Cycle ----
-    m = re.search(r"Transaction\s+details\s+from\s+([A-Za-z0-9-]+)\s+to\s+([A-Za-z0-9-]+)", text)
+    m = hits.get("billing_cycle")
     if m:
         fields["billing_cycle_start"] = normalize_date(m.group(1))
         fields["billing_cycle_end"] = normalize_date(m.group(2))
 
     # ---- Payment Due Date ----
-    m_due = re.search(
-     r"Remember\s*to\s*pay\s*by\s*([0-9]{1,2}[-/][A-Za-z]{3}[-/][0-9]{4})",
-     text,
-     re.IGNORECASE
-   )
+    m_due = hits.get("payment_due_date")
     if m_due:
      fields["payment_due_date"] = normalize_date(m_due.group(1))
 
 
     # ---- Total Amount Due ----
-    m = re.search(r"Total\s+Amount\s+Due.*?Rs\.?\s?([0-9,]+\.\d{2})", text)
+    m = hits.get("total_balance")
     if m:
-        fields["total_balance"] = m.group(1).replace(",", "")
+        fields["total_balance"], fields["total_balance_paise"] = money(m.group(1), "")
 
     # ---- Minimum Amount Due ----
-    m = re.search(r"Minimum\s+Amount\s+Due.*?Rs\.?\s?([0-9,]+\.\d{2})", text)
+    m = hits.get("minimum_due")
     if m:
-        fields["minimum_due"] = m.group(1).replace(",", "")
+        fields["minimum_due"], fields["minimum_due_paise"] = money(m.group(1), "")
 
     # ---- Transactions ----
-    fields["transactions"] = extract_transactions(text)
+    if transactions:
+        with timer.stage("transactions"):
+            fields["transactions"] = extract_transactions(text, sections, columnar)
 
     return fields
 
 
 # ----------------------- ICICI BANK PARSER ----------------------
 
-
-import re
-from typing import Dict, Any
-from datetime import datetime
-
-# small date normalizer used by ICICI parser
-def normalize_date_icici(s: str) -> str:
-    """Normalize a variety of human date tokens to ISO YYYY-MM-DD. Return original stripped string on failure."""
-    if not s:
-        return ""
-    s0 = s.strip().replace("’", "'").replace("‘", "'").replace(".", "").replace(",", "")
-    s0 = re.sub(r"\s+", " ", s0)
-    fmts = [
-        "%d %b %Y", "%d %B %Y",      # "14 Oct 2025", "14 October 2025"
-        "%b %d %Y", "%B %d %Y",      # "Oct 14 2025", "October 14 2025"
-        "%d/%m/%Y", "%d-%m-%Y",      # "14/10/2025"
-        "%Y-%m-%d"                   # ISO
-    ]
-    for f in fmts:
-        try:
-            return datetime.strptime(s0, f).strftime("%Y-%m-%d")
-        except Exception:
-            continue
-    # Also try if input is "Oct 2025" -> return YYYY-MM-01
-    m_mon = re.match(r"^([A-Za-z]{3,9})\s+(\d{4})$", s.strip())
-    if m_mon:
-        try:
-            return datetime.strptime(m_mon.group(0), "%b %Y").strftime("%Y-%m-01")
-        except Exception:
-            try:
-                return datetime.strptime(m_mon.group(0), "%B %Y").strftime("%Y-%m-01")
-            except Exception:
-                pass
-    return s.strip()
-
-def _clean_amount_raw(s: str) -> str:
-    """Return amount normalized to '₹<value with 2 decimals>' or empty string."""
-    if not s:
-        return ""
-    t = s.replace("`", "").replace("Rs.", "").replace("INR", "").replace("₹", "").strip()
-    t = t.replace(",", "")
-    if re.match(r"^\d+(\.\d{1,2})?$", t):
-        if "." not in t:
-            t = t + ".00"
-        elif len(t.split(".")[1]) == 1:
-            t = t + "0"
-        return "₹" + t
-    # if decimals missing, try to coerce numeric part
-    m = re.search(r"(\d+(?:\.\d+)?)", t)
-    if m:
-        v = m.group(1)
-        if "." not in v:
-            v = v + ".00"
-        elif len(v.split(".")[1]) == 1:
-            v = v + "0"
-        return "₹" + v
-    return ""
-
-def parse_icici(text: str) -> Dict[str, Any]:
+# every ICICI summary field, scanned in one pass over the flattened text
+ICICI_SUMMARY = FieldScanner({
+    "last4_masked": [ICICI["last4_masked"]],
+    "last4_label": [ICICI["last4_label"]],
+    "period": [ICICI["period"]],
+    "statement_month": [ICICI["statement_month"]],
+    "statement_date": [ICICI["statement_date"]],
+    "billing_cycle": [ICICI["billing_cycle"]],
+    "payment_due_date": ICICI["payment_due_date"],
+    "total_balance": ICICI["total_balance"],
+    "minimum_due": ICICI["minimum_due"],
+})
+
+
+def parse_icici(text: str, sections: Optional[SectionIndex] = None,
+               timer: Optional[StageTimer] = None, transactions: bool = True,
+               columnar: bool = False) -> Dict[str, Any]:
     """
     Robust ICICI parser: extracts last4, statement_date, billing_cycle_start, billing_cycle_end,
     payment_due_date, total_balance and minimum_due.
@@ -170,37 +210,38 @@ def parse_icici(text: str) -> Dict[str, Any]:
         "billing_cycle_end": "",
         "payment_due_date": "",
         "total_balance": "",
+        "total_balance_paise": None,
         "minimum_due": "",
+        "minimum_due_paise": None,
         "transactions": [],
     }
 
     # helper text zones
-    top = text[:5000]  # prefer header/summary area
-    flat_top = " ".join(top.split())
-    flat_all = " ".join(text.split())
+    sections = sections or SectionIndex(text)
+    timer = timer or StageTimer()
+    top = sections.head  # prefer header/summary area
+    flat_all = sections.flat()
+    top_end = len(sections.flat("head"))  # header/summary area within flat_all
+    hits = ICICI_SUMMARY.scan(flat_all)
 
     # ---- last4 (prefer masked X pattern) ----
-    m = re.search(r"X{4,}\s*(\d{4})", top)
+    m = hits.get("last4_masked", within=top_end)
     if m:
         fields["last4"] = m.group(1)
     else:
         # fallback near header
-        m2 = re.search(r"(?:Card|Credit|XXXXX|XXXX)\s*[:\-]?\s*(\d{4})", top, re.IGNORECASE)
+        m2 = hits.get("last4_label", within=top_end)
         if m2:
             fields["last4"] = m2.group(1)
         else:
             # last 4 digits anywhere in top area
-            all4 = re.findall(r"\b(\d{4})\b", top)
+            all4 = COMMON["four_digits"].findall(top)
             if all4:
                 fields["last4"] = all4[-1]
 
     # ---- STATEMENT PERIOD (start & end) ----
     # Try explicit "Statement period" or "Billing Period"
-    period_re = re.compile(
-        r"(?:Statement\s+period|Statement\s+Period|Billing\s*Period)\s*[:\-]?\s*([A-Za-z0-9,\s\/\-\']+?)\s*(?:to|[-–])\s*([A-Za-z0-9,\s\/\-\']+?)\b",
-        re.IGNORECASE
-    )
-    m_period = period_re.search(top) or period_re.search(flat_top) or period_re.search(flat_all)
+    m_period = hits.get("period")
     if m_period:
         start_raw = m_period.group(1).strip()
         end_raw = m_period.group(2).strip()
@@ -221,85 +262,46 @@ def parse_icici(text: str) -> Dict[str, Any]:
     #         fields["statement_date"] = normalize_date_icici(m.group(1))
     #         break
         # statement_date: Selected Statement Month OR Statement Date label
-    m_sel = re.search(r"STATEMENT\s+DATE\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{4})", top, re.IGNORECASE)
+    m_sel = hits.get("statement_month", within=top_end)
     if m_sel:
         fields["statement_date"] = normalize_date_axis(m_sel.group(1))
     else:
-        m_sd = re.search(r"Statement\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2}\s*'?\d{2,4})", top, re.IGNORECASE)
+        m_sd = hits.get("statement_date", within=top_end)
         if m_sd:
             fields["statement_date"] = normalize_date_axis(m_sd.group(1))
 
     # If still empty, fall back to billing_cycle_end if available
     # ---- Billing Cycle ----
-    m_cycle = re.search(
-        r"Statement\s*Period\s*[:\-]?\s*([0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{4})\s*(?:to|-)\s*([0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{4})",
-        top,
-        re.IGNORECASE,
-    )
+    m_cycle = hits.get("billing_cycle", within=top_end)
     if m_cycle:
         fields["billing_cycle_start"] = normalize_date(m_cycle.group(1))
         fields["billing_cycle_end"] = normalize_date(m_cycle.group(2))
 
     # ---- PAYMENT DUE DATE ----
-    # Prefer summary area; try multiple labeling variants
-    pd_patterns = [
-        r"Payment\s+Due\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
-        r"Payment\s+Due\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
-        r"Pay\s+by\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
-        r"Due\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})",
-        r"Payment\s+Due\s+Date\s*[:\-]?\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})",
-    ]
-    for p in pd_patterns:
-        m = re.search(p, top, re.IGNORECASE)
-        if not m:
-            m = re.search(p, flat_top, re.IGNORECASE)
-        if not m:
-            m = re.search(p, flat_all, re.IGNORECASE)
-        if m:
-            fields["payment_due_date"] = normalize_date_icici(m.group(1))
-            break
+    # Try multiple labeling variants, most specific first
+    m = hits.get("payment_due_date")
+    if m:
+        fields["payment_due_date"] = normalize_date_icici(m.group(1))
 
     # ---- TOTAL AMOUNT DUE / MINIMUM AMOUNT DUE ----
-    # Look in top summary (left panel usually)
-    total_patterns = [
-        r"(?:Total\s+Amount\s+due|Total\s+Amount\s+Due|TOTAL\s+AMOUNT\s+DUE)\s*[:\n\r-]*\s*[₹`Rs\.]*\s*([0-9,]+(?:\.\d{1,2})?)",
-        r"(?:Total\s+Amount\s+due|Total\s+Amount\s+Due)[\s\S]{0,40}?([0-9,]+(?:\.\d{1,2})?)"
-    ]
-    min_patterns = [
-        r"(?:Minimum\s+Amount\s+due|Minimum\s+Amount\s+Due|Minimum\s+Amount)\s*[:\n\r-]*\s*[₹`Rs\.]*\s*([0-9,]+(?:\.\d{1,2})?)",
-        r"Minimum\s+Amount\s+due[\s\S]{0,40}?([0-9,]+(?:\.\d{1,2})?)"
-    ]
-
-    def _scan_patterns(patterns, src_primary, src_fallback):
-        for p in patterns:
-            m = re.search(p, src_primary, re.IGNORECASE)
-            if m:
-                return m.group(1)
-        for p in patterns:
-            m = re.search(p, src_fallback, re.IGNORECASE)
-            if m:
-                return m.group(1)
-        return None
-
-    tot_raw = _scan_patterns(total_patterns, top, flat_top)
-    min_raw = _scan_patterns(min_patterns, top, flat_top)
-
-    # fallback to flat_all if not found in top
-    if not tot_raw:
-        tot_raw = _scan_patterns(total_patterns, flat_all, flat_all)
-    if not min_raw:
-        min_raw = _scan_patterns(min_patterns, flat_all, flat_all)
+    # Look in top summary (left panel usually), then fall back to the whole document
+    m_tot = hits.get("total_balance", before=top_end)
+    m_min = hits.get("minimum_due", before=top_end)
+    tot_raw = m_tot.group(1) if m_tot else None
+    min_raw = m_min.group(1) if m_min else None
 
     if tot_raw:
-        fields["total_balance"] = _clean_amount_raw(tot_raw)
+        fields["total_balance"], fields["total_balance_paise"] = money(tot_raw)
     if min_raw:
-        fields["minimum_due"] = _clean_amount_raw(min_raw)
+        fields["minimum_due"], fields["minimum_due_paise"] = money(min_raw)
 
     # ---- Transactions (reuse your existing extractor) ----
     try:
-        fields["transactions"] = extract_transactions(text)
+        if transactions:
+            with timer.stage("transactions"):
+                fields["transactions"] = extract_transactions(text, sections, columnar)
     except Exception:
-        fields["transactions"] = []
+        fields["transactions"] = transaction_sink(columnar)
 
     # Final sanity: avoid returning malformed placeholders
     if fields["total_balance"] == "₹" or fields["total_balance"] is None:
@@ -316,11 +318,8 @@ def parse_icici(text: str) -> Dict[str, Any]:
 
 
 # ---------------------- AXIS BANK PARSER ----------------------
-import re
-from typing import Dict, Any, List, Optional
-from .utils import find_last4
-
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def normalize_date_axis(s: str) -> str:
     """
     Convert common Axis date tokens to ISO YYYY-MM-DD (or YYYY-MM-01 for month-only).
@@ -337,7 +336,7 @@ def normalize_date_axis(s: str) -> str:
     s0 = s0.replace("’", "'").replace("‘", "'").replace(".", "").strip()
 
     # Pattern: dd Mon 'yy or dd Mon yyyy   e.g. 09 Oct '25  or 09 Oct 2025
-    m = re.match(r"^(\d{1,2})\s+([A-Za-z]{3,9})\s+'?(\d{2,4})$", s0)
+    m = AXIS["date_dmy"].match(s0)
     if m:
         day = int(m.group(1))
         mon = m.group(2)
@@ -351,14 +350,14 @@ def normalize_date_axis(s: str) -> str:
             pass
 
     # Pattern: Mon YYYY  e.g. Oct 2025  -> return YYYY-MM-01
-    m = re.match(r"^([A-Za-z]{3,9})\s+(\d{4})$", s0)
+    m = COMMON["month_year"].match(s0)
     if m:
         month = _month_to_num(m.group(1))
         year = int(m.group(2))
         return f"{year:04d}-{month:02d}-01"
 
     # Pattern: dd/mm/yyyy or dd-mm-yyyy or dd.mm.yyyy
-    m = re.match(r"^(\d{1,2})[\/\-.](\d{1,2})[\/\-.](\d{2,4})$", s0)
+    m = AXIS["date_numeric"].match(s0)
     if m:
         d = int(m.group(1)); mo = int(m.group(2)); y = int(m.group(3))
         if y < 100:
@@ -366,16 +365,14 @@ def normalize_date_axis(s: str) -> str:
         return f"{y:04d}-{mo:02d}-{d:02d}"
 
     # Pattern: yyyy-mm-dd
-    m = re.match(r"^(\d{4})-(\d{2})-(\d{2})$", s0)
+    m = COMMON["iso_date"].match(s0)
     if m:
         return s0
 
     # fallback: return stripped input (caller can detect non-ISO)
     return s0
 
-def _month_to_num(name: str) -> int:
-    name = name.strip().lower()
-    months = {
+_MONTHS = {
         "jan": 1, "january": 1,
         "feb": 2, "february": 2,
         "mar": 3, "march": 3,
@@ -388,91 +385,83 @@ def _month_to_num(name: str) -> int:
         "oct": 10, "october": 10,
         "nov": 11, "november": 11,
         "dec": 12, "december": 12,
-    }
-    return months.get(name[:3].lower(), months.get(name, 0))
+}
 
 
-def _axis_clean_amount(s: str) -> str:
-    if not s:
-        return ""
-    s = s.replace(",", "").replace("`", "").strip()
-    s = re.sub(r"^(Rs\.?|INR|₹)\s*", "", s, flags=re.IGNORECASE)
-    # ensure two decimals
-    if re.match(r"^\d+(\.\d{1,2})?$", s):
-        if "." not in s:
-            s = s + ".00"
-        elif len(s.split(".")[1]) == 1:
-            s = s + "0"
-    return "₹" + s
-
-
-def extract_transactions_axis(text: str) -> List[Dict[str, Any]]:
+def _month_to_num(name: str) -> int:
+    name = name.strip().lower()
+    return _MONTHS.get(name[:3].lower(), _MONTHS.get(name, 0))
+
+
+AXIS_TX_HEADERS = ("transaction summary", "transaction details", "transaction history", "transactions for the period", "card transactions")
+
+
+def extract_transactions_axis(text: str, sections: Optional[SectionIndex] = None, columnar: bool = False):
     """
     Extract Axis transaction rows. This function expects the PDF-extracted plain text.
     It searches for dates that start at the beginning of a line and collects all text until
     the next date-start line as that transaction's block (so multi-line descriptions are preserved).
+    Rows go into transaction_sink(columnar): row dicts, or a TransactionColumns.
     """
-    txs: List[Dict[str, Any]] = []
-
-    # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-
-    # Try to find the block start for transactions
-    lower = text.lower()
-    start_idx = None
-    for header in ["transaction summary", "transaction details", "transaction history", "transactions for the period", "card transactions"]:
-        idx = lower.find(header)
-        if idx != -1:
-            start_idx = idx
-            break
-    block = text[start_idx:] if start_idx is not None else text
+    dates, descs, amounts, types = [], [], [], []
+
+    # Try to find the block start for transactions (first header in order of preference)
+    sections = sections or SectionIndex(text)
+    start_idx = sections.first_of(AXIS_TX_HEADERS)
+    lines = sections.lines_of((start_idx, len(text))) if start_idx != -1 else sections.lines
+    texts = lines.texts
 
-    # We'll find lines that begin with a date. Use multiline flag so ^ matches line-starts.
+    # The lines that begin with a date in column 0.
     # Date variants handled: "09 Oct '25", "09 Oct 2025", "09/10/2025", "2025-10-09"
-    date_line_re = re.compile(r"^(?P<date>\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}[\/\-.]\d{1,2}[\/\-.]\d{2,4}|\d{4}-\d{2}-\d{2})\b", re.IGNORECASE | re.MULTILINE)
-
-    # find all date-line matches (with their positions)
-    matches = list(date_line_re.finditer(block))
-    if not matches:
-        # Nothing matched as line-start dates -> fallback: try to parse every line that contains ₹
-        for line in block.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            amt_m = re.search(r"(?:₹|Rs\.?)\s*([0-9,]+(?:\.[0-9]{1,2})?)", line, re.IGNORECASE)
-            if amt_m:
-                # try to pull a date (anywhere on the same line)
-                date_any = re.search(r"(\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}[\/\-.]\d{1,2}[\/\-.]\d{2,4}|\d{4}-\d{2}-\d{2})", line)
-                date_iso = normalize_date_axis(date_any.group(0)) if date_any else ""
-                desc = re.sub(r"(?:₹|Rs\.?)\s*[0-9,]+(?:\.\d{1,2})?", "", line).strip()
-                amt = _axis_clean_amount(amt_m.group(1))
-                tx_type = "Credit" if re.search(r"\b(cr|credit|credited|cashback)\b", line, re.IGNORECASE) else ("Debit" if re.search(r"\b(dr|debit|debited|purchase|spent)\b", line, re.IGNORECASE) else "")
-                txs.append({"date": date_iso, "description": re.sub(r"\s+", " ", desc), "amount": amt, "type": tx_type})
+    raw = lines.raw
+    starts = [line for line in lines.records if _is_axis_date_line(line, raw)]
+    if not starts:
+        # Nothing matched as line-start dates -> fallback: every line that contains a ₹/Rs amount,
+        # found in one scan of the block's lines
+        block = "\n".join(texts)
+        line_end = -1
+        for amt_m in AXIS["tx_line_amount"].finditer(block):
+            if amt_m.start() <= line_end:
+                continue  # a second amount on a line already taken
+            line_start = block.rfind("\n", 0, amt_m.start()) + 1
+            line_end = block.find("\n", amt_m.start())
+            if line_end == -1:
+                line_end = len(block)
+            if amt_m.end() > line_end:
+                continue  # "₹" ends its line: the digits after it belong to the next one
+            line = block[line_start:line_end]
+            # try to pull a date (anywhere on the same line)
+            date_any = AXIS["tx_date_any"].search(line)
+            dates.append(normalize_date_axis(date_any.group(0)) if date_any else "")
+            descs.append(COMMON["whitespace"].sub(" ", AXIS["tx_line_amount_strip"].sub("", line).strip()))
+            amounts.append(amt_m.group(1))
+            types.append("Credit" if AXIS["tx_line_credit"].search(line) else ("Debit" if AXIS["tx_line_debit"].search(line) else ""))
+        txs = transaction_sink(columnar, "₹")
+        txs.add_rows(dates, descs, amounts, types)
         return txs
 
-    # For each date-line match, slice from its end to the start of next match (or end of block)
-    for i, m in enumerate(matches):
-        date_token = m.group("date").strip()
-        start_pos = m.end()
-        end_pos = matches[i+1].start() if i+1 < len(matches) else len(block)
-        segment = block[start_pos:end_pos].strip()  # this includes description, maybe amount and debit/credit words
+    # Each row runs from the end of its date to the next date line (or the end of the block)
+    ends = [line.index for line in starts[1:]] + [len(raw)]
+    for line, end in zip(starts, ends):
+        date_token = line.date
+        # this includes description, maybe amount and debit/credit words
+        segment = "".join([raw[line.index][len(date_token):], *raw[line.index + 1:end]]).strip()
 
         # Normalize segment whitespace but preserve internal spaces
-        seg = re.sub(r"[ \t]+", " ", segment).strip()
+        seg = COMMON["spaces"].sub(" ", segment).strip()
 
         # Amount extraction (prefer ₹ presence)
-        amt_m = re.search(r"(?:₹|Rs\.?)\s*([0-9,]+(?:\.\d{1,2})?)", seg, re.IGNORECASE)
+        amt_m = AXIS["tx_amount"].search(seg)
         if not amt_m:
             # fallback: numbers followed by optional Cr/Dr
-            amt_m = re.search(r"([0-9,]+(?:\.\d{1,2})?)\s*(?:Cr|Dr|CR|DR|\bCredit\b|\bDebit\b)", seg)
+            amt_m = AXIS["tx_amount_suffixed"].search(seg)
         if not amt_m:
             # if still no amount, skip this row
             continue
         amt_raw = amt_m.group(1)
-        amount = _axis_clean_amount(amt_raw)
 
         # Type: check near amount or in segment text
-        type_m = re.search(r"\b(Cr|Dr|Credit|Debit|credited|debited)\b", seg, re.IGNORECASE)
+        type_m = AXIS["tx_type"].search(seg)
         tx_type = ""
         if type_m:
             token = type_m.group(1).lower()
@@ -482,29 +471,39 @@ def extract_transactions_axis(text: str) -> List[Dict[str, Any]]:
                 tx_type = "Debit"
         else:
             # heuristic
-            if re.search(r"\b(refund|cashback|credited)\b", seg, re.IGNORECASE):
+            if AXIS["tx_credit_hint"].search(seg):
                 tx_type = "Credit"
-            elif re.search(r"\b(purchase|spent|debited|paid|withdrawal)\b", seg, re.IGNORECASE):
+            elif AXIS["tx_debit_hint"].search(seg):
                 tx_type = "Debit"
 
         # Description: everything up to the amount match
         desc = seg[:amt_m.start()].strip()
-        desc = re.sub(r"\s+", " ", desc)
+        desc = COMMON["whitespace"].sub(" ", desc)
 
         # Normalize the date token to ISO using local normalizer
         date_iso = normalize_date_axis(date_token)
 
-        txs.append({
-            "date": date_iso or "",
-            "description": desc,
-            "amount": amount,
-            "type": tx_type
-        })
+        dates.append(date_iso or "")
+        descs.append(desc)
+        amounts.append(amt_raw)
+        types.append(tx_type)
 
+    txs = transaction_sink(columnar, "₹")
+    txs.add_rows(dates, descs, amounts, types)
     return txs
 
 
-def parse_axis(text: str) -> Dict[str, Any]:
+AXIS_SUMMARY = FieldScanner({
+    "total_balance": [AXIS["total_balance"]],
+    "minimum_due": [AXIS["minimum_due"]],
+    "statement_month": [AXIS["statement_month"]],
+    "statement_date": [AXIS["statement_date"]],
+})
+
+
+def parse_axis(text: str, sections: Optional[SectionIndex] = None,
+              timer: Optional[StageTimer] = None, transactions: bool = True,
+              columnar: bool = False) -> Dict[str, Any]:
     fields: Dict[str, Any] = {
         "last4": "",
         "statement_date": "",
@@ -512,49 +511,44 @@ def parse_axis(text: str) -> Dict[str, Any]:
         "billing_cycle_end": "",
         "payment_due_date": "",
         "total_balance": "",
+        "total_balance_paise": None,
         "minimum_due": "",
+        "minimum_due_paise": None,
         "transactions": [],
     }
 
+    sections = sections or SectionIndex(text)
+    timer = timer or StageTimer()
+
     # last4
     fields["last4"] = find_last4(text) or ""
 
     # Use top-of-document slice for summary items
-    top = text[:5000].replace("\r\n", "\n").replace("\r", "\n")
+    top = sections.head.replace("\r\n", "\n").replace("\r", "\n")
 
     # total and minimum
-    m_tot = re.search(r"(?:Total\s+Payment\s+Due|Total\s+Amount\s+Due|Total\s+Due)\s*[:\-]?\s*(?:₹|Rs\.?)?\s*([0-9,]+(?:\.\d{1,2})?)", top, re.IGNORECASE)
+    hits = AXIS_SUMMARY.scan(top)
+    m_tot = hits.get("total_balance")
     if m_tot:
-        fields["total_balance"] = _axis_clean_amount(m_tot.group(1))
+        fields["total_balance"], fields["total_balance_paise"] = money(m_tot.group(1))
 
-    m_min = re.search(r"(?:Minimum\s+Payment\s+Due|Minimum\s+Amount\s+Due|Minimum\s+Due)\s*[:\-]?\s*(?:₹|Rs\.?)?\s*([0-9,]+(?:\.\d{1,2})?)", top, re.IGNORECASE)
+    m_min = hits.get("minimum_due")
     if m_min:
-        fields["minimum_due"] = _axis_clean_amount(m_min.group(1))
+        fields["minimum_due"], fields["minimum_due_paise"] = money(m_min.group(1))
 
         # ---------- PAYMENT DUE DATE (improved) ----------
     fields["payment_due_date"] = ""
 
     # date pattern that matches many formats we'll normalize later
-    date_token_re = r"(\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}[\/\-.]\d{1,2}[\/\-.]\d{2,4}|\d{4}-\d{2}-\d{2}|[A-Za-z]{3,9}\s+\d{1,2},?\s*'?\d{2,4}|\b[A-Za-z]{3,9}\s+\d{4}\b)"
-
-    # Candidate labels in order of preference (more specific first)
-    pd_labels = [
-        r"Payment\s+Due\s+Date",
-        r"Payment\s+Due\s+On",
-        r"Payment\s+Due",
-        r"Pay\s+by",
-        r"Due\s+Date",
-        r"Last\s+Date\s+for\s+Payment",
-        r"Payment\s+Due\s+Amount",  # sometimes appears but we will extract date near it
-    ]
+    date_token_re = AXIS["date_token"]
 
     found = False
     # Search in the top-of-document first (prefer top 5k chars)
     search_area = top  # already defined earlier as top slice
 
-    for label in pd_labels:
+    # Candidate labels in order of preference (more specific first)
+    for pat_same, pat_nextline, pat_label in AXIS["payment_due_labels"]:
         # 1) Label + date on same line
-        pat_same = re.compile(rf"{label}\s*[:\-]?\s*{date_token_re}", re.IGNORECASE)
         m_same = pat_same.search(search_area)
         if m_same:
             date_str = m_same.group(1)
@@ -563,7 +557,6 @@ def parse_axis(text: str) -> Dict[str, Any]:
             break
 
         # 2) Label alone on one line, date on the next line
-        pat_nextline = re.compile(rf"{label}\s*[:\-]?\s*[\r\n]+\s*{date_token_re}", re.IGNORECASE)
         m_next = pat_nextline.search(search_area)
         if m_next:
             date_str = m_next.group(1)
@@ -572,11 +565,11 @@ def parse_axis(text: str) -> Dict[str, Any]:
             break
 
         # 3) Label present but date not adjacent — find label position and search small window after it
-        m_label = re.search(rf"{label}", search_area, re.IGNORECASE)
+        m_label = pat_label.search(search_area)
         if m_label:
             # look 200 chars after label for a date token
             after = search_area[m_label.end(): m_label.end() + 300]
-            m_after = re.search(date_token_re, after, re.IGNORECASE)
+            m_after = date_token_re.search(after)
             if m_after:
                 date_str = m_after.group(1)
                 fields["payment_due_date"] = normalize_date_axis(date_str)
@@ -586,16 +579,8 @@ def parse_axis(text: str) -> Dict[str, Any]:
     # If still not found in top summary, scan the entire document for obvious standalone phrases
     if not found:
         # common standalone patterns where a date follows label or appears near "Due"
-        global_patterns = [
-            rf"(?:Payment\s+Due\s+Date|Payment\s+Due|Due\s+Date)\s*[:\-]?\s*{date_token_re}",
-            rf"(?:Pay\s+by|Last\s+Date\s+for\s+Payment)\s*[:\-]?\s*{date_token_re}",
-            # sometimes the statement shows "Due Date" as a separate line like:
-            # Due Date
-            # 30 Oct 2025
-            rf"(?:Due\s+Date)\s*[\r\n]+\s*{date_token_re}",
-        ]
-        for gp in global_patterns:
-            mg = re.search(gp, text, re.IGNORECASE)
+        for gp in AXIS["payment_due_global"]:
+            mg = gp.search(text)
             if mg:
                 date_str = mg.group(1)
                 fields["payment_due_date"] = normalize_date_axis(date_str)
@@ -605,14 +590,14 @@ def parse_axis(text: str) -> Dict[str, Any]:
     # Final fallback: look for any date token in the top 1k characters that looks like a due-date candidate
     if not found:
         top_small = search_area[:1200]
-        candidate_dates = re.findall(date_token_re, top_small, re.IGNORECASE)
+        candidate_dates = date_token_re.findall(top_small)
         # filter candidate dates to reasonable years (>=2023 and <=2026) when possible
         for cand in candidate_dates:
             norm = normalize_date_axis(cand)
             # accept ISO-like results YYYY-MM-DD or month-only YYYY-MM-01
-            if re.match(r"\d{4}-\d{2}-\d{2}", norm) or re.match(r"\d{4}-\d{2}-01", norm):
+            if COMMON["iso_date_prefix"].match(norm) or COMMON["iso_month_start_prefix"].match(norm):
                 # sanity: accept years 2023-2026 as plausible due dates
-                year_match = re.match(r"^(\d{4})-", norm)
+                year_match = COMMON["iso_year"].match(norm)
                 if year_match and 2023 <= int(year_match.group(1)) <= 2026:
                     fields["payment_due_date"] = norm
                     found = True
@@ -622,16 +607,16 @@ def parse_axis(text: str) -> Dict[str, Any]:
 
 
     # statement_date: Selected Statement Month OR Statement Date label
-    m_sel = re.search(r"Selected\s+Statement\s+Month\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{4})", top, re.IGNORECASE)
+    m_sel = hits.get("statement_month")
     if m_sel:
         fields["statement_date"] = normalize_date_axis(m_sel.group(1))
     else:
-        m_sd = re.search(r"Statement\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2}\s*'?\d{2,4})", top, re.IGNORECASE)
+        m_sd = hits.get("statement_date")
         if m_sd:
             fields["statement_date"] = normalize_date_axis(m_sd.group(1))
 
     # billing cycle: Statement period or From ... To ...
-    m_cycle = re.search(r"(?:Statement\s*period|Statement\s*Period|Billing\s*Cycle)\s*[:\-]?\s*([A-Za-z0-9\/\-\s,'']+?)\s*(?:to|-)\s*([A-Za-z0-9\/\-\s,'']+?)\b", text, re.IGNORECASE)
+    m_cycle = AXIS["billing_cycle"].search(text)
     if m_cycle:
         start_raw = m_cycle.group(1).strip()
         end_raw = m_cycle.group(2).strip()
@@ -639,22 +624,25 @@ def parse_axis(text: str) -> Dict[str, Any]:
         fields["billing_cycle_end"] = normalize_date_axis(end_raw)
     else:
         # fallback From ... To ...
-        m_ft = re.search(r"From\s+([A-Za-z0-9\/\-\s,'']+?)\s+To\s+([A-Za-z0-9\/\-\s,'']+?)\b", text, re.IGNORECASE)
+        m_ft = AXIS["billing_from_to"].search(text)
         if m_ft:
             fields["billing_cycle_start"] = normalize_date_axis(m_ft.group(1).strip())
             fields["billing_cycle_end"] = normalize_date_axis(m_ft.group(2).strip())
 
     # transactions
-    txs = extract_transactions_axis(text)
+    txs = []
+    if transactions:
+        with timer.stage("transactions"):
+            txs = extract_transactions_axis(text, sections, columnar)
     fields["transactions"] = txs
 
-    # If billing cycle missing, derive from tx dates (earliest/latest)
-    if (not fields["billing_cycle_start"] or not fields["billing_cycle_end"]) and txs:
-        from datetime import datetime
+    # If billing cycle missing, derive from tx dates (earliest/latest). A summary-only parse reads
+    # the rows for this too, so it gives the same fields -- unless it has only some of the pages.
+    if (not fields["billing_cycle_start"] or not fields["billing_cycle_end"]) and not sections.partial:
         valid_dates = []
-        for t in txs:
+        for t in txs if transactions else extract_transactions_axis(text, sections):
             d = t.get("date") or ""
-            if re.match(r"\d{4}-\d{2}-\d{2}", d):
+            if COMMON["iso_date_prefix"].match(d):
                 try:
                     valid_dates.append(datetime.strptime(d, "%Y-%m-%d"))
                 except Exception:
@@ -677,70 +665,60 @@ def parse_axis(text: str) -> Dict[str, Any]:
 
 # ---------------  HDFC MILENNIA BANK PARSER ----------------------
 
-import re
-from typing import Dict, Any, List
-from .utils import find_last4
-from datetime import datetime
-
-
-# -------------------- DATE NORMALIZER --------------------
-def normalize_date_hdfc(s: str) -> str:
-    """Convert date strings like '14 Oct, 2025' or '15/09/2025' to ISO YYYY-MM-DD."""
-    if not s or not s.strip():
-        return ""
-    s0 = s.strip().replace(",", "").replace("’", "'").replace("‘", "'")
-    for fmt in ("%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%d-%m-%Y"):
-        try:
-            return datetime.strptime(s0, fmt).strftime("%Y-%m-%d")
-        except Exception:
-            continue
-    return s0
 
-
-# -------------------- AMOUNT NORMALIZER --------------------
-def _hdfc_clean_amount(s: str) -> str:
-    s = s.replace(",", "").replace("C", "").replace("`", "").strip()
-    s = re.sub(r"^(Rs\.?|INR|₹)\s*", "", s, flags=re.IGNORECASE)
-    if re.match(r"^\d+(\.\d{1,2})?$", s):
-        if "." not in s:
-            s += ".00"
-        elif len(s.split(".")[1]) == 1:
-            s += "0"
-    return "₹" + s
+# -------------------- TRANSACTION EXTRACTOR --------------------
+HDFC_TX_HEADER = "domestic transactions"
+HDFC_TX_END = ("rewards program points", "total outstanding")
 
 
-# -------------------- TRANSACTION EXTRACTOR --------------------
-def extract_transactions_hdfc(text: str) -> List[Dict[str, Any]]:
-    """Extract HDFC Domestic + International transaction rows."""
-    txs = []
-    block_match = re.search(r"(Domestic Transactions[\s\S]+?)(?:Rewards Program Points|Total Outstanding)", text, re.IGNORECASE)
-    if not block_match:
-        return txs
-    block = block_match.group(1).replace("\r", "\n")
-
-    tx_pattern = re.compile(
-        r"(?P<date>\d{1,2}/\d{1,2}/\d{4})\s*\|?\s*(?:\d{1,2}:\d{2}\s*)?"
-        r"(?P<desc>[A-Za-z0-9\s\.,'&\-\(\)#/]+?)\s+C\s*(?P<amt>[0-9,]+\.\d{2})",
-        re.MULTILINE
-    )
-
-    for m in tx_pattern.finditer(block):
-        date_iso = normalize_date_hdfc(m.group("date"))
-        desc = re.sub(r"^\d+\s+", "", m.group("desc").strip())
-        desc = re.sub(r"\s+", " ", desc).strip()
-        amt = _hdfc_clean_amount(m.group("amt"))
-        tx_type = "Credit" if re.search(r"payment|credit|refund", desc, re.IGNORECASE) else "Debit"
-        txs.append({
-            "date": date_iso,
-            "description": desc,
-            "amount": amt,
-            "type": tx_type
-        })
+def extract_transactions_hdfc(text: str, sections: Optional[SectionIndex] = None, columnar: bool = False):
+    """
+    Extract HDFC Domestic + International transaction rows into transaction_sink(columnar).
+    A row starts on a line that begins with its dd/mm/yyyy date and its description may wrap onto
+    the lines after it, so the block is cut into groups at those lines (the first group is the
+    header's, which pypdf sometimes prints a row on) and each group is read with HDFC["tx_row"].
+    """
+    dates, descs, amounts, types = [], [], [], []
+    # block: "Domestic Transactions" up to the next "Rewards Program Points" / "Total Outstanding"
+    sections = sections or SectionIndex(text)
+    start = sections.find(HDFC_TX_HEADER)
+    if start == -1:
+        return transaction_sink(columnar, "₹")
+    end = sections.earliest(HDFC_TX_END, start + len(HDFC_TX_HEADER) + 1)
+    if end == -1:
+        if not sections.partial:
+            return transaction_sink(columnar, "₹")
+        end = len(text)  # only the pages read so far: the block goes on past them
+    lines = sections.lines_of((start, end))
+    raw = lines.raw
+    cuts = [0] + [line.index for line in lines.records if line.index and _is_dmy_date(line.date)] + [len(raw)]
+
+    tx_pattern = HDFC["tx_row"]
+    for a, b in zip(cuts, cuts[1:]):
+        for m in tx_pattern.finditer(raw[a] if b == a + 1 else "".join(raw[a:b])):
+            desc = HDFC["tx_leading_number"].sub("", m.group("desc").strip())
+            desc = COMMON["whitespace"].sub(" ", desc).strip()
+            dates.append(normalize_date_hdfc(m.group("date")))
+            descs.append(desc)
+            amounts.append(m.group("amt"))
+            types.append("Credit" if HDFC["tx_credit_hint"].search(desc) else "Debit")
+    txs = transaction_sink(columnar, "₹")
+    txs.add_rows(dates, descs, amounts, types)
     return txs
 
 
 # -------------------- MAIN PARSER --------------------
-def parse_hdfc(text: str) -> Dict[str, Any]:
+HDFC_SUMMARY = FieldScanner({
+    "billing_period": [HDFC["billing_period"]],
+    "total_balance": [HDFC["total_balance"]],
+    "minimum_due": [HDFC["minimum_due"]],
+    "payment_due_date": [HDFC["payment_due_date"]],
+})
+
+
+def parse_hdfc(text: str, sections: Optional[SectionIndex] = None,
+              timer: Optional[StageTimer] = None, transactions: bool = True,
+              columnar: bool = False) -> Dict[str, Any]:
     """Parse HDFC Credit Card statement into structured fields."""
     fields: Dict[str, Any] = {
         "last4": "",
@@ -749,22 +727,24 @@ def parse_hdfc(text: str) -> Dict[str, Any]:
         "billing_cycle_end": "",
         "payment_due_date": "",
         "total_balance": "",
+        "total_balance_paise": None,
         "minimum_due": "",
+        "minimum_due_paise": None,
         "transactions": []
     }
 
+    sections = sections or SectionIndex(text)
+    timer = timer or StageTimer()
+
     # ---------- LAST 4 DIGITS ----------
     fields["last4"] = find_last4(text) or ""
 
-    import re
-    flat_text = None  # Will be created only if needed
-
         # ---------- helper date token ----------
-    date_token_re = re.compile(r"([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})", re.IGNORECASE)
+    date_token_re = HDFC["date_token"]
 
     # ---------- STATEMENT DATE (robust, windowed search) ----------
     fields["statement_date"] = ""
-    m_label = re.search(r"Statement\s*Date", text, re.IGNORECASE)
+    m_label = HDFC["statement_date_label"].search(text)
     def _find_date_near(text_src: str, start_pos: int, window: int = 150) -> str:
         """Search for first date token within `window` chars after start_pos in text_src."""
         if start_pos >= len(text_src):
@@ -781,62 +761,43 @@ def parse_hdfc(text: str) -> Dict[str, Any]:
 
     # fallback: if not found, try on flattened text
     if not fields["statement_date"]:
-        flat_text = " ".join(text.split())
-        m_label_flat = re.search(r"Statement\s*Date", flat_text, re.IGNORECASE)
+        flat_text = sections.flat()
+        m_label_flat = HDFC["statement_date_label"].search(flat_text)
         if m_label_flat:
             cand = _find_date_near(flat_text, m_label_flat.end(), window=200)
             if cand:
                 fields["statement_date"] = normalize_date_hdfc(cand)
-        # This check ensures we don't accidentally grab a date from the billing period
-        # by also searching for the billing period and seeing which comes first.
-        # This is a more robust, but complex, check. For this specific case,
-        # the regex above is likely sufficient.
-        fields["statement_date"] = normalize_date_hdfc(m_stmt.group(1))
 
     # ---------- BILLING PERIOD ----------
-    m_period = re.search(
-        r"Billing\s*Period\s*(?:[:\-]?\s*)[\n\r\t ]*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})\s*[-–to]+\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})",
-        text,
-        re.IGNORECASE
-    )
+    hits = HDFC_SUMMARY.scan(text, before=sections.summary_end)
+    m_period = hits.get("billing_period")
     if not m_period:
         # Fallback for flattened text (handles columnar OCR)
-        if flat_text is None:
-            flat_text = " ".join(text.split())
-
-        ### PROBLEM: Original regex expected date range immediately after label.
-        ### SOLUTION: Add '.*?\s*' to non-greedily skip intervening text 
-        ### (like the "Statement Date" value) before matching the date range.
-        m_period = re.search(
-            r"Billing\s*Period\s*.*?\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})\s*[-–to]+\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})", # <-- MODIFIED
-            flat_text,
-            re.IGNORECASE
-        )
+        m_period = HDFC["billing_period_flat"].search(sections.flat())
 
     if m_period:
         fields["billing_cycle_start"] = normalize_date_hdfc(m_period.group(1))
         fields["billing_cycle_end"] = normalize_date_hdfc(m_period.group(2))
 
     # ---------- TOTAL BALANCE ----------
-    m_total = re.search(r"TOTAL\s+AMOUNT\s+DUE\s*(?:\n|:)\s*C?\s*([0-9,]+\.\d{2})", text, re.IGNORECASE)
+    m_total = hits.get("total_balance")
     if m_total:
-        fields["total_balance"] = _hdfc_clean_amount(m_total.group(1))
+        fields["total_balance"], fields["total_balance_paise"] = money(m_total.group(1))
 
     # ---------- MINIMUM DUE ----------
-    m_min = re.search(r"MINIMUM\s+DUE\s*(?:\n|:)\s*C?\s*([0-9,]+\.\d{2})", text, re.IGNORECASE)
+    m_min = hits.get("minimum_due")
     if m_min:
-        fields["minimum_due"] = _hdfc_clean_amount(m_min.group(1))
+        fields["minimum_due"], fields["minimum_due_paise"] = money(m_min.group(1))
 
     # ---------- PAYMENT DUE DATE ----------
-    m_due = re.search(
-        r"(?:DUE\s+DATE|Payment\s+Due\s+Date)\s*(?:\n|:)?\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})",
-        text, re.IGNORECASE
-    )
+    m_due = hits.get("payment_due_date")
     if m_due:
         fields["payment_due_date"] = normalize_date_hdfc(m_due.group(1))
 
     # ---------- TRANSACTIONS ----------
-    fields["transactions"] = extract_transactions_hdfc(text)
+    if transactions:
+        with timer.stage("transactions"):
+            fields["transactions"] = extract_transactions_hdfc(text, sections, columnar)
 
     # ---------- Fallback for Statement/Billing dates ----------
     if not fields["statement_date"] and fields["billing_cycle_end"]:
@@ -850,7 +811,17 @@ def parse_hdfc(text: str) -> Dict[str, Any]:
 
 
 # ---------------------- SBI BANK PARSER ----------------------
-def parse_sbi(text: str) -> Dict[str, Any]:
+SBI_SUMMARY = FieldScanner({
+    "last4": [SBI["last4"]],
+    "billing_cycle": [SBI["billing_cycle"]],
+    "total_balance": [SBI["total_balance"]],
+    "minimum_due": [SBI["minimum_due"]],
+})
+
+
+def parse_sbi(text: str, sections: Optional[SectionIndex] = None,
+             timer: Optional[StageTimer] = None, transactions: bool = True,
+             columnar: bool = False) -> Dict[str, Any]:
     fields = {
         "last4": "",
         "statement_date": "",
@@ -858,95 +829,82 @@ def parse_sbi(text: str) -> Dict[str, Any]:
         "billing_cycle_end": "",
         "payment_due_date": "",
         "total_balance": "",
+        "total_balance_paise": None,
         "minimum_due": "",
+        "minimum_due_paise": None,
         "transactions": [],
     }
 
+    sections = sections or SectionIndex(text)
+    timer = timer or StageTimer()
+
     # ---- Credit Card Number ----
     # Handles: "Credit Card Number XXXX XXXX XXXX XX46"
     # Works even if there are line breaks between label and digits
-    m = re.search(
-        r"Credit\s*Card\s*Number[\s:\n\r]*X{2,}\s*X{2,}\s*X{2,}\s*X{2,}\s*X{0,2}(\d{2,4})",
-        text,
-        re.IGNORECASE,
-    )
+    hits = SBI_SUMMARY.scan(text, before=sections.summary_end)
+    m = hits.get("last4")
     if m:
         fields["last4"] = m.group(1).zfill(4)
 
 
     # ---- Billing Cycle ----
-    m = re.search(r"for\s+Statement\s+Period\s*:\s*([0-9]{1,2}\s*[A-Za-z]{3,}\s*[0-9]{2,4})\s*to\s*([0-9]{1,2}\s*[A-Za-z]{3,}\s*[0-9]{2,4})", text, re.IGNORECASE)
+    m = hits.get("billing_cycle")
     if m:
         fields["billing_cycle_start"] = normalize_date(m.group(1))
         fields["billing_cycle_end"] = normalize_date(m.group(2))
 
 # ---- Statement Date (robust) ----
-    label_stmt = r"Statement\s*Date"
+    label_stmt = SBI["statement_date_label"]
     date_raw = find_date_near_label(text, label_stmt, window_after=200, window_before=40)
     if date_raw:
      fields["statement_date"] = normalize_date(date_raw)
 
 # ---- Payment Due Date (robust) ----
-    label_due = r"Payment\s*Due\s*Date"
+    label_due = SBI["payment_due_date_label"]
     date_raw = find_date_near_label(text, label_due, window_after=200, window_before=40)
     if date_raw:
      fields["payment_due_date"] = normalize_date(date_raw)
 
 
     # ---- Total Amount Due ----
-    m = re.search(r"Total\s*Amount\s*Due.*?([0-9,]+\.\d{2})", text, re.IGNORECASE | re.DOTALL)
+    m = hits.get("total_balance")
     if m:
-        fields["total_balance"] = "₹" + m.group(1).replace(",", "")
+        fields["total_balance"], fields["total_balance_paise"] = money(m.group(1))
 
     # ---- Minimum Amount Due ----
-    m = re.search(r"Minimum\s*Amount\s*Due.*?([0-9,]+\.\d{2})", text, re.IGNORECASE | re.DOTALL)
+    m = hits.get("minimum_due")
     if m:
-        fields["minimum_due"] = "₹" + m.group(1).replace(",", "")
+        fields["minimum_due"], fields["minimum_due_paise"] = money(m.group(1))
 
     # ---- Transactions ----
-    fields["transactions"] = extract_sbi_transactions(text)
+    if transactions:
+        with timer.stage("transactions"):
+            fields["transactions"] = extract_sbi_transactions(text, sections, columnar)
 
     return fields
 
 
-def extract_sbi_transactions(text: str):
+def extract_sbi_transactions(text: str, sections: Optional[SectionIndex] = None, columnar: bool = False):
     """
     Extract SBI transactions — lines typically after 'TRANSACTIONS FOR'
     Example: "30 Sep 25 TPS*PHONEPE WALLET MUMBAI MAH 5,150.00 D"
     """
-    txs = []
-    start_idx = text.find("TRANSACTIONS FOR")
-    if start_idx != -1:
-        lines = text[start_idx:].splitlines()
-    else:
-        lines = text.splitlines()
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # ✅ Corrected pattern
-        # - captures full description (not just one char)
-        # - supports commas in amount
-        # - handles optional C/D/M at end
-        m = re.match(
-            r"(\d{1,2}\s*[A-Za-z]{3}\s*\d{2,4})\s+(.+?)\s+([0-9,]+\.\d{2})\s*[CDM]?$",
-            line,
-        )
-
-        if m:
-            date_str = normalize_date(m.group(1))
-            desc = re.sub(r"\s+", " ", m.group(2).strip())
-            amt = m.group(3).replace(",", "")
-            txs.append(
-                {
-                    "date": date_str,
-                    "description": desc,
-                    "amount": amt,
-                }
-            )
-
+    dates, descs, amounts, types = [], [], [], []
+    whitespace = COMMON["whitespace"]
+    sections = sections or SectionIndex(text)
+
+    for line in sections.section_lines("transactions").records:
+        # "30 Sep 25", a description and an amount with an optional C/D/M (tokens as SBI["tx_row"] reads them)
+        body = line.body
+        if line.amount and line.flag in _SBI_FLAGS and len(body) > 2 and body[0].isspace() and _is_dmon_date(line.date):
+            credit = line.flag == "C"  # trailing C = credit, D = debit
+            dates.append(normalize_date(line.date))
+            descs.append(whitespace.sub(" ", body.strip()))
+            amounts.append(line.amount)
+            types.append("Credit" if credit else "Debit")
+
+    txs = transaction_sink(columnar)
+    txs.add_rows(dates, descs, amounts, types)
     return txs
 
 
@@ -956,21 +914,57 @@ def extract_sbi_transactions(text: str):
 
 
 
-def extract_transactions(text: str):
+def extract_transactions(text: str, sections: Optional[SectionIndex] = None, columnar: bool = False):
     """
-    Extract transaction rows (date + description + amount)
+    Extract transaction rows (date + description + amount): "01/09/2025 AMAZON 1,234.50 [Cr]"
     """
-    txs = []
-    for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-
-        m = re.match(r"(\d{1,2}/\d{1,2}/\d{4})\s+(.*?)\s+([0-9,]+\.\d{2})(?:\s*Cr)?$", line)
-        if m:
-            txs.append({
-                "date": normalize_date(m.group(1)),
-                "description": re.sub(r"\s+", " ", m.group(2)),
-                "amount": m.group(3).replace(",", "")
-            })
+    dates, descs, amounts, types = [], [], [], []
+    whitespace = COMMON["whitespace"]
+    for line in (sections or SectionIndex(text)).section_lines("transactions").records:
+        # dd/mm/yyyy, whitespace, a description (maybe empty) and whitespace, the amount, "Cr" or nothing
+        body = line.body
+        if line.amount and line.flag in _GENERIC_FLAGS and len(body) > 1 and body[0].isspace() and _is_dmy_date(line.date):
+            dates.append(normalize_date(line.date))
+            descs.append(whitespace.sub(" ", body.strip()))
+            amounts.append(line.amount)
+            types.append("Credit" if line.flag else "Debit")  # trailing "Cr"
+    txs = transaction_sink(columnar)
+    txs.add_rows(dates, descs, amounts, types)
     return txs
+
+
+PARSERS = {
+    "ICICI": parse_icici,
+    "KOTAK": parse_kotak,
+    "AXIS": parse_axis,
+    "HDFC": parse_hdfc,
+    "SBI": parse_sbi,
+}
+
+
+def transaction_block(bank: str, sections: SectionIndex) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) of the text `bank`'s extractor reads its rows from, or None if the block's header
+    isn't in the text. On partial text a block whose end header hasn't been read yet runs to the end.
+    """
+    n = len(sections.text)
+    if bank == "AXIS":
+        start = sections.first_of(AXIS_TX_HEADERS)
+        return (start, n) if start != -1 else None
+    if bank == "HDFC":
+        start = sections.find(HDFC_TX_HEADER)
+        if start == -1:
+            return None
+        end = sections.earliest(HDFC_TX_END, start + len(HDFC_TX_HEADER) + 1)
+        return (start, end) if end != -1 else (start, n)
+    return sections.span("transactions")
+
+
+# each bank's transaction extractor and the pattern a row's first line matches (see rowstream.py)
+TX_STREAMS = {
+    "ICICI": (extract_transactions, GENERIC["tx_row"]),
+    "KOTAK": (extract_transactions, GENERIC["tx_row"]),
+    "AXIS": (extract_transactions_axis, AXIS["tx_date_line"]),
+    "HDFC": (extract_transactions_hdfc, HDFC["tx_row"]),
+    "SBI": (extract_sbi_transactions, SBI["tx_row"]),
+}
@@ -0,0 +1,183 @@
+# backend/app/parser/cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+from . import PARSER_VERSION
+
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "512"))  # in-memory entries, 0 disables
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "86400"))  # seconds
+RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", "")  # SQLite file for the on-disk tier, "" disables
+RESULT_CACHE_DISK_MAX = int(os.getenv("RESULT_CACHE_DISK_MAX", "100000"))  # on-disk entries
+
+# Extracted/OCR'd page text, independent of PARSER_VERSION so regex changes can re-parse
+# without re-running pypdf and Tesseract.
+TEXT_CACHE_SIZE = int(os.getenv("TEXT_CACHE_SIZE", "64"))  # in-memory entries, 0 disables
+TEXT_CACHE_TTL = float(os.getenv("TEXT_CACHE_TTL", str(7 * 86400)))
+TEXT_CACHE_PATH = os.getenv("TEXT_CACHE_PATH", "")
+TEXT_CACHE_DISK_MAX = int(os.getenv("TEXT_CACHE_DISK_MAX", "1000000"))
+
+
+DIGEST_CHUNK_BYTES = 1024 * 1024
+
+
+def document_digest(pdf: Union[bytes, str]) -> str:
+    """sha256 of a document, given its bytes or the path of a file holding them."""
+    if isinstance(pdf, (bytes, bytearray)):
+        return hashlib.sha256(pdf).hexdigest()
+    h = hashlib.sha256()
+    with open(pdf, "rb") as f:
+        for chunk in iter(lambda: f.read(DIGEST_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def content_key(pdf: Union[bytes, str], version: str = PARSER_VERSION, digest: Optional[str] = None,
+                mode: str = "full") -> str:
+    """Cache key for a document: sha256 of its bytes plus the parser version (and mode, unless full)."""
+    key = f"{digest or document_digest(pdf)}:{version}"
+    return key if mode == "full" else f"{key}:{mode}"
+
+
+class ResultCache:
+    """
+    Two-tier cache of JSON-serialisable values: an in-memory LRU in front of an optional SQLite file.
+    Entries expire after `ttl` seconds. Values handed out are shared; callers must not mutate them.
+    The SQLite connection is opened on first use in each process: forked pool workers must not use
+    one inherited from the parent.
+    """
+
+    def __init__(self, max_items: int = RESULT_CACHE_SIZE, ttl: float = RESULT_CACHE_TTL,
+                 path: str = RESULT_CACHE_PATH, max_disk_items: int = RESULT_CACHE_DISK_MAX,
+                 table: str = "results"):
+        self.max_items = max_items
+        self.ttl = ttl
+        self.max_disk_items = max_disk_items
+        self.table = table
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._mem: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_pid = 0
+        _caches.add(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_items > 0 or bool(self.path)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """This process's connection to the SQLite tier (None if there is none). Call with the lock held."""
+        if not self.path:
+            return None
+        if self._db is None or self._db_pid != os.getpid():
+            # a connection inherited across fork is abandoned, not closed: it belongs to the parent
+            db = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                f"(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            db.commit()
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    def _after_fork(self) -> None:
+        # the parent may have held the lock while forking; the child starts with a fresh one
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > now:
+                    self._mem.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._mem[key]
+
+            db = self._connection()
+            if db is not None:
+                row = db.execute(
+                    f"SELECT value, expires FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        expires = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, expires, value)
+            db = self._connection()
+            if db is not None:
+                db.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, expires) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), expires),
+                )
+                self._puts += 1
+                if self._puts % 100 == 0:
+                    # prune periodically rather than on every write
+                    db.execute(f"DELETE FROM {self.table} WHERE expires <= ?", (time.time(),))
+                    db.execute(
+                        f"DELETE FROM {self.table} WHERE key IN "
+                        f"(SELECT key FROM {self.table} ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+                        (self.max_disk_items,),
+                    )
+                db.commit()
+
+    def _remember(self, key: str, expires: float, value: Any) -> None:
+        if self.max_items <= 0:
+            return
+        self._mem[key] = (expires, value)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_items:
+            self._mem.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "size": len(self._mem),
+        }
+
+
+_caches: "weakref.WeakSet[ResultCache]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    for cache in list(_caches):
+        cache._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+result_cache = ResultCache()
+text_cache = ResultCache(max_items=TEXT_CACHE_SIZE, ttl=TEXT_CACHE_TTL, path=TEXT_CACHE_PATH,
+                         max_disk_items=TEXT_CACHE_DISK_MAX, table="texts")
+
+
+def cache_parse_result(key: str, result: Dict[str, Any]) -> None:
+    """Store a parse result unless the bank was not recognised (e.g. OCR was unavailable)."""
+    if result.get("bank", "UNKNOWN") != "UNKNOWN":
+        result_cache.put(key, result)
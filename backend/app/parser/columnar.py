@@ -0,0 +1,258 @@
+# backend/app/parser/columnar.py
+"""
+Columnar transaction storage.
+
+The extractors return a list of small dicts per statement, which is fine for one upload but costs
+~1 KB per row once archives of tens of thousands of rows are held in memory or serialised.
+TransactionColumns keeps the same rows as parallel typed arrays:
+
+    dates     array('i')  days since 1970-01-01 (Arrow's date32), NO_DATE when the row has no ISO date
+    paise     array('q')  int64 paise, negative for credits, NO_AMOUNT when unparseable
+    types     array('b')  0 = "", 1 = "Credit", 2 = "Debit"
+    descriptions          interned strings (merchant names repeat a lot)
+
+Rows are read through __slots__ views, numeric columns are exported without copying through
+buffers() / to_numpy(), and to_dicts() gives back exactly the dict-list the parsers return.
+
+Extractors write through a sink from transaction_sink(): a TransactionList of row dicts by default,
+or, with columnar=True, a TransactionColumns filled so no dicts are built at all. They hand over a
+statement's rows at once with add_rows(), whose raw amount tokens go through parse_amounts() in
+one batch; the columns then keep just the paise, with no display strings formatted.
+"""
+import sys
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .amounts import format_paise, parse_amounts
+
+NO_AMOUNT = -(2 ** 63)
+NO_DATE = -(2 ** 31)
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+TYPE_NAMES = ("", "Credit", "Debit")
+_TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+
+class TransactionRow:
+    """Read-only view of one row; holds no data of its own."""
+    __slots__ = ("_cols", "_i")
+
+    def __init__(self, cols: "TransactionColumns", i: int):
+        self._cols = cols
+        self._i = i
+
+    @property
+    def date(self) -> Optional[str]:
+        return self._cols.date_at(self._i)
+
+    @property
+    def description(self) -> str:
+        return self._cols.descriptions[self._i]
+
+    @property
+    def amount(self) -> str:
+        return self._cols.amount_at(self._i)
+
+    @property
+    def amount_paise(self) -> Optional[int]:
+        paise = self._cols.paise[self._i]
+        return None if paise == NO_AMOUNT else paise
+
+    @property
+    def type(self) -> str:
+        return TYPE_NAMES[self._cols.types[self._i]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._cols.row_dict(self._i)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access, so code written against row dicts also reads views."""
+        return self.to_dict().get(key, default)
+
+    def __repr__(self) -> str:
+        return f"TransactionRow({self.to_dict()!r})"
+
+
+class TransactionColumns:
+    """
+    Parallel-array form of a parser's transaction list. Build with from_dicts() or add().
+    Values that don't fit the typed columns (a non-ISO date string, an amount string that isn't
+    the canonical rendering of its paise) are kept in small per-row override maps so to_dicts()
+    round-trips exactly.
+    """
+
+    def __init__(self, amount_symbol: str = "", has_type: bool = False):
+        self.dates = array("i")
+        self.paise = array("q")
+        self.types = array("b")
+        self.descriptions: List[str] = []
+        self.amount_symbol = amount_symbol  # "₹" when the bank's amount strings carry it
+        self.has_type = has_type            # whether the rows carry a "type" key
+        self._date_text: Dict[int, Optional[str]] = {}
+        self._amount_text: Dict[int, Any] = {}
+        self._type_text: Dict[int, Any] = {}
+
+    # ---------------------- building ----------------------
+    def add(self, date_text: Optional[str], description: str, amount: Any,
+            tx_type: Optional[str] = None, amount_paise: Optional[int] = None) -> None:
+        if amount_paise is None or format_paise(abs(amount_paise), self.amount_symbol) != amount:
+            self._amount_text[len(self.dates)] = amount
+        self._append(date_text, description, tx_type, NO_AMOUNT if amount_paise is None else amount_paise)
+
+    def add_rows(self, dates: List[Optional[str]], descriptions: List[str], amounts: List[str],
+                 types: List[str]) -> None:
+        """Rows given as columns; `amounts` are raw amount tokens, converted as in TransactionList.add_rows."""
+        for date_text, description, tx_type, paise in zip(dates, descriptions, types, parse_amounts(amounts)):
+            if paise is None:
+                self._amount_text[len(self.dates)] = ""
+                paise = NO_AMOUNT
+            else:
+                if paise < 0:
+                    self._amount_text[len(self.dates)] = format_paise(paise, self.amount_symbol)
+                if tx_type == "Credit":
+                    paise = -abs(paise)
+            self._append(date_text, description, tx_type, paise)
+
+    def _append(self, date_text: Optional[str], description: str, tx_type: Optional[str], paise: int) -> None:
+        i = len(self.dates)
+        days = NO_DATE
+        if date_text and len(date_text) == 10:
+            try:
+                days = date.fromisoformat(date_text).toordinal() - EPOCH_ORDINAL
+            except ValueError:
+                days = NO_DATE
+        if days == NO_DATE:
+            self._date_text[i] = date_text
+        self.dates.append(days)
+        self.paise.append(paise)
+        self.descriptions.append(sys.intern(description))
+        code = _TYPE_CODES.get(tx_type or "")
+        if code is None:
+            self._type_text[i] = tx_type
+            code = 0
+        self.types.append(code)
+
+    @classmethod
+    def from_dicts(cls, txs: List[Dict[str, Any]]) -> "TransactionColumns":
+        """Convert a parser's transaction list; amount_paise is computed if the rows lack it."""
+        amounts = [tx.get("amount") for tx in txs]
+        symbol = "₹" if any(isinstance(a, str) and a.startswith("₹") for a in amounts) else ""
+        cols = cls(amount_symbol=symbol, has_type=any("type" in tx for tx in txs))
+        paise = parse_amounts(amounts) if txs and "amount_paise" not in txs[0] else [tx.get("amount_paise") for tx in txs]
+        for tx, p in zip(txs, paise):
+            cols.add(tx.get("date"), tx.get("description", ""), tx.get("amount"), tx.get("type"), p)
+        return cols
+
+    # ---------------------- reading ----------------------
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, i: int) -> TransactionRow:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return TransactionRow(self, i)
+
+    def __iter__(self) -> Iterator[TransactionRow]:
+        for i in range(len(self)):
+            yield TransactionRow(self, i)
+
+    def date_at(self, i: int) -> Optional[str]:
+        days = self.dates[i]
+        if days != NO_DATE:
+            return date.fromordinal(EPOCH_ORDINAL + days).isoformat()
+        return self._date_text.get(i)
+
+    def amount_at(self, i: int) -> Any:
+        if i in self._amount_text:
+            return self._amount_text[i]
+        return format_paise(abs(self.paise[i]), self.amount_symbol)  # credits are stored negative
+
+    def row_dict(self, i: int) -> Dict[str, Any]:
+        paise = self.paise[i]
+        row = {"date": self.date_at(i), "description": self.descriptions[i], "amount": self.amount_at(i)}
+        if self.has_type:
+            row["type"] = self._type_text.get(i, TYPE_NAMES[self.types[i]])
+        row["amount_paise"] = None if paise == NO_AMOUNT else paise
+        return row
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """The same list of row dicts the extractors return (what the JSON API sends)."""
+        return [self.row_dict(i) for i in range(len(self))]
+
+    def total_paise(self, rows: Optional[Iterable[int]] = None) -> int:
+        """Sum of parseable amounts (all rows, or the given row indices)."""
+        paise = self.paise
+        idx = range(len(paise)) if rows is None else rows
+        return sum(paise[i] for i in idx if paise[i] != NO_AMOUNT)
+
+    # ---------------------- export ----------------------
+    def buffers(self) -> Dict[str, memoryview]:
+        """Zero-copy views of the numeric columns (format codes 'i', 'q', 'b')."""
+        return {"dates": memoryview(self.dates), "paise": memoryview(self.paise), "types": memoryview(self.types)}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """NumPy arrays sharing memory with the columns (numpy is optional). Descriptions stay a list."""
+        import numpy as np
+
+        out: Dict[str, Any] = {name: np.frombuffer(buf, dtype=buf.format) for name, buf in self.buffers().items()}
+        out["descriptions"] = self.descriptions
+        return out
+
+    def to_arrow(self):
+        """
+        A pyarrow Table over the columns (pyarrow is optional): date is a date32 (null without an
+        ISO date), amount_paise an int64 (null when unparseable), type the int8 codes of TYPE_NAMES.
+        Types wrap the existing buffer; dates and paise are copied once to attach their null masks.
+        """
+        import pyarrow as pa
+
+        n = len(self)
+        return pa.table({
+            "date": pa.array(self.dates, type=pa.int32(), mask=[d == NO_DATE for d in self.dates]).cast(pa.date32()),
+            "amount_paise": pa.array(self.paise, type=pa.int64(), mask=[p == NO_AMOUNT for p in self.paise]),
+            "type": pa.Array.from_buffers(pa.int8(), n, [None, pa.py_buffer(self.types)]),
+            "description": pa.array(self.descriptions, type=pa.string()),
+        })
+
+
+class TransactionList(list):
+    """The default transaction sink: the plain list of row dicts the JSON API sends."""
+
+    def __init__(self, amount_symbol: str = ""):
+        super().__init__()
+        self.amount_symbol = amount_symbol
+
+    def add_rows(self, dates: List[Optional[str]], descriptions: List[str], amounts: List[str],
+                 types: List[str]) -> None:
+        """
+        Rows given as columns, `amounts` being the raw amount tokens the extractor captured. Those
+        are converted in one parse_amounts() batch, each shown as amount_symbol + rupees (money()'s
+        display string) with its paise negative on a "Credit" row; a token that isn't an amount
+        gives ("", None).
+        """
+        symbol = self.amount_symbol
+        for date_text, description, tx_type, paise in zip(dates, descriptions, types, parse_amounts(amounts)):
+            amount = ""
+            if paise is not None:
+                amount = format_paise(paise, symbol)
+                if tx_type == "Credit":
+                    paise = -abs(paise)
+            self.append({"date": date_text, "description": description, "amount": amount,
+                         "type": tx_type, "amount_paise": paise})
+
+    def add(self, date_text: Optional[str], description: str, amount: Any,
+            tx_type: Optional[str] = None, amount_paise: Optional[int] = None) -> None:
+        self.append({"date": date_text, "description": description, "amount": amount,
+                     "type": tx_type, "amount_paise": amount_paise})
+
+
+def transaction_sink(columnar: bool = False, amount_symbol: str = ""):
+    """
+    Where an extractor puts its rows: a TransactionList, or with columnar=True a TransactionColumns
+    (`amount_symbol` is the prefix of the extractor's amount strings, e.g. "₹").
+    """
+    if columnar:
+        return TransactionColumns(amount_symbol=amount_symbol, has_type=True)
+    return TransactionList(amount_symbol)
@@ -0,0 +1,212 @@
+# backend/app/parser/dates.py
+"""
+Shared date engine for the parsers.
+
+Statements repeat the same few dozen dates across hundreds of rows, and the old normalizers
+either ran dateutil's fuzzy parser or looped over datetime.strptime formats, raising and
+swallowing an exception per miss. Here each set of strptime formats is compiled once into a
+single regex that recognises the token shape and dispatches straight to date construction,
+and the public normalizers are memoised in a bounded LRU.
+
+Outputs are identical to the old code paths: the format regexes mirror what _strptime builds
+for %d/%m/%Y/%y/%b/%B, and normalize_date() only takes its fast path for shapes where
+dateutil's answer is unambiguous, handing everything else to dateutil as before.
+"""
+import calendar
+import os
+import re
+from datetime import date
+from functools import lru_cache
+from typing import List, Match, Optional, Pattern, Tuple
+
+from dateutil import parser as dateparser
+
+from .patterns import COMMON
+
+DATE_CACHE_SIZE = int(os.getenv("DATE_CACHE_SIZE", "0")) or 4096
+
+YMD = Tuple[int, int, int]
+
+MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_abbr) if name}
+MONTHS.update({name.lower(): i for i, name in enumerate(calendar.month_name) if name})
+
+
+def _alternation(names: List[str]) -> str:
+    # longest first, as _strptime does, so "june" is not cut short at "jun"
+    return "|".join(re.escape(n) for n in sorted((n.lower() for n in names if n), key=len, reverse=True))
+
+
+# Same sub-patterns _strptime uses for these directives
+_DIRECTIVES = {
+    "d": r"3[01]|[12]\d|0[1-9]|[1-9]| [1-9]",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "Y": r"\d\d\d\d",
+    "y": r"\d\d",
+    "b": _alternation(list(calendar.month_abbr)),
+    "B": _alternation(list(calendar.month_name)),
+}
+_FORMAT_TOKEN = re.compile(r"%(.)|(\s+)|([^%\s]+)")
+
+
+def _format_regex(fmt: str, prefix: str) -> str:
+    parts = []
+    for m in _FORMAT_TOKEN.finditer(fmt):
+        directive, space, literal = m.groups()
+        if directive:
+            parts.append(f"(?P<{prefix}{directive}>{_DIRECTIVES[directive]})")
+        elif space:
+            parts.append(r"\s+")
+        else:
+            parts.append(re.escape(literal))
+    return "".join(parts)
+
+
+def _ymd(m: Match, prefix: str) -> YMD:
+    """Build and validate (year, month, day) from one format's groups; ValueError if impossible."""
+    g = m.groupdict()
+    if g.get(prefix + "Y") is not None:
+        year = int(g[prefix + "Y"])
+    else:
+        yy = int(g[prefix + "y"])
+        year = yy + (1900 if yy >= 69 else 2000)  # strptime's %y pivot
+    if g.get(prefix + "m") is not None:
+        month = int(g[prefix + "m"])
+    else:
+        month = MONTHS[(g.get(prefix + "b") or g[prefix + "B"]).lower()]
+    day = int(g[prefix + "d"]) if g.get(prefix + "d") is not None else 1
+    date(year, month, day)
+    return year, month, day
+
+
+class DateFormats:
+    """
+    Drop-in for "try datetime.strptime(s, fmt) for fmt in formats": one compiled regex picks the
+    first format whose shape matches, and later formats are only tried if that date is invalid.
+    """
+
+    def __init__(self, *formats: str):
+        self.formats = formats
+        self._each: List[Pattern] = []
+        alternatives = []
+        for i, fmt in enumerate(formats):
+            body = _format_regex(fmt, f"f{i}_")
+            self._each.append(re.compile(body, re.IGNORECASE))
+            alternatives.append(f"(?P<f{i}>{body})")
+        self._any = re.compile("|".join(alternatives), re.IGNORECASE)
+
+    def parse(self, s: str) -> Optional[YMD]:
+        m = self._any.fullmatch(s)
+        if m is None:
+            return None
+        first = int(m.lastgroup[1:])
+        for i in range(first, len(self.formats)):
+            mi = m if i == first else self._each[i].fullmatch(s)
+            if mi is None:
+                continue
+            try:
+                return _ymd(mi, f"f{i}_")
+            except (ValueError, KeyError):
+                continue
+        return None
+
+
+def iso(ymd: YMD, day: Optional[int] = None) -> str:
+    """(y, m, d) -> 'YYYY-MM-DD', formatted like strftime('%Y-%m-%d')."""
+    y, m, d = ymd
+    return f"{y}-{m:02d}-{(d if day is None else day):02d}"
+
+
+# ---------------------- dateutil fast path ----------------------
+# Shapes normalize_date sees on every transaction row. Anything else (or anything these can't
+# settle) goes to dateutil exactly as before.
+_DU_NUMERIC = re.compile(r"\s*(\d{1,2})([/\-.])(\d{1,2})\2(\d{4})\s*")
+_DU_DAY_MONTH_YEAR = re.compile(r"\s*(\d{1,2})([ \-])([A-Za-z]{3,9})\2(\d{4})\s*")
+_DU_MONTHS = dict(MONTHS, sept=9)
+
+
+def _dateutil_fast(s: str) -> Optional[YMD]:
+    m = _DU_NUMERIC.fullmatch(s)
+    if m:
+        a, b, year = int(m.group(1)), int(m.group(3)), int(m.group(4))
+        if b <= 12:
+            day, month = a, b  # dayfirst
+        elif a <= 12:
+            day, month = b, a  # dateutil swaps when the second number can't be a month
+        else:
+            return None
+    else:
+        m = _DU_DAY_MONTH_YEAR.fullmatch(s)
+        if not m:
+            return None
+        month = _DU_MONTHS.get(m.group(3).lower())
+        if month is None:
+            return None
+        day, year = int(m.group(1)), int(m.group(4))
+    if year < 100:
+        return None
+    try:
+        date(year, month, day)
+    except ValueError:
+        return None
+    return year, month, day
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def normalize_date(text_date: str) -> Optional[str]:
+    """
+    Convert date text (like '21-Sep-2025' or '07/11/2025') → ISO 'YYYY-MM-DD'
+    Force dayfirst=True for Indian-style dates.
+    """
+    if not text_date:
+        return None
+    ymd = _dateutil_fast(text_date)
+    if ymd is not None:
+        return date(*ymd).isoformat()
+    try:
+        dt = dateparser.parse(text_date, dayfirst=True, fuzzy=True)
+        return dt.date().isoformat()
+    except Exception:
+        return None
+
+
+# ---------------------- strptime-style normalizers ----------------------
+ICICI_FORMATS = DateFormats(
+    "%d %b %Y", "%d %B %Y",      # "14 Oct 2025", "14 October 2025"
+    "%b %d %Y", "%B %d %Y",      # "Oct 14 2025", "October 14 2025"
+    "%d/%m/%Y", "%d-%m-%Y",      # "14/10/2025"
+    "%Y-%m-%d",                  # ISO
+)
+MONTH_YEAR_FORMATS = DateFormats("%b %Y", "%B %Y")
+HDFC_FORMATS = DateFormats("%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%d-%m-%Y")
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def normalize_date_icici(s: str) -> str:
+    """Normalize a variety of human date tokens to ISO YYYY-MM-DD. Return original stripped string on failure."""
+    if not s:
+        return ""
+    s0 = s.strip().replace("’", "'").replace("‘", "'").replace(".", "").replace(",", "")
+    s0 = COMMON["whitespace"].sub(" ", s0)
+    ymd = ICICI_FORMATS.parse(s0)
+    if ymd is not None:
+        return iso(ymd)
+    # Also try if input is "Oct 2025" -> return YYYY-MM-01
+    m_mon = COMMON["month_year"].match(s.strip())
+    if m_mon:
+        ymd = MONTH_YEAR_FORMATS.parse(m_mon.group(0))
+        if ymd is not None:
+            return iso(ymd, day=1)
+    return s.strip()
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def normalize_date_hdfc(s: str) -> str:
+    """Convert date strings like '14 Oct, 2025' or '15/09/2025' to ISO YYYY-MM-DD."""
+    if not s or not s.strip():
+        return ""
+    s0 = s.strip().replace(",", "").replace("’", "'").replace("‘", "'")
+    ymd = HDFC_FORMATS.parse(s0)
+    if ymd is not None:
+        return iso(ymd)
+    return s0
+
@@ -0,0 +1,98 @@
+# backend/app/parser/detect.py
+"""
+Bank detection from weighted fingerprints.
+
+Only the head of the document (roughly the first page) is looked at first: every bank prints its
+name, IFSC code or web domain in the statement header, while merchant names deeper in the
+transaction list ("SBI LIFE", "HDFC ERGO", ...) are what used to misroute statements.
+If the head is not conclusive the rest of the text is checked for strong fingerprints only.
+"""
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+DETECT_HEAD_CHARS = int(os.getenv("DETECT_HEAD_CHARS", "0")) or 4000
+DETECT_MIN_SCORE = 3        # below this the document is UNKNOWN
+DETECT_DECISIVE_SCORE = 5   # stop scanning once a bank has this much and twice the runner-up
+STRONG_WEIGHT = 4           # fingerprints trusted outside the head
+
+# (bank, pattern over upper-cased text, weight). Order of banks breaks ties, as the old if/elif chain did.
+FINGERPRINTS: List[Tuple[str, str, int]] = [
+    ("ICICI", r"ICICI\s+BANK", 5),
+    ("ICICI", r"\bICIC0[0-9A-Z]{6}\b", 5),  # IFSC
+    ("ICICI", r"ICICIBANK\.COM", 4),
+    ("ICICI", r"\bICICI\b", 2),
+    ("KOTAK", r"KOTAK\s+MAHINDRA", 5),
+    ("KOTAK", r"\bKKBK0[0-9A-Z]{6}\b", 5),
+    ("KOTAK", r"KOTAK\.COM", 4),
+    ("KOTAK", r"KOTAK", 4),  # bare name: head only (see HEAD_ONLY)
+    ("AXIS", r"AXIS\s+BANK", 5),
+    ("AXIS", r"\bUTIB0[0-9A-Z]{6}\b", 5),
+    ("AXIS", r"AXISBANK\.COM", 4),
+    ("HDFC", r"HDFC\s+BANK", 5),
+    ("HDFC", r"\bHDFC0[0-9A-Z]{6}\b", 5),
+    ("HDFC", r"HDFCBANK\.COM", 4),
+    ("SBI", r"SBI\s*CARDS?\b", 5),
+    ("SBI", r"SBICARD\.COM", 4),
+    ("SBI", r"STATE\s+BANK\s+OF\s+INDIA", 4),
+    ("SBI", r"\bSBIN0[0-9A-Z]{6}\b", 5),
+    ("SBI", r"\bSBI\b", 2),  # bare "SBI" (e.g. "SBI LIFE" merchant) is never enough on its own
+]
+
+# Bare bank names score in the head but are never strong: deeper in they are merchants
+# ("KOTAK LIFE INSURANCE" in an HDFC statement), like the weight-2 bare "SBI" and "ICICI".
+HEAD_ONLY = {r"KOTAK"}
+
+BANKS: List[str] = list(dict.fromkeys(bank for bank, _, _ in FINGERPRINTS))
+
+
+def _compile(fingerprints: List[Tuple[str, str, int]]):
+    alternation = "|".join(f"(?P<f{i}>{p})" for i, (_, p, _) in enumerate(fingerprints))
+    return re.compile(alternation)
+
+
+_ALL = _compile(FINGERPRINTS)
+_ALL_IDX = list(range(len(FINGERPRINTS)))
+_STRONG_IDX = [i for i, (_, p, w) in enumerate(FINGERPRINTS) if w >= STRONG_WEIGHT and p not in HEAD_ONLY]
+_STRONG = _compile([FINGERPRINTS[i] for i in _STRONG_IDX])
+
+
+def _score(haystack: str, rx, index: List[int], scores: Dict[str, int], seen: set) -> None:
+    for m in rx.finditer(haystack):
+        fp = index[int(m.lastgroup[1:])]
+        if fp in seen:
+            continue
+        seen.add(fp)
+        bank, _, weight = FINGERPRINTS[fp]
+        scores[bank] += weight
+        if _decisive(scores):
+            return
+
+
+def _ranked(scores: Dict[str, int]) -> List[Tuple[str, int]]:
+    return sorted(scores.items(), key=lambda kv: (-kv[1], BANKS.index(kv[0])))
+
+
+def _decisive(scores: Dict[str, int]) -> bool:
+    (_, best), (_, second) = _ranked(scores)[:2]
+    return best >= DETECT_DECISIVE_SCORE and best >= 2 * second
+
+
+def detect_bank(text: str, head_chars: Optional[int] = None) -> Tuple[str, float]:
+    """
+    Returns (bank, confidence) with confidence in [0, 1]; ("UNKNOWN", 0.0) if nothing matched well enough.
+    Only the first `head_chars` characters are upper-cased and scanned unless they are inconclusive.
+    """
+    head_chars = head_chars or DETECT_HEAD_CHARS
+    scores = {bank: 0 for bank in BANKS}
+    seen: set = set()
+    _score(text[:head_chars].upper(), _ALL, _ALL_IDX, scores, seen)
+    if _ranked(scores)[0][1] < DETECT_MIN_SCORE and len(text) > head_chars:
+        # overlap a little so a name split across the boundary is still seen
+        _score(text[max(0, head_chars - 64):].upper(), _STRONG, _STRONG_IDX, scores, seen)
+
+    (bank, best), (_, second) = _ranked(scores)[:2]
+    if best < DETECT_MIN_SCORE:
+        return "UNKNOWN", 0.0
+    confidence = best / (best + second) * min(1.0, best / DETECT_DECISIVE_SCORE)
+    return bank, round(confidence, 2)
@@ -1,100 +1,646 @@
 # backend/app/parser/extractor.py
 import io
+import logging
+import mmap
 import os
+import tempfile
+import time
+from contextlib import ExitStack, closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pypdf import PdfReader
 from .utils import text_stats
-from .bank_parsers import detect_bank_and_parse
-from pdf2image import convert_from_bytes
-import pytesseract
-from typing import Dict, Any
-
-# ✅ Explicit path for Tesseract OCR (Windows)
-TESSERACT_PATH = r"C:\Users\Deepak Mahto\AppData\Local\Programs\Tesseract-OCR\tesseract.exe"
-if os.path.exists(TESSERACT_PATH):
-    pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
-    print(f"🧠 Using Tesseract from: {TESSERACT_PATH}")
-else:
-    print(f"⚠️ Warning: Tesseract not found at {TESSERACT_PATH}. OCR fallback may fail.")
+from .bank_parsers import TX_STREAMS, detect_bank_and_parse, summary_complete
+from .cache import text_cache, document_digest
+from .timing import StageTimer
+from .ocr import get_engine
+from .detect import detect_bank
+from .pageprep import OCR_REGIONS, REGIONS_TAG, ocr_crops
+from .rowstream import RowStream
+from pdf2image import convert_from_path, pdfinfo_from_path
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
+
+# progress(stage, page, pages) -- called after each page is extracted or OCR'd
+ProgressCallback = Callable[[str, int, int], None]
+
+# A PDF as handed to the extractor: its bytes, or the path of a file holding it
+# (large uploads are spooled to disk, see app/uploads.py)
+PdfSource = Union[bytes, str]
+
+logger = logging.getLogger(__name__)
 
 # ✅ Explicit Poppler path for Windows
 POPLER_PATH = r"C:\Program Files\poppler-25.07.0\Library\bin"
 
-OCR_MIN_TEXT_LEN = 200  # if extracted text is smaller than this, do OCR fallback
+# "full" parses everything; "summary" reads pages only until the header fields are found
+PARSE_MODES = ("full", "summary")
+# a summary parse gives up on still-missing fields after this many pages (0 = read to the end)
+SUMMARY_MAX_PAGES = int(os.getenv("SUMMARY_MAX_PAGES", "5"))
+
+OCR_MIN_TEXT_LEN = 200  # if the whole document's extracted text is smaller than this, OCR every page
+# Otherwise only pages with (almost) no text layer are OCR'd -- scanned pages among digital ones --
+# not pages that are merely short, like cover pages or a sparse last page.
+OCR_PAGE_MIN_TEXT_LEN = int(os.getenv("OCR_PAGE_MIN_TEXT_LEN", "20"))
+OCR_DPI = 200
+# Adaptive OCR (OCR_ADAPTIVE=1): render at OCR_LOW_DPI first and re-render at OCR_HIGH_DPI only the
+# pages whose mean Tesseract word confidence (0-100) is below OCR_MIN_CONFIDENCE.
+OCR_ADAPTIVE = os.getenv("OCR_ADAPTIVE", "0") == "1"
+OCR_LOW_DPI = int(os.getenv("OCR_LOW_DPI", "0")) or 150
+OCR_HIGH_DPI = int(os.getenv("OCR_HIGH_DPI", "0")) or 300
+OCR_MIN_CONFIDENCE = float(os.getenv("OCR_MIN_CONFIDENCE", "75"))
+# text cache keys record how pages were OCR'd, so changing the OCR settings never serves stale text
+OCR_CACHE_TAG = f"{OCR_LOW_DPI}-{OCR_HIGH_DPI}c{OCR_MIN_CONFIDENCE:g}" if OCR_ADAPTIVE else str(OCR_DPI)
+if REGIONS_TAG:
+    OCR_CACHE_TAG += f"r{REGIONS_TAG}"
+
+# Pages are OCR'd concurrently on threads: tesserocr releases the GIL while recognising and
+# pytesseract runs a tesseract subprocess per page, so either way threads keep every core busy.
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "0")) or (os.cpu_count() or 1)
+OCR_RASTER_THREADS = int(os.getenv("OCR_RASTER_THREADS", "0")) or min(4, OCR_WORKERS)
+# Pages are rasterised this many at a time and released once OCR'd, so peak image
+# memory is bounded by the window rather than by the page count.
+OCR_PAGE_WINDOW = int(os.getenv("OCR_PAGE_WINDOW", "0")) or OCR_WORKERS
+if OCR_WORKERS > 1:
+    # stop each tesseract (process or tesserocr handle) from spawning OpenMP threads on top of ours
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+@contextmanager
+def open_pdf(pdf: PdfSource) -> Iterator[PdfReader]:
+    """PdfReader over the document. A file is memory-mapped, so its pages are read straight from the page cache."""
+    if isinstance(pdf, (bytes, bytearray)):
+        yield PdfReader(io.BytesIO(pdf))
+        return
+    with open(pdf, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield PdfReader(mm)
 
 
-def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str:
+@contextmanager
+def pdf_path(pdf: PdfSource) -> Iterator[str]:
+    """
+    A path poppler can open. Bytes are written to a temp file once here, instead of once per
+    convert_from_bytes / pdfinfo_from_bytes call (which is what those do internally).
+    """
+    if not isinstance(pdf, (bytes, bytearray)):
+        yield pdf
+        return
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as f:
+        f.write(pdf)
+        f.flush()
+        yield f.name
+
+
+def extract_pages_from_pdf_bytes(pdf: PdfSource, progress: Optional[ProgressCallback] = None) -> List[str]:
+    """
+    Try to extract text using pypdf. Return one string per page ([] if the PDF can't be read).
+    `pdf` is the document's bytes or a path to it.
+    """
+    try:
+        with open_pdf(pdf) as reader:
+            texts = []
+            n_pages = len(reader.pages)
+            for i, page in enumerate(reader.pages):
+                try:
+                    t = page.extract_text() or ""
+                except Exception as e:
+                    logger.warning(f"⚠️ Text extraction failed on page {i + 1}: {e}")
+                    t = ""
+                texts.append(t)
+                if progress:
+                    progress("extract", i + 1, n_pages)
+            return texts
+    except Exception as e:
+        logger.warning(f"❌ Failed to read PDF with PyPDF: {e}")
+        return []
+
+
+def extract_text_from_pdf_bytes(pdf: PdfSource, progress: Optional[ProgressCallback] = None) -> str:
     """
     Try to extract text using pypdf. Return concatenated text.
     """
+    return "\n".join(extract_pages_from_pdf_bytes(pdf, progress=progress)).strip()
+
+
+def pages_needing_ocr(pages: List[str], min_len: int = OCR_MIN_TEXT_LEN,
+                      page_min_len: int = OCR_PAGE_MIN_TEXT_LEN) -> List[int]:
+    """
+    Return the 1-based numbers of the pages to OCR: every page if the document's extracted text is
+    below `min_len` chars in total, otherwise the pages whose own text is below `page_min_len`.
+    """
+    lengths = [text_stats(t)["char_count"] for t in pages]
+    if sum(lengths) < min_len:
+        return list(range(1, len(pages) + 1))
+    return [i + 1 for i, n in enumerate(lengths) if n < page_min_len]
+
+
+def _ocr_page(page_no: int, img, timer: Optional[StageTimer] = None, scored: bool = False,
+              bank: Optional[str] = None):
+    """
+    OCR a single rendered page with this process's engine (see ocr.py). Returns its text, or with
+    scored=True (text, mean word confidence). Returns None if OCR fails on it.
+    Blank pages are not OCR'd (text "", confidence 100: nothing to re-render for); other pages go
+    to Tesseract cropped to their ink, or to `bank`'s OCR_REGIONS (see pageprep.py).
+    """
+    start = time.perf_counter()
     try:
-        reader = PdfReader(io.BytesIO(pdf_bytes))
-        texts = []
-        for page in reader.pages:
-            try:
-                t = page.extract_text() or ""
-            except Exception as e:
-                print(f"⚠️ Text extraction failed on a page: {e}")
-                t = ""
-            texts.append(t)
-        return "\n".join(texts).strip()
+        parts = ocr_crops(img, bank)
+        if not parts:
+            logger.debug(f"⬜ Page {page_no} is blank; skipping OCR")
+            if timer is not None:
+                timer.count("ocr_blank_pages")
+            return ("", 100.0) if scored else ""
+        engine = get_engine(OCR_WORKERS)
+        if scored:
+            recognized = [engine.recognize(part) for part in parts]
+            txt = "\n".join(t for t, _ in recognized)
+            confs = [c for _, c in recognized if c is not None]
+            conf = sum(confs) / len(confs) if confs else None
+            logger.debug(f"✅ OCR done for page {page_no}, {len(txt)} chars, confidence {conf}")
+            return txt, conf
+        txt = "\n".join(engine.image_to_string(part) for part in parts)
+        logger.debug(f"✅ OCR done for page {page_no}, {len(txt)} chars")
+        return txt
     except Exception as e:
-        print(f"❌ Failed to read PDF with PyPDF: {e}")
-        return ""
+        logger.warning(f"⚠️ OCR failed on page {page_no}: {e}")
+        return None
+    finally:
+        if timer is not None:
+            timer.sample("ocr_page", time.perf_counter() - start)
 
 
-def ocr_pdf_bytes(pdf_bytes: bytes) -> str:
+def _poppler_path() -> Optional[str]:
+    # fall back to poppler on PATH when the Windows install is not present
+    return POPLER_PATH if os.path.exists(POPLER_PATH) else None
+
+
+def _pdf_page_count(pdf: PdfSource) -> int:
+    try:
+        with open_pdf(pdf) as reader:
+            return len(reader.pages)
+    except Exception:
+        with pdf_path(pdf) as path:
+            return int(pdfinfo_from_path(path, poppler_path=_poppler_path())["Pages"])
+
+
+def _page_runs(page_nos: List[int], window: int) -> Iterator[Tuple[int, int]]:
+    """Group sorted page numbers into contiguous (first, last) runs of at most `window` pages."""
+    run: List[int] = []
+    for p in page_nos:
+        if run and (p != run[-1] + 1 or len(run) == window):
+            yield run[0], run[-1]
+            run = []
+        run.append(p)
+    if run:
+        yield run[0], run[-1]
+
+
+def iter_page_windows(path: str, page_nos: List[int], window: int = OCR_PAGE_WINDOW,
+                      dpi: int = OCR_DPI) -> Iterator[List[Tuple[int, Any]]]:
     """
-    Convert pdf pages to images and OCR them with pytesseract.
-    If OCR fails, return an empty string (do not crash).
+    Rasterise the requested pages of the PDF at `path` `window` at a time (via first_page/last_page)
+    and yield [(page_no, image), ...] for each window. Pages are 1-based.
+    """
+    for first, last in _page_runs(sorted(page_nos), max(1, window)):
+        images = convert_from_path(
+            path, dpi=dpi, poppler_path=_poppler_path(),
+            first_page=first, last_page=last, thread_count=min(OCR_RASTER_THREADS, last - first + 1),
+        )
+        yield [(first + i, img) for i, img in enumerate(images)]
+
+
+def _ocr_windows(pool: ThreadPoolExecutor, path: str, page_nos: List[int], dpi: int,
+                 timer: Optional[StageTimer], scored: bool, bank: Optional[str] = None) -> Iterator[Tuple[int, Any]]:
+    """OCR pages rendered at `dpi` a window at a time; yields (page_no, _ocr_page result) in page order."""
+    for batch in iter_page_windows(path, page_nos, dpi=dpi):
+        batch_nos = [page_no for page_no, _ in batch]
+        images = [img for _, img in batch]
+        del batch
+        try:
+            # map() yields in page order even though pages finish out of order
+            yield from zip(batch_nos, pool.map(_ocr_page, batch_nos, images, repeat(timer), repeat(scored), repeat(bank)))
+        finally:
+            for img in images:
+                img.close()
+
+
+def ocr_pdf_pages(pdf: PdfSource, page_nos: Optional[List[int]] = None,
+                  progress: Optional[ProgressCallback] = None, timer: Optional[StageTimer] = None,
+                  bank: Optional[str] = None) -> Dict[int, str]:
+    """
+    OCR the given 1-based pages (all pages if None) and return {page_no: text}.
+    Pages are rendered a window at a time and each image is closed as soon as it is OCR'd.
+    `bank`, if it has OCR_REGIONS, limits OCR to that bank's regions of each page.
+    Pages where OCR fails are left out. If OCR fails entirely, return {} (do not crash).
     """
     try:
-        if not os.path.exists(POPLER_PATH):
-            print(f"⚠️ Poppler not found at {POPLER_PATH}. OCR may fail.")
+        if _poppler_path() is None:
+            logger.debug(f"⚠️ Poppler not found at {POPLER_PATH}; using poppler from PATH.")
 
-        images = convert_from_bytes(pdf_bytes, dpi=200, poppler_path=POPLER_PATH)
+        if page_nos is None:
+            page_nos = list(range(1, _pdf_page_count(pdf) + 1))
+        results: Dict[int, str] = {}
+        low_confidence: Dict[int, Optional[float]] = {}
+        done = 0
+        workers = max(1, min(OCR_WORKERS, OCR_PAGE_WINDOW, len(page_nos)))
+        with pdf_path(pdf) as path, ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as pool:
+            dpi = OCR_LOW_DPI if OCR_ADAPTIVE else OCR_DPI
+            for page_no, out in _ocr_windows(pool, path, page_nos, dpi, timer, OCR_ADAPTIVE, bank):
+                if out is not None and OCR_ADAPTIVE:
+                    results[page_no], conf = out
+                    if conf is None or conf < OCR_MIN_CONFIDENCE:
+                        low_confidence[page_no] = conf
+                elif out is not None:
+                    results[page_no] = out
+                done += 1
+                if progress:
+                    progress("ocr", done, len(page_nos))
 
-        ocr_texts = []
-        for i, img in enumerate(images):
-            try:
-                txt = pytesseract.image_to_string(img)
-                print(f"✅ OCR done for page {i + 1}, {len(txt)} chars")
-                ocr_texts.append(txt)
-            except Exception as e:
-                print(f"⚠️ OCR failed on page {i + 1}: {e}")
+            if low_confidence:
+                logger.info(f"🔍 Low OCR confidence on pages {sorted(low_confidence)}; re-rendering at {OCR_HIGH_DPI} dpi")
+                if timer is not None:
+                    timer.count("ocr_rerendered", len(low_confidence))
+                for page_no, out in _ocr_windows(pool, path, sorted(low_confidence), OCR_HIGH_DPI, timer, True, bank):
+                    # keep whichever rendering Tesseract was more confident about
+                    if out is not None and (out[1] or -1) >= (low_confidence[page_no] or -1):
+                        results[page_no] = out[0]
 
-        return "\n".join(ocr_texts).strip()
+        return results
 
     except Exception as e:
-        print(f"⚠️ OCR fallback failed entirely: {e}")
-        return ""
+        logger.warning(f"⚠️ OCR fallback failed entirely: {e}")
+        return {}
 
 
-def parse_pdf_bytes(pdf_bytes: bytes) -> Dict[str, Any]:
+def ocr_pdf_bytes(pdf: PdfSource, progress: Optional[ProgressCallback] = None) -> str:
     """
-    Returns: { "bank": bank_name, "fields": {...} }
+    Convert pdf pages to images and OCR them.
+    If OCR fails, return an empty string (do not crash).
     """
-    text = extract_text_from_pdf_bytes(pdf_bytes)
+    pages = ocr_pdf_pages(pdf, progress=progress)
+    return "\n".join(pages[p] for p in sorted(pages)).strip()
+
+
+def _region_bank(pages: List[str]) -> Optional[str]:
+    """The bank the already-read pages belong to, if OCR_REGIONS has boxes for it; else None (OCR whole pages)."""
+    if not OCR_REGIONS or not any(pages):
+        return None
+    bank, _ = detect_bank("\n".join(pages))
+    return bank if bank in OCR_REGIONS else None
 
-    # If the text looks too small, try OCR fallback
-    if text_stats(text)["char_count"] < OCR_MIN_TEXT_LEN:
-        print("🧩 Text too short; attempting OCR fallback...")
-        ocr_text = ocr_pdf_bytes(pdf_bytes)
-        # Prefer OCR text if it’s longer
-        if len(ocr_text) > len(text):
-            text = ocr_text
-            print("✅ OCR text used for parsing.")
+
+def _ocr_pages_cached(pdf: PdfSource, digest: str, page_nos: Optional[List[int]],
+                      progress: Optional[ProgressCallback] = None, timer: Optional[StageTimer] = None,
+                      bank: Optional[str] = None) -> Dict[int, str]:
+    """ocr_pdf_pages, but pages already OCR'd with the current OCR settings come from the text cache."""
+    if page_nos is None:
+        page_nos = list(range(1, _pdf_page_count(pdf) + 1))
+    tag = f"{OCR_CACHE_TAG}:{bank}" if bank else OCR_CACHE_TAG
+    results: Dict[int, str] = {}
+    missing = []
+    for page_no in page_nos:
+        cached = text_cache.get(f"{digest}:ocr:{tag}:{page_no}")
+        if cached is None:
+            missing.append(page_no)
         else:
-            print("⚠️ OCR text was not longer than extracted text. Using original text.")
+            results[page_no] = cached
+    if timer is not None and results:
+        timer.count("ocr_cache_hits", len(results))
+    if missing:
+        fresh = ocr_pdf_pages(pdf, missing, progress=progress, timer=timer, bank=bank)
+        if timer is not None:
+            timer.count("ocr_pages", len(missing))
+        for page_no, txt in fresh.items():
+            text_cache.put(f"{digest}:ocr:{tag}:{page_no}", txt)
+        results.update(fresh)
+    return results
+
+
+def extract_document_pages(pdf: PdfSource, progress: Optional[ProgressCallback] = None,
+                           digest: Optional[str] = None, timer: Optional[StageTimer] = None) -> List[str]:
+    """
+    Per-page text for the document: pypdf text, with OCR text substituted on pages pypdf could not read.
+    Results are cached by content hash, so re-parsing the same PDF skips pypdf and Tesseract.
+    `timer`, if given, collects the "extract" and "ocr" stage times.
+    """
+    timer = timer or StageTimer()
+    digest = digest or document_digest(pdf)
+    doc_key = f"{digest}:pages:{OCR_CACHE_TAG}"
+    cached = text_cache.get(doc_key)
+    if cached is not None:
+        timer.count("text_cache_hits")
+        return list(cached)
+    timer.count("text_cache_misses")
+
+    with timer.stage("extract"):
+        pages = extract_pages_from_pdf_bytes(pdf, progress=progress)
 
-    # 🧩 Debug: print first few thousand characters
-    print("========== RAW EXTRACTED TEXT ==========")
-    print(text[:2000])
-    print("========================================")
+    # OCR only the pages pypdf could not read (scanned cover pages etc.);
+    # if pypdf could not open the file at all, OCR every page.
+    complete = True
+    low_pages = pages_needing_ocr(pages) if pages else None
+    if low_pages is None or low_pages:
+        logger.info(f"🧩 Text too short on pages {low_pages or 'all'}; attempting OCR fallback...")
+        with timer.stage("ocr"):
+            ocr_pages = _ocr_pages_cached(pdf, digest, low_pages, progress=progress, timer=timer,
+                                          bank=_region_bank(pages))
+        complete = bool(ocr_pages) and (low_pages is None or len(ocr_pages) == len(low_pages))
+        if not pages:
+            pages = [""] * (max(ocr_pages) if ocr_pages else 0)
+        for page_no, ocr_text in ocr_pages.items():
+            # Prefer OCR text if it’s longer
+            if len(ocr_text.strip()) > len(pages[page_no - 1].strip()):
+                pages[page_no - 1] = ocr_text
+                logger.debug(f"✅ OCR text used for page {page_no}.")
 
+    # don't cache a document whose OCR failed part-way; a retry may do better
+    if complete:
+        text_cache.put(doc_key, pages)
+    return pages
+
+
+def iter_document_pages(pdf: PdfSource, digest: str, progress: Optional[ProgressCallback] = None,
+                        timer: Optional[StageTimer] = None, ocr_window: int = 1) -> Iterator[str]:
+    """
+    The document's pages one at a time, in order: pypdf text, or the page's OCR text (cached per
+    page) when pages_needing_ocr would pick it. When a page needs OCR, it and the next pages that do
+    within `ocr_window` pages are OCR'd together (concurrently, see ocr_pdf_pages); with the default
+    of 1, nothing past the page the caller stops at is OCR'd. pypdf reads ahead only as far as that
+    window, or while the document still has under OCR_MIN_TEXT_LEN chars of text.
+    Just before the last page is yielded, the page list is cached as extract_document_pages would
+    cache it (unless OCR failed on a page), so the next parse of the document reads no pages.
+    """
+    timer = timer or StageTimer()
+    with ExitStack() as stack:
+        try:
+            reader = stack.enter_context(open_pdf(pdf))
+            n_pages = len(reader.pages)
+        except Exception as e:
+            logger.warning(f"❌ Failed to read PDF with PyPDF: {e}")
+            reader = None
+            try:
+                n_pages = _pdf_page_count(pdf)
+            except Exception as e:
+                logger.warning(f"⚠️ OCR fallback failed entirely: {e}")
+                return
+
+        def _extract(page_no: int) -> str:
+            if reader is None:
+                return ""
+            with timer.stage("extract"):
+                try:
+                    return reader.pages[page_no - 1].extract_text() or ""
+                except Exception as e:
+                    logger.warning(f"⚠️ Text extraction failed on page {page_no}: {e}")
+                    return ""
+
+        extracted: Dict[int, str] = {}  # pages read by pypdf but not yet yielded
+        ahead = 0     # pages read by pypdf so far
+        readable = 0  # their text layer chars
+        ocr_source = None
+        ocr_texts: Dict[int, str] = {}  # pages OCR'd but not yet yielded
+        complete = True  # every page sent to OCR came back
+        seen: List[str] = []  # pages so far (the bank's OCR_REGIONS are picked once it is recognisable)
+
+        def _read_to(page_no: int) -> None:
+            nonlocal ahead, readable
+            while ahead < page_no:
+                ahead += 1
+                extracted[ahead] = _extract(ahead)
+                readable += text_stats(extracted[ahead])["char_count"]
+
+        def _needs_ocr(text: str) -> bool:
+            return readable < OCR_MIN_TEXT_LEN or text_stats(text)["char_count"] < OCR_PAGE_MIN_TEXT_LEN
+
+        for page_no in range(1, n_pages + 1):
+            # read this page, and further ahead only while the document has too little text to tell
+            # whether it is a scan (the whole-document check of pages_needing_ocr)
+            _read_to(page_no)
+            while readable < OCR_MIN_TEXT_LEN and ahead < n_pages:
+                _read_to(ahead + 1)
+            text = extracted.pop(page_no)
+            ocr_text = ocr_texts.pop(page_no, None)
+            if ocr_text is None and _needs_ocr(text):
+                window_end = min(n_pages, page_no + ocr_window - 1)
+                _read_to(window_end)
+                batch = [page_no] + [p for p in range(page_no + 1, window_end + 1) if _needs_ocr(extracted[p])]
+                logger.debug(f"🧩 Text too short on pages {batch}; attempting OCR fallback...")
+                ocr_source = ocr_source or stack.enter_context(pdf_path(pdf))  # one temp file for all pages
+                with timer.stage("ocr"):
+                    fresh = _ocr_pages_cached(ocr_source, digest, batch, timer=timer, bank=_region_bank(seen))
+                complete = complete and len(fresh) == len(batch)
+                ocr_texts.update(fresh)
+                ocr_text = ocr_texts.pop(page_no, "")
+            if ocr_text is not None and len(ocr_text.strip()) > len(text.strip()):
+                text = ocr_text
+            if progress:
+                progress("extract", page_no, n_pages)
+            seen.append(text)
+            if page_no == n_pages and complete:
+                text_cache.put(f"{digest}:pages:{OCR_CACHE_TAG}", seen)
+            yield text
+
+
+def parse_summary(pdf: PdfSource, progress: Optional[ProgressCallback] = None, digest: Optional[str] = None,
+                  timer: Optional[StageTimer] = None) -> Dict[str, Any]:
+    """
+    Summary fields only (no "transactions"): pages are read in order and parsing stops at the first
+    page by which the bank and its summary fields have been found -- usually page 1 or 2 -- or
+    after SUMMARY_MAX_PAGES pages, leaving any field not found by then empty. Once every page has
+    been read the fields are the same as a full parse's (what a cached full result answers with),
+    and the pages are left in the text cache for the next parse of the document.
+    """
+    timer = timer or StageTimer()
+    digest = digest or document_digest(pdf)
+    cached = text_cache.get(f"{digest}:pages:{OCR_CACHE_TAG}")
+    if cached is not None:
+        timer.count("text_cache_hits")
+        return parse_text("\n".join(cached).strip(), timer=timer, transactions=False)
+    timer.count("text_cache_misses")
+
+    pages: List[str] = []
+    n_pages = [0]
+
+    def _progress(stage: str, page: int, total: int):
+        n_pages[0] = total
+        if progress:
+            progress(stage, page, total)
+
+    result: Dict[str, Any] = {"bank": "UNKNOWN", "fields": {}}
+    with closing(iter_document_pages(pdf, digest, progress=_progress, timer=timer)) as lazy_pages:
+        for page in lazy_pages:
+            pages.append(page)
+            # the last page's parse is a whole-document one: it may derive what needs every page
+            last = len(pages) == n_pages[0]
+            if page.strip() or len(pages) == 1 or last:
+                result = parse_text("\n".join(pages).strip(), timer=timer, transactions=False, partial=not last)
+            if summary_complete(result) or len(pages) == SUMMARY_MAX_PAGES:
+                break
+    timer.count("pages_read", len(pages))
+    return result
+
+
+def parse_text(text: str, timer: Optional[StageTimer] = None, transactions: bool = True,
+               columnar: bool = False, partial: bool = False) -> Dict[str, Any]:
+    """
+    Run bank detection and field parsing on already-extracted text
+    (partial=True: only the first pages of it, see detect_bank_and_parse).
+    Returns: { "bank": bank_name, "fields": {...} }
+    """
     try:
-        parsed = detect_bank_and_parse(text)
+        return detect_bank_and_parse(text, columnar=columnar, timer=timer, transactions=transactions,
+                                     partial=partial)
     except Exception as e:
-        print(f"❌ Parsing error inside detect_bank_and_parse: {e}")
-        parsed = {"bank": "UNKNOWN", "fields": {}}
+        logger.exception(f"❌ Parsing error inside detect_bank_and_parse: {e}")
+        return {"bank": "UNKNOWN", "fields": {}}
+
+
+def parse_cached_text(digest: str) -> Optional[Dict[str, Any]]:
+    """
+    Re-parse a document from its cached text only (e.g. after a bank_parsers change).
+    Returns None if the document's text is not in the cache.
+    """
+    pages = text_cache.get(f"{digest}:pages:{OCR_CACHE_TAG}")
+    if pages is None:
+        return None
+    return parse_text("\n".join(pages).strip())
+
+
+def parse_pdf(pdf: PdfSource, progress: Optional[ProgressCallback] = None,
+              digest: Optional[str] = None, mode: str = "full", columnar: bool = False) -> Dict[str, Any]:
+    """
+    Returns: { "bank": bank_name, "fields": {...}, "timings": {...} }
+    `pdf` is the document's bytes or a path to it; pass `digest` if its sha256 is already known.
+    `progress`, if given, is called as progress(stage, page, pages) while pages are processed.
+    mode="summary" stops reading pages once the header fields are found (see parse_summary).
+    columnar=True returns the transactions as a TransactionColumns (not JSON-serialisable as is).
+    "timings" holds per-stage milliseconds (see timing.StageTimer); callers drop it before caching.
+    """
+    if mode not in PARSE_MODES:
+        raise ValueError(f"Unknown parse mode: {mode}")
+    timer = StageTimer()
+    if mode == "summary":
+        with timer.stage("total"):
+            result = parse_summary(pdf, progress=progress, digest=digest, timer=timer)
+        result["timings"] = timer.as_dict()
+        return result
+
+    with timer.stage("total"):
+        text = "\n".join(extract_document_pages(pdf, progress=progress, digest=digest, timer=timer)).strip()
+
+        # 🧩 Debug: first few thousand characters
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("========== RAW EXTRACTED TEXT ==========\n%s\n========================================", text[:2000])
+
+        result = parse_text(text, timer=timer, columnar=columnar)
+    result["timings"] = timer.as_dict()
+    return result
+
+
+def parse_pdf_bytes(pdf_bytes: bytes, progress: Optional[ProgressCallback] = None,
+                    mode: str = "full") -> Dict[str, Any]:
+    return parse_pdf(pdf_bytes, progress=progress, mode=mode)
+
+
+# emit(event) -- called by stream_parse as parts of the result become available
+EventCallback = Callable[[Dict[str, Any]], None]
+
+
+class _StreamPublisher:
+    """Turns parses of a growing text and rows read page by page into bank / summary / transaction events."""
+
+    def __init__(self, emit: EventCallback):
+        self.emit = emit
+        self.bank: Optional[str] = None
+        self.summary: Optional[Dict[str, Any]] = None
+        self.sent: List[Dict[str, Any]] = []
+
+    def publish(self, result: Dict[str, Any], page: Optional[int], pages: Optional[int], final: bool = False) -> None:
+        """Bank and summary events for a parse; with final=True, rows the stream still lacks too."""
+        bank = result.get("bank", "UNKNOWN")
+        if bank == "UNKNOWN":
+            return
+        if bank != self.bank:
+            self.bank = bank
+            self.emit({"event": "bank", "bank": bank, "confidence": result.get("confidence")})
+        fields = result.get("fields") or {}
+        summary = {k: v for k, v in fields.items() if k != "transactions"}
+        if (final or summary_complete(result)) and summary != self.summary:
+            self.summary = summary
+            self.emit({"event": "summary", "fields": summary})
+        if not final:
+            return
+        txs = fields.get("transactions") or []
+        if txs[:len(self.sent)] != self.sent:
+            # the whole document's rows differ from those sent page by page (rare): resend them all
+            self.sent = list(txs)
+            self.emit({"event": "transactions", "page": page, "pages": pages, "reset": True, "transactions": self.sent})
+        else:
+            self.add(txs[len(self.sent):], page, pages)
+
+    def add(self, rows: List[Dict[str, Any]], page: Optional[int], pages: Optional[int]) -> None:
+        """A transactions event for rows that follow those already sent."""
+        if rows:
+            self.sent.extend(rows)
+            self.emit({"event": "transactions", "page": page, "pages": pages, "transactions": rows})
+
+
+def result_events(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The events stream_parse emits for a result that is already complete (e.g. from the cache)."""
+    events: List[Dict[str, Any]] = []
+    _StreamPublisher(events.append).publish(result, None, None, final=True)
+    return events
+
+
+def stream_parse(pdf: PdfSource, emit: EventCallback, digest: Optional[str] = None) -> Dict[str, Any]:
+    """
+    parse_pdf, page by page, calling emit(event) as soon as each part of the result is known:
+      {"event": "bank", "bank": ..., "confidence": ...}          once the bank is detected
+      {"event": "summary", "fields": {...}}                     once the header fields are all found
+      {"event": "transactions", "page": n, "pages": N, "transactions": [...]}   rows new since the last event
+    A "bank" or "summary" event may be repeated if later pages change it (the last one wins); a
+    "transactions" event with "reset": true replaces every row sent so far. Returns the same result
+    as parse_pdf. The text read so far is re-parsed for the summary only until it is complete (or
+    SUMMARY_MAX_PAGES pages); rows come from each new page alone (RowStream), and the whole text is
+    parsed once at the end. Scanned pages are OCR'd OCR_PAGE_WINDOW at a time, and the page list is
+    left in the text cache (see iter_document_pages) for the next parse of the document.
+    """
+    timer = StageTimer()
+    publisher = _StreamPublisher(emit)
+    with timer.stage("total"):
+        digest = digest or document_digest(pdf)
+        cached = text_cache.get(f"{digest}:pages:{OCR_CACHE_TAG}")
+        if cached is not None:
+            timer.count("text_cache_hits")
+            result = parse_text("\n".join(cached).strip(), timer=timer)
+            publisher.publish(result, len(cached), len(cached), final=True)
+        else:
+            timer.count("text_cache_misses")
+            count = {"pages": 0}
+
+            def _progress(stage: str, page: int, pages: int) -> None:
+                count["pages"] = pages
 
-    return parsed
+            pages: List[str] = []
+            result = {"bank": "UNKNOWN", "fields": {}}
+            searching = True  # still re-parsing the pages so far for the bank and summary
+            rows: Optional[RowStream] = None
+            with closing(iter_document_pages(pdf, digest, progress=_progress, timer=timer,
+                                             ocr_window=OCR_PAGE_WINDOW)) as lazy_pages:
+                for page in lazy_pages:
+                    pages.append(page)
+                    new_pages = [page]
+                    if searching:
+                        if page.strip() or len(pages) == 1:
+                            result = parse_text("\n".join(pages).strip(), timer=timer, transactions=False,
+                                                partial=True)
+                        publisher.publish(result, len(pages), count["pages"])
+                        searching = not summary_complete(result) and len(pages) != SUMMARY_MAX_PAGES
+                        if rows is None and result.get("bank") in TX_STREAMS:
+                            rows = RowStream(result["bank"])
+                            new_pages = pages  # the pages before the bank was known, too
+                    if rows is not None:
+                        publisher.add([tx for p in new_pages for tx in rows.feed(p)], len(pages), count["pages"])
+            result = parse_text("\n".join(pages).strip(), timer=timer)
+            publisher.publish(result, len(pages), len(pages), final=True)
+    result["timings"] = timer.as_dict()
+    return result
@@ -0,0 +1,54 @@
+# backend/app/parser/lines.py
+"""
+Line tokenizer shared by the transaction extractors.
+
+tokenize() splits a document once into its lines; the split and strip run in C (splitlines +
+map(str.strip)). Every transaction row starts on a line that begins with its date, so only lines
+starting with a digit are typed, by one fullmatch each, into Line records: the leading date token,
+the trailing amount token and the Cr/Dr/C/D/M flag after it, and the text in between. The
+extractors read their rows off those tokens instead of each running its own row regex per line.
+"""
+from typing import List, NamedTuple, Optional
+
+from .patterns import LINE
+
+
+class Line(NamedTuple):
+    """The tokens of one line that starts with a digit."""
+    index: int    # the line's position in TextLines.raw / TextLines.texts
+    text: str     # the stripped line
+    date: str     # leading date token ("01/09/2025", "30 Sep 25", "09 Oct '25", ...), "" if none
+    body: str     # the text between the date and the amount (or the line's end), whitespace included
+    amount: str   # trailing amount token after whitespace ("5,150.00"), "" if none
+    flag: str     # Cr, Dr, C, D or M printed after the amount, "" if none
+
+
+class TextLines:
+    """
+    A document's lines: as split, line ends kept (raw), stripped (texts, "" for a blank line) and
+    typed (records).
+    """
+
+    def __init__(self, text: str):
+        self.raw: List[str] = text.splitlines(keepends=True)
+        self.texts: List[str] = list(map(str.strip, self.raw))
+        self._records: Optional[List[Line]] = None
+
+    @property
+    def records(self) -> List[Line]:
+        """A Line for every line that starts with a digit, in document order."""
+        if self._records is None:
+            fullmatch = LINE["tokens"].fullmatch
+            records = self._records = []
+            for i, t in enumerate(self.texts):
+                if t[:1].isdecimal():
+                    date, body, amount, flag, rest = fullmatch(t).groups("")
+                    records.append(Line(i, t, date, body or rest, amount, flag))
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+def tokenize(text: str) -> TextLines:
+    return TextLines(text)
@@ -0,0 +1,182 @@
+# backend/app/parser/ocr.py
+"""
+OCR engines behind one interface: image_to_string(img) -> text, and recognize(img) -> (text, mean
+word confidence) for callers that decide what to do next from how sure Tesseract was.
+
+  tesserocr    Tesseract's C API in-process. Each handle loads the language model once and is
+               reused for every page; recognition releases the GIL, so a pool of handles (one per
+               OCR thread) keeps every core busy with no process start-up or temp files per page.
+  pytesseract  one `tesseract` subprocess per page (image written to a temp file, model reloaded,
+               output read back). Always available; the fallback.
+
+OCR_ENGINE picks one: "auto" (default) uses tesserocr when it is installed, else pytesseract.
+Engines are created lazily, once per process, so each parse worker keeps its own warm handles.
+"""
+import abc
+import logging
+import os
+import queue
+import threading
+from typing import Optional, Tuple
+
+import pytesseract
+
+logger = logging.getLogger(__name__)
+
+OCR_ENGINE = os.getenv("OCR_ENGINE", "auto").lower()  # auto | tesserocr | pytesseract
+OCR_LANG = os.getenv("OCR_LANG", "eng")
+
+# ✅ Explicit path for Tesseract OCR (Windows)
+TESSERACT_PATH = r"C:\Users\Deepak Mahto\AppData\Local\Programs\Tesseract-OCR\tesseract.exe"
+if os.path.exists(TESSERACT_PATH):
+    pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
+    logger.info(f"🧠 Using Tesseract from: {TESSERACT_PATH}")
+else:
+    logger.info(f"⚠️ Tesseract not found at {TESSERACT_PATH}; using tesseract from PATH.")
+
+
+def mean_confidence(tsv: str) -> Optional[float]:
+    """Mean word confidence (0-100) from Tesseract's TSV output; None if it found no words."""
+    confs = []
+    for row in tsv.splitlines()[1:]:
+        cols = row.split("\t")
+        if len(cols) >= 12 and cols[11].strip():
+            try:
+                conf = float(cols[10])
+            except ValueError:
+                continue
+            if conf >= 0:
+                confs.append(conf)
+    return sum(confs) / len(confs) if confs else None
+
+
+class OcrEngine(abc.ABC):
+    name = ""
+
+    @abc.abstractmethod
+    def image_to_string(self, img) -> str:
+        """The text Tesseract reads off `img`."""
+
+    @abc.abstractmethod
+    def recognize(self, img) -> Tuple[str, Optional[float]]:
+        """(text, mean word confidence 0-100 or None if no words) in a single recognition pass."""
+
+    def close(self) -> None:
+        pass
+
+
+class PytesseractEngine(OcrEngine):
+    name = "pytesseract"
+
+    def __init__(self, lang: str = OCR_LANG):
+        self.lang = lang
+
+    def image_to_string(self, img) -> str:
+        return pytesseract.image_to_string(img, lang=self.lang)
+
+    def recognize(self, img) -> Tuple[str, Optional[float]]:
+        # one tesseract run writing both the text and the per-word TSV (what image_to_data parses)
+        text, tsv = pytesseract.run_and_get_multiple_output(img, extensions=["txt", "tsv"], lang=self.lang)
+        return text, mean_confidence(tsv)
+
+
+class TesserocrEngine(OcrEngine):
+    """
+    A pool of tesserocr handles, each with the model loaded once. A handle is not thread-safe, so
+    every call checks one out; handles are created on demand, up to `size`, and kept for reuse.
+    """
+    name = "tesserocr"
+
+    def __init__(self, size: int, lang: str = OCR_LANG):
+        import tesserocr  # optional dependency; ImportError means "use pytesseract"
+
+        self._tesserocr = tesserocr
+        self.lang = lang
+        self.size = max(1, size)
+        self._tessdata = self._tessdata_path()
+        self._free: "queue.LifoQueue" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._free.put(self._new_handle())  # fail now, not on the first page, if the model won't load
+
+    @staticmethod
+    def _tessdata_path() -> Optional[str]:
+        if os.getenv("TESSDATA_PREFIX"):
+            return None  # tesserocr reads it itself
+        bundled = os.path.join(os.path.dirname(TESSERACT_PATH), "tessdata")
+        return bundled if os.path.isdir(bundled) else None
+
+    def _new_handle(self):
+        kwargs = {"lang": self.lang}
+        if self._tessdata:
+            kwargs["path"] = self._tessdata
+        handle = self._tesserocr.PyTessBaseAPI(**kwargs)
+        self._created += 1
+        return handle
+
+    def _checkout(self):
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                return self._new_handle()
+        return self._free.get()
+
+    def image_to_string(self, img) -> str:
+        handle = self._checkout()
+        try:
+            handle.SetImage(img)
+            return handle.GetUTF8Text()
+        finally:
+            handle.Clear()
+            self._free.put(handle)
+
+    def recognize(self, img) -> Tuple[str, Optional[float]]:
+        handle = self._checkout()
+        try:
+            handle.SetImage(img)
+            text = handle.GetUTF8Text()
+            return text, (float(handle.MeanTextConf()) if text.strip() else None)
+        finally:
+            handle.Clear()
+            self._free.put(handle)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._free.get_nowait().End()
+            except queue.Empty:
+                return
+
+
+def create_engine(name: str = OCR_ENGINE, size: int = 1) -> OcrEngine:
+    """The requested engine, or pytesseract if tesserocr is missing or cannot load its model."""
+    if name not in ("auto", "tesserocr", "pytesseract"):
+        raise ValueError(f"Unknown OCR engine: {name}")
+    if name != "pytesseract":
+        try:
+            engine = TesserocrEngine(size)
+            logger.info(f"🧠 OCR engine: tesserocr ({engine.size} pooled handles, lang={engine.lang})")
+            return engine
+        except ImportError:
+            log = logger.warning if name == "tesserocr" else logger.info
+            log("⚠️ tesserocr is not installed; OCR falls back to pytesseract.")
+        except Exception as e:
+            logger.warning(f"⚠️ tesserocr failed to start ({e}); OCR falls back to pytesseract.")
+    return PytesseractEngine()
+
+
+_engine: Optional[OcrEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine(size: int = 1) -> OcrEngine:
+    """This process's shared OCR engine, created on first use with room for `size` concurrent pages."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(OCR_ENGINE, size)
+    return _engine
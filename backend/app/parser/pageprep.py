@@ -0,0 +1,132 @@
+# backend/app/parser/pageprep.py
+"""
+Cheap checks on a rendered page before it reaches Tesseract, so OCR only sees pixels that can hold
+text we parse:
+
+  blank pages  separator pages and near-uniform fills: almost no ink, or almost nothing but ink
+               (OCR_BLANK_INK), or almost no contrast (OCR_BLANK_STDDEV). They are not OCR'd at all.
+  margins      everything else is cropped to the bounding box of its ink, plus a little padding.
+  regions      optional (OCR_REGIONS): once the bank is known, only the boxes where that bank prints
+               its summary and transaction tables are OCR'd, each cropped the same way.
+
+The statistics are taken on a half-size greyscale copy of the page, with NumPy when it is installed
+and Pillow's histogram/ImageStat otherwise; either way it costs ~20 ms a page against seconds of OCR.
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from PIL import ImageStat
+
+try:
+    import numpy as np
+except ImportError:  # optional; Pillow computes the same statistics
+    np = None
+
+logger = logging.getLogger(__name__)
+
+OCR_SKIP_BLANK = os.getenv("OCR_SKIP_BLANK", "1") != "0"
+OCR_CROP_MARGINS = os.getenv("OCR_CROP_MARGINS", "1") != "0"
+OCR_BLANK_INK = float(os.getenv("OCR_BLANK_INK", "0.0001"))     # share of ink pixels below which a page is blank
+OCR_BLANK_STDDEV = float(os.getenv("OCR_BLANK_STDDEV", "1.5"))  # grey-level spread below which a page is uniform
+
+INK_LEVEL = 160      # grey levels (0-255) darker than this are ink
+PROBE_SCALE = 2      # statistics are taken on a 1/PROBE_SCALE copy; more would wash out thin strokes
+CROP_PADDING = 0.01  # white border kept around the ink, as a fraction of the page width
+_INK_LUT = [255] * INK_LEVEL + [0] * (256 - INK_LEVEL)
+
+# (left, top, right, bottom) as fractions of the page
+Box = Tuple[float, float, float, float]
+FULL_PAGE: Box = (0.0, 0.0, 1.0, 1.0)
+
+
+def _load_regions(raw: str) -> Dict[str, List[Box]]:
+    """OCR_REGIONS: JSON {"HDFC": [[0, 0, 1, 0.35], [0, 0.3, 1, 0.95]], ...}; invalid config is ignored."""
+    if not raw:
+        return {}
+    try:
+        regions: Dict[str, List[Box]] = {}
+        for bank, boxes in json.loads(raw).items():
+            regions[bank.upper()] = [tuple(float(v) for v in box) for box in boxes]
+        for bank, boxes in regions.items():
+            for box in boxes:
+                if len(box) != 4 or not (0 <= box[0] < box[2] <= 1 and 0 <= box[1] < box[3] <= 1):
+                    raise ValueError(f"bad box {list(box)} for {bank}")
+        return regions
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"⚠️ Ignoring OCR_REGIONS: {e}")
+        return {}
+
+
+OCR_REGIONS = _load_regions(os.getenv("OCR_REGIONS", ""))
+# identifies the region layout in OCR text cache keys ("" when regions are off)
+REGIONS_TAG = hashlib.sha1(json.dumps(OCR_REGIONS, sort_keys=True).encode()).hexdigest()[:8] if OCR_REGIONS else ""
+
+
+class PageInk(NamedTuple):
+    ink: float                                   # share of ink pixels
+    stddev: float                                # grey-level standard deviation
+    bbox: Optional[Tuple[int, int, int, int]]    # inked area in the image's pixels; None if there is no ink
+
+
+def page_ink(img) -> PageInk:
+    """Ink share, contrast and inked bounding box of a rendered page (or part of one)."""
+    small = img if img.mode == "L" else img.convert("L")
+    if min(small.size) >= PROBE_SCALE * 32:
+        small = small.reduce(PROBE_SCALE)
+    if np is not None:
+        pixels = np.asarray(small)
+        dark = pixels < INK_LEVEL
+        ink, stddev = float(dark.mean()), float(pixels.std())
+        rows, cols = np.flatnonzero(dark.any(axis=1)), np.flatnonzero(dark.any(axis=0))
+        bbox = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1) if rows.size else None
+    else:
+        histogram = small.histogram()
+        ink = sum(histogram[:INK_LEVEL]) / (small.width * small.height)
+        stddev = ImageStat.Stat(histogram).stddev[0]
+        bbox = small.point(_INK_LUT).getbbox()
+    if bbox is not None and small is not img:
+        sx, sy = img.width / small.width, img.height / small.height
+        bbox = (int(bbox[0] * sx), int(bbox[1] * sy),
+                min(img.width, round(bbox[2] * sx)), min(img.height, round(bbox[3] * sy)))
+    return PageInk(ink, stddev, bbox)
+
+
+def is_blank(ink: PageInk) -> bool:
+    """
+    Nothing to read: (almost) no ink on a light page, (almost) no light on a dark fill, or a flat
+    grey that straddles INK_LEVEL. Downscaling has already averaged away isolated scan specks.
+    """
+    return ink.bbox is None or min(ink.ink, 1 - ink.ink) < OCR_BLANK_INK or ink.stddev < OCR_BLANK_STDDEV
+
+
+def _padded(bbox: Tuple[int, int, int, int], size: Tuple[int, int], pad: int) -> Tuple[int, int, int, int]:
+    width, height = size
+    return max(0, bbox[0] - pad), max(0, bbox[1] - pad), min(width, bbox[2] + pad), min(height, bbox[3] + pad)
+
+
+def ocr_crops(img, bank: Optional[str] = None) -> List:
+    """
+    The parts of a rendered page worth OCR'ing, top to bottom: [] for a blank page, otherwise the
+    page cropped to its ink -- or, when OCR_REGIONS has boxes for `bank`, each non-blank box
+    cropped to its ink.
+    """
+    boxes = OCR_REGIONS.get(bank or "") or [FULL_PAGE]
+    if boxes == [FULL_PAGE] and not (OCR_SKIP_BLANK or OCR_CROP_MARGINS):
+        return [img]
+    pad = max(1, round(img.width * CROP_PADDING))
+    crops = []
+    for left, top, right, bottom in boxes:
+        part = img
+        if (left, top, right, bottom) != FULL_PAGE:
+            part = img.crop((round(left * img.width), round(top * img.height),
+                             round(right * img.width), round(bottom * img.height)))
+        ink = page_ink(part)
+        if OCR_SKIP_BLANK and is_blank(ink):
+            continue
+        if OCR_CROP_MARGINS and ink.bbox is not None:
+            part = part.crop(_padded(ink.bbox, part.size, pad))
+        crops.append(part)
+    return crops
@@ -0,0 +1,231 @@
+# backend/app/parser/patterns.py
+"""
+Precompiled regex registry for the bank parsers.
+Every pattern is compiled once at import time and grouped per bank, so the per-line and
+per-field loops in bank_parsers.py never go through re's small compile cache.
+"""
+import re
+from functools import lru_cache
+from typing import Pattern
+
+I = re.IGNORECASE
+
+# ---------------------- shared ----------------------
+COMMON = {
+    "whitespace": re.compile(r"\s+"),
+    "spaces": re.compile(r"[ \t]+"),
+    "digit": re.compile(r"\d"),
+    "four_digits": re.compile(r"\b(\d{4})\b"),
+    "plain_amount": re.compile(r"^\d+(\.\d{1,2})?$"),
+    "number": re.compile(r"(\d+(?:\.\d+)?)"),
+    "currency_prefix": re.compile(r"^(Rs\.?|INR|₹)\s*", I),
+    "month_year": re.compile(r"^([A-Za-z]{3,9})\s+(\d{4})$"),
+    "iso_date": re.compile(r"^(\d{4})-(\d{2})-(\d{2})$"),
+    "iso_date_prefix": re.compile(r"\d{4}-\d{2}-\d{2}"),
+    "iso_month_start_prefix": re.compile(r"\d{4}-\d{2}-01"),
+    "iso_year": re.compile(r"^(\d{4})-"),
+    # date token searched for around a label by find_date_near_label
+    "near_label_date": re.compile(
+        r"([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4}|\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}/\d{1,2}/\d{4})", I
+    ),
+    # utils.find_last4
+    "last4_primary_card": re.compile(r"Primary\s*Card\s*Transactions[-:\s]*([0-9Xx\s\-]{8,})", I),
+    "last4_masked": re.compile(r"([Xx]{2,}[\s\-]*\d{4})"),
+}
+
+NEAR_LABEL_DATE_TOKEN = COMMON["near_label_date"].pattern
+
+
+@lru_cache(maxsize=256)
+def label_pattern(label_regex: str) -> Pattern:
+    """Compiled, case-insensitive pattern for a field label (built once per label)."""
+    return re.compile(label_regex, I)
+
+
+@lru_cache(maxsize=256)
+def label_then_date_pattern(label_regex: str, window_after: int) -> Pattern:
+    """`label` followed within `window_after` chars by a date token (built once per label/window)."""
+    return re.compile(rf"{label_regex}[\s\S]{{0,{window_after}}}{NEAR_LABEL_DATE_TOKEN}", I)
+
+
+# ---------------------- Kotak ----------------------
+KOTAK = {
+    "statement_date": re.compile(r"Statement\s+Date\s+([0-9]{1,2}[-/A-Za-z]+[-/0-9]+)"),
+    "billing_cycle": re.compile(r"Transaction\s+details\s+from\s+([A-Za-z0-9-]+)\s+to\s+([A-Za-z0-9-]+)"),
+    "payment_due_date": re.compile(r"Remember\s*to\s*pay\s*by\s*([0-9]{1,2}[-/][A-Za-z]{3}[-/][0-9]{4})", I),
+    "total_balance": re.compile(r"Total\s+Amount\s+Due.*?Rs\.?\s?([0-9,]+\.\d{2})"),
+    "minimum_due": re.compile(r"Minimum\s+Amount\s+Due.*?Rs\.?\s?([0-9,]+\.\d{2})"),
+}
+
+# ---------------------- ICICI ----------------------
+ICICI = {
+    "last4_masked": re.compile(r"X{4,}\s*(\d{4})"),
+    "last4_label": re.compile(r"(?:Card|Credit|XXXXX|XXXX)\s*[:\-]?\s*(\d{4})", I),
+    "period": re.compile(
+        r"(?:Statement\s+period|Statement\s+Period|Billing\s*Period)\s*[:\-]?\s*([A-Za-z0-9,\s\/\-\']+?)\s*(?:to|[-–])\s*([A-Za-z0-9,\s\/\-\']+?)\b",
+        I,
+    ),
+    "statement_month": re.compile(r"STATEMENT\s+DATE\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{4})", I),
+    "statement_date": re.compile(r"Statement\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2}\s*'?\d{2,4})", I),
+    "billing_cycle": re.compile(
+        r"Statement\s*Period\s*[:\-]?\s*([0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{4})\s*(?:to|-)\s*([0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{4})",
+        I,
+    ),
+    # in order of preference
+    "payment_due_date": [
+        re.compile(r"Payment\s+Due\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})", I),
+        re.compile(r"Payment\s+Due\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})", I),
+        re.compile(r"Pay\s+by\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})", I),
+        re.compile(r"Due\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2},?\s*\d{4})", I),
+        re.compile(r"Payment\s+Due\s+Date\s*[:\-]?\s*([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})", I),
+    ],
+    "total_balance": [
+        re.compile(r"(?:Total\s+Amount\s+due|Total\s+Amount\s+Due|TOTAL\s+AMOUNT\s+DUE)\s*[:\n\r-]*\s*[₹`Rs\.]*\s*([0-9,]+(?:\.\d{1,2})?)", I),
+        re.compile(r"(?:Total\s+Amount\s+due|Total\s+Amount\s+Due)[\s\S]{0,40}?([0-9,]+(?:\.\d{1,2})?)", I),
+    ],
+    "minimum_due": [
+        re.compile(r"(?:Minimum\s+Amount\s+due|Minimum\s+Amount\s+Due|Minimum\s+Amount)\s*[:\n\r-]*\s*[₹`Rs\.]*\s*([0-9,]+(?:\.\d{1,2})?)", I),
+        re.compile(r"Minimum\s+Amount\s+due[\s\S]{0,40}?([0-9,]+(?:\.\d{1,2})?)", I),
+    ],
+}
+
+# ---------------------- Axis ----------------------
+AXIS_DATE_TOKEN = (
+    r"(\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}[\/\-.]\d{1,2}[\/\-.]\d{2,4}|\d{4}-\d{2}-\d{2}"
+    r"|[A-Za-z]{3,9}\s+\d{1,2},?\s*'?\d{2,4}|\b[A-Za-z]{3,9}\s+\d{4}\b)"
+)
+
+# Candidate payment-due labels in order of preference (more specific first)
+_AXIS_DUE_LABELS = [
+    r"Payment\s+Due\s+Date",
+    r"Payment\s+Due\s+On",
+    r"Payment\s+Due",
+    r"Pay\s+by",
+    r"Due\s+Date",
+    r"Last\s+Date\s+for\s+Payment",
+    r"Payment\s+Due\s+Amount",  # sometimes appears but we will extract date near it
+]
+
+AXIS = {
+    "date_dmy": re.compile(r"^(\d{1,2})\s+([A-Za-z]{3,9})\s+'?(\d{2,4})$"),
+    "date_numeric": re.compile(r"^(\d{1,2})[\/\-.](\d{1,2})[\/\-.](\d{2,4})$"),
+    "date_token": re.compile(AXIS_DATE_TOKEN, I),
+    # Date variants handled: "09 Oct '25", "09 Oct 2025", "09/10/2025", "2025-10-09"
+    "tx_date_line": re.compile(
+        r"^(?P<date>\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}[\/\-.]\d{1,2}[\/\-.]\d{2,4}|\d{4}-\d{2}-\d{2})\b",
+        I | re.MULTILINE,
+    ),
+    "tx_date_any": re.compile(r"(\d{1,2}\s+[A-Za-z]{3,9}\s+'?\d{2,4}|\d{1,2}[\/\-.]\d{1,2}[\/\-.]\d{2,4}|\d{4}-\d{2}-\d{2})"),
+    "tx_line_amount": re.compile(r"(?:₹|Rs\.?)\s*([0-9,]+(?:\.[0-9]{1,2})?)", I),
+    "tx_line_amount_strip": re.compile(r"(?:₹|Rs\.?)\s*[0-9,]+(?:\.\d{1,2})?"),
+    "tx_line_credit": re.compile(r"\b(cr|credit|credited|cashback)\b", I),
+    "tx_line_debit": re.compile(r"\b(dr|debit|debited|purchase|spent)\b", I),
+    "tx_amount": re.compile(r"(?:₹|Rs\.?)\s*([0-9,]+(?:\.\d{1,2})?)", I),
+    "tx_amount_suffixed": re.compile(r"([0-9,]+(?:\.\d{1,2})?)\s*(?:Cr|Dr|CR|DR|\bCredit\b|\bDebit\b)"),
+    "tx_type": re.compile(r"\b(Cr|Dr|Credit|Debit|credited|debited)\b", I),
+    "tx_credit_hint": re.compile(r"\b(refund|cashback|credited)\b", I),
+    "tx_debit_hint": re.compile(r"\b(purchase|spent|debited|paid|withdrawal)\b", I),
+    "total_balance": re.compile(
+        r"(?:Total\s+Payment\s+Due|Total\s+Amount\s+Due|Total\s+Due)\s*[:\-]?\s*(?:₹|Rs\.?)?\s*([0-9,]+(?:\.\d{1,2})?)", I
+    ),
+    "minimum_due": re.compile(
+        r"(?:Minimum\s+Payment\s+Due|Minimum\s+Amount\s+Due|Minimum\s+Due)\s*[:\-]?\s*(?:₹|Rs\.?)?\s*([0-9,]+(?:\.\d{1,2})?)", I
+    ),
+    # (label + date on the same line, label then date on the next line, label alone)
+    "payment_due_labels": [
+        (
+            re.compile(rf"{label}\s*[:\-]?\s*{AXIS_DATE_TOKEN}", I),
+            re.compile(rf"{label}\s*[:\-]?\s*[\r\n]+\s*{AXIS_DATE_TOKEN}", I),
+            re.compile(label, I),
+        )
+        for label in _AXIS_DUE_LABELS
+    ],
+    "payment_due_global": [
+        re.compile(rf"(?:Payment\s+Due\s+Date|Payment\s+Due|Due\s+Date)\s*[:\-]?\s*{AXIS_DATE_TOKEN}", I),
+        re.compile(rf"(?:Pay\s+by|Last\s+Date\s+for\s+Payment)\s*[:\-]?\s*{AXIS_DATE_TOKEN}", I),
+        # sometimes the statement shows "Due Date" as a separate line like:
+        # Due Date
+        # 30 Oct 2025
+        re.compile(rf"(?:Due\s+Date)\s*[\r\n]+\s*{AXIS_DATE_TOKEN}", I),
+    ],
+    "statement_month": re.compile(r"Selected\s+Statement\s+Month\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{4})", I),
+    "statement_date": re.compile(r"Statement\s+Date\s*[:\-]?\s*([A-Za-z]{3,9}\s+\d{1,2}\s*'?\d{2,4})", I),
+    "billing_cycle": re.compile(
+        r"(?:Statement\s*period|Statement\s*Period|Billing\s*Cycle)\s*[:\-]?\s*([A-Za-z0-9\/\-\s,'']+?)\s*(?:to|-)\s*([A-Za-z0-9\/\-\s,'']+?)\b",
+        I,
+    ),
+    "billing_from_to": re.compile(r"From\s+([A-Za-z0-9\/\-\s,'']+?)\s+To\s+([A-Za-z0-9\/\-\s,'']+?)\b", I),
+}
+
+# ---------------------- HDFC ----------------------
+HDFC = {
+    "tx_row": re.compile(
+        r"(?P<date>\d{1,2}/\d{1,2}/\d{4})\s*\|?\s*(?:\d{1,2}:\d{2}\s*)?"
+        r"(?P<desc>[A-Za-z0-9\s\.,'&\-\(\)#/]+?)\s+C\s*(?P<amt>[0-9,]+\.\d{2})",
+        re.MULTILINE,
+    ),
+    "tx_leading_number": re.compile(r"^\d+\s+"),
+    "tx_credit_hint": re.compile(r"payment|credit|refund", I),
+    "date_token": re.compile(r"([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})", I),
+    "statement_date_label": re.compile(r"Statement\s*Date", I),
+    "billing_period": re.compile(
+        r"Billing\s*Period\s*(?:[:\-]?\s*)[\n\r\t ]*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})\s*[-–to]+\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})",
+        I,
+    ),
+    # Fallback for flattened text (handles columnar OCR): '.*?' skips intervening text
+    # (like the "Statement Date" value) before the date range.
+    "billing_period_flat": re.compile(
+        r"Billing\s*Period\s*.*?\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})\s*[-–to]+\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})",
+        I,
+    ),
+    "total_balance": re.compile(r"TOTAL\s+AMOUNT\s+DUE\s*(?:\n|:)\s*C?\s*([0-9,]+\.\d{2})", I),
+    "minimum_due": re.compile(r"MINIMUM\s+DUE\s*(?:\n|:)\s*C?\s*([0-9,]+\.\d{2})", I),
+    "payment_due_date": re.compile(
+        r"(?:DUE\s+DATE|Payment\s+Due\s+Date)\s*(?:\n|:)?\s*([0-9]{1,2}\s*[A-Za-z]{3,9},?\s*\d{4})", I
+    ),
+}
+
+# ---------------------- SBI ----------------------
+SBI = {
+    # Handles: "Credit Card Number XXXX XXXX XXXX XX46", even with line breaks between label and digits
+    "last4": re.compile(r"Credit\s*Card\s*Number[\s:\n\r]*X{2,}\s*X{2,}\s*X{2,}\s*X{2,}\s*X{0,2}(\d{2,4})", I),
+    "billing_cycle": re.compile(
+        r"for\s+Statement\s+Period\s*:\s*([0-9]{1,2}\s*[A-Za-z]{3,}\s*[0-9]{2,4})\s*to\s*([0-9]{1,2}\s*[A-Za-z]{3,}\s*[0-9]{2,4})",
+        I,
+    ),
+    "statement_date_label": r"Statement\s*Date",
+    "payment_due_date_label": r"Payment\s*Due\s*Date",
+    "total_balance": re.compile(r"Total\s*Amount\s*Due.*?([0-9,]+\.\d{2})", I | re.DOTALL),
+    "minimum_due": re.compile(r"Minimum\s*Amount\s*Due.*?([0-9,]+\.\d{2})", I | re.DOTALL),
+    # "30 Sep 25 TPS*PHONEPE WALLET MUMBAI MAH 5,150.00 D" (optional C/D/M at end)
+    "tx_row": re.compile(r"(\d{1,2}\s*[A-Za-z]{3}\s*\d{2,4})\s+(.+?)\s+([0-9,]+\.\d{2})\s*([CDM])?$"),
+}
+
+# ---------------------- generic (Kotak, ICICI) ----------------------
+GENERIC = {
+    "tx_row": re.compile(r"(\d{1,2}/\d{1,2}/\d{4})\s+(.*?)\s+([0-9,]+\.\d{2})(?:\s*(Cr))?$"),
+}
+
+# ---------------------- line tokens (lines.py) ----------------------
+LINE = {
+    # a line that starts with a digit, cut into: a leading date ("01/09/2025", "01-09-25",
+    # "2025-09-01", "30 Sep 25", "09 Oct '25"), then either the text up to a trailing amount after
+    # whitespace and the Cr/Dr/C/D/M flag printed after it, or the rest of the line (used with
+    # fullmatch; only one whitespace can precede such a tail, so the greedy body finds it)
+    "tokens": re.compile(
+        r"(?P<date>\d{1,2}[/\-.]\d{1,2}[/\-.]\d{2,4}|\d{4}-\d{2}-\d{2}|\d{1,2}\s*[A-Za-z]{3,9}\s*'?\d{2,4})?"
+        r"(?:(?P<body>.*\s)(?P<amount>[0-9,]+\.\d{2})\s*(?P<flag>Cr|Dr|C|D|M)?|(?P<rest>.*))"
+    ),
+}
+
+# ---------------------- amounts (amounts.py) ----------------------
+AMOUNT = {
+    # optional sign / parentheses, any currency spelling (HDFC's rupee glyph extracts as "C"),
+    # Indian or western digit grouping, any number of decimals, trailing Cr/Dr or SBI's C/D;
+    # a closing parenthesis only after an opening one
+    "amount": re.compile(
+        r"\s*(?P<paren>\()?\s*(?P<neg>-)?\s*(?:(?:Rs\.?|INR|₹|`|C)\s*)?"
+        r"(?P<rupees>\d[\d,]*)(?:\.(?P<frac>\d+))?\s*(?(paren)\))\s*(?P<flag>Cr|Dr|C|D)?\.?\s*",
+        I,
+    ),
+}
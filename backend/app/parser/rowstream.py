@@ -0,0 +1,61 @@
+# backend/app/parser/rowstream.py
+"""
+Transaction rows of a statement read page by page, for stream_parse.
+
+Re-parsing the text read so far after every page costs O(pages²). RowStream instead runs the
+bank's own extractor on a small window per page: the transactions block's header line, the text of
+the last row seen (the next page may continue it), and the new page. The rows of that window,
+less the carried-over row's, are final; the carried row is extracted again with the next page.
+Once the block's end header has been read, later pages are ignored, as the full parse does.
+
+The rows match the full parse's for well-formed statements; stream_parse still parses the whole
+text once at the end and corrects the stream if they differ.
+"""
+from typing import Any, Dict, List, Optional
+
+from .bank_parsers import TX_STREAMS, transaction_block
+from .sections import SectionIndex
+
+
+class RowStream:
+    """One statement's transaction rows, fed a page at a time."""
+
+    def __init__(self, bank: str):
+        self.bank = bank
+        self.extract, self.row_start = TX_STREAMS[bank]
+        self.header: Optional[str] = None  # the block's header line, put at the top of every window
+        self.carry = ""  # the last row's text, which the next page may continue
+        self.ended = False
+
+    def feed(self, page: str) -> List[Dict[str, Any]]:
+        """The rows that are final once `page` has been read, in document order."""
+        if self.ended:
+            return []
+        if self.header is None:
+            block = transaction_block(self.bank, SectionIndex(page, partial=True))
+            if block is None:
+                return []
+            self.header, _, body = page[block[0]:].partition("\n")
+        else:
+            body = f"{self.carry}\n{page}" if self.carry else page
+        window = f"{self.header}\n{body}"
+        sections = SectionIndex(window, partial=True)
+        rows = self.extract(window, sections)
+        block = transaction_block(self.bank, sections)
+        if block is None or block[1] < len(window):
+            self.ended = True  # the block ends on this page
+            return rows
+        self.carry = self._last_row(body)
+        if not self.carry:
+            return rows
+        tail = f"{self.header}\n{self.carry}"
+        held = len(self.extract(tail, SectionIndex(tail, partial=True)))
+        return rows[:len(rows) - held]
+
+    def _last_row(self, body: str) -> str:
+        """`body` from the start of the last line a row begins on ("" if none does)."""
+        lines = body.splitlines()
+        for i in range(len(lines) - 1, -1, -1):
+            if self.row_start.search(lines[i].strip()):
+                return "\n".join(lines[i:])
+        return ""
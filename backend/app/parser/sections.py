@@ -0,0 +1,163 @@
+# backend/app/parser/sections.py
+"""
+Section index built once per document and shared by the parse_* functions.
+
+The parsers used to re-derive the same views of a statement on every call: text[:5000] for the
+summary area, " ".join(text.split()) for column-flattened searches, a lower-cased copy to look
+for transaction headers, and a regex search for the HDFC transaction block. SectionIndex makes
+each of those once, on first use:
+
+    head        the first SUMMARY_HEAD_CHARS characters, where every bank prints its summary
+    flat(name)  whitespace-collapsed view of the whole text, the head, or a section
+    find(h)     first case-insensitive offset of a header phrase (one lower-cased copy, C-level find)
+    span(name)  (start, end) of the "summary", "transactions", "rewards" and "footer" blocks
+    lines       the document tokenized once (lines.tokenize), with its typed row records
+    section_lines(name)  the same for one block; lines_of(span) for any other span
+
+Section bounds come from the header phrases below. The summary scanners prefer hits inside the
+"summary" span, and the Kotak/ICICI and SBI extractors read the "transactions" block's lines.
+That block runs from its header to the end of the document: the footer and rewards phrases are
+printed at the foot of every page of a long statement, between rows, so they can't end it. The
+"rewards" and "footer" spans mark where those blocks first start (after the transactions header).
+Parsers that have their own, stricter idea of where a block starts (Axis's header order, HDFC's
+"Domestic Transactions") ask find() for those phrases instead, so their output is unchanged.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+from .lines import TextLines, tokenize
+
+SUMMARY_HEAD_CHARS = 5000
+
+SECTION_HEADERS: Dict[str, Tuple[str, ...]] = {
+    "transactions": (
+        "transaction summary", "transaction details", "transaction history",
+        "transactions for", "card transactions", "domestic transactions", "international transactions",
+    ),
+    "rewards": ("rewards program points", "reward points"),
+    "footer": ("total outstanding", "important information", "terms and conditions", "schedule of charges"),
+}
+SECTIONS = ("summary", "transactions", "rewards", "footer")
+
+Span = Tuple[int, int]
+
+
+class SectionIndex:
+    """
+    Lazily computed views and block offsets of one statement's text. partial=True says `text` is
+    only the pages read so far, so nothing may be derived from what it lacks (see parse_axis).
+    """
+
+    def __init__(self, text: str, partial: bool = False):
+        self.text = text
+        self.partial = partial
+        self._lower: Optional[str] = None
+        self._first: Dict[str, int] = {}
+        self._spans: Optional[Dict[str, Optional[Span]]] = None
+        self._flat: Dict[str, str] = {}
+        self._lines: Optional[TextLines] = None
+        self._span_lines: Dict[Span, TextLines] = {}
+
+    # ---------------------- views ----------------------
+    @property
+    def head(self) -> str:
+        return self.text[:SUMMARY_HEAD_CHARS]
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            lower = self.text.lower()
+            if len(lower) != len(self.text):
+                # a few characters lower-case to two (e.g. "İ"); keep offsets aligned with text
+                lower = "".join(c if len(c.lower()) != 1 else c.lower() for c in self.text)
+            self._lower = lower
+        return self._lower
+
+    @property
+    def lines(self) -> TextLines:
+        if self._lines is None:
+            self._lines = tokenize(self.text)
+        return self._lines
+
+    def section_lines(self, name: str) -> TextLines:
+        """A section's lines, tokenized once; the whole document's lines if the section is absent."""
+        span = self.span(name)
+        return self.lines_of(span) if span else self.lines
+
+    def lines_of(self, span: Span) -> TextLines:
+        """The lines of text[start:end], tokenized once per span."""
+        lines = self._span_lines.get(span)
+        if lines is None:
+            lines = self._span_lines[span] = tokenize(self.text[span[0]:span[1]])
+        return lines
+
+    def flat(self, name: str = "all") -> str:
+        """" ".join(view.split()) for "all", "head" or a section name ("" if the section is absent)."""
+        flat = self._flat.get(name)
+        if flat is None:
+            flat = self._flat[name] = " ".join(self.view(name).split())
+        return flat
+
+    def view(self, name: str) -> str:
+        if name == "all":
+            return self.text
+        if name == "head":
+            return self.head
+        return self.block(name)
+
+    # ---------------------- headers ----------------------
+    def find(self, header: str, start: int = 0) -> int:
+        """Offset of the first case-insensitive `header` (lower-case) at or after `start`, or -1."""
+        if start:
+            first = self.find(header)
+            return first if first == -1 or first >= start else self.lower.find(header, start)
+        idx = self._first.get(header)
+        if idx is None:
+            idx = self._first[header] = self.lower.find(header)
+        return idx
+
+    def first_of(self, headers: Iterable[str]) -> int:
+        """Offset of the first header in `headers` (in that order of preference) that occurs, or -1."""
+        for header in headers:
+            idx = self.find(header)
+            if idx != -1:
+                return idx
+        return -1
+
+    def earliest(self, headers: Iterable[str], start: int = 0) -> int:
+        """Smallest offset >= `start` at which any of `headers` occurs, or -1."""
+        hits = [i for i in (self.find(h, start) for h in headers) if i != -1]
+        return min(hits) if hits else -1
+
+    # ---------------------- sections ----------------------
+    def span(self, name: str) -> Optional[Span]:
+        """(start, end) of a section, or None if its header isn't in the document."""
+        if self._spans is None:
+            self._spans = self._build_spans()
+        return self._spans[name]
+
+    @property
+    def summary_end(self) -> int:
+        """End of the summary block: the first transactions header, else SUMMARY_HEAD_CHARS."""
+        return self.span("summary")[1]
+
+    def block(self, name: str) -> str:
+        span = self.span(name)
+        return self.text[span[0]:span[1]] if span else ""
+
+    def _build_spans(self) -> Dict[str, Optional[Span]]:
+        n = len(self.text)
+        tx = self.earliest(SECTION_HEADERS["transactions"])
+        # without a transactions header, only look for the later blocks past the summary area
+        after_tx = tx if tx != -1 else min(n, SUMMARY_HEAD_CHARS)
+        rewards = self.earliest(SECTION_HEADERS["rewards"], after_tx)
+        footer = self.earliest(SECTION_HEADERS["footer"], max(after_tx, rewards))
+
+        def _end(*candidates: int) -> int:
+            return min((c for c in candidates if c != -1), default=n)
+
+        return {
+            "summary": (0, tx if tx > 0 else min(n, SUMMARY_HEAD_CHARS)),
+            "transactions": (tx, n) if tx != -1 else None,
+            "rewards": (rewards, _end(footer)) if rewards != -1 else None,
+            "footer": (footer, n) if footer != -1 else None,
+        }
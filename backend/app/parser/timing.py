@@ -0,0 +1,54 @@
+# backend/app/parser/timing.py
+"""
+Per-document stage timers.
+
+A StageTimer travels with one document through extraction and parsing and ends up, as plain
+milliseconds, in the result's "timings" block -- a dict, so it survives the trip back from a
+worker process. The API layer turns those into /metrics histograms (app/metrics.py).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+
+class StageTimer:
+    """
+    Accumulated wall time per stage ("extract", "ocr", "detect", ...), per-item samples ("ocr_page")
+    and plain counts ("ocr_pages", "text_cache_hits", "text_cache_misses", "ocr_cache_hits").
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.samples: Dict[str, List[float]] = {}
+        self.counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def sample(self, name: str, seconds: float) -> None:
+        """Record one item's time (e.g. a page's OCR); safe to call from worker threads."""
+        with self._lock:
+            self.samples.setdefault(name, []).append(seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add to a count (e.g. blank pages skipped); safe to call from worker threads."""
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def as_dict(self) -> Dict[str, object]:
+        """{"extract_ms": 12.3, ..., "ocr_page_ms": [...], "ocr_pages": 2}"""
+        out: Dict[str, object] = {f"{name}_ms": round(s * 1000, 2) for name, s in self.seconds.items()}
+        for name, values in self.samples.items():
+            out[f"{name}_ms"] = [round(v * 1000, 2) for v in values]
+        out.update(self.counts)
+        return out
@@ -0,0 +1,173 @@
+# backend/app/pool.py
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterator, Optional
+
+# Execution mode for CPU-bound parsing:
+#   "process" -> worker processes (scales with cores, default)
+#   "thread"  -> worker threads (keeps the event loop free, still GIL-bound)
+#   "inline"  -> run directly on the event loop (old behaviour, debugging only)
+PARSE_EXECUTION_MODE = os.getenv("PARSE_EXECUTION_MODE", "process").lower()
+PARSE_POOL_SIZE = int(os.getenv("PARSE_POOL_SIZE", "0")) or (os.cpu_count() or 1)
+PARSE_JOB_TIMEOUT = float(os.getenv("PARSE_JOB_TIMEOUT", "120"))  # seconds per job
+PARSE_MAX_QUEUE = int(os.getenv("PARSE_MAX_QUEUE", "0")) or PARSE_POOL_SIZE * 4
+
+
+class PoolOverloaded(Exception):
+    """Raised when more jobs are pending than the pool is allowed to queue."""
+
+
+class ParseTimeout(Exception):
+    """Raised when a job does not finish within the per-job timeout."""
+
+
+@contextmanager
+def time_limit(seconds: float) -> Iterator[None]:
+    """
+    Raise ParseTimeout inside the running job after `seconds`, freeing its worker process.
+    Only works in a pool worker process (SIGALRM in its main thread, where ProcessPoolExecutor runs
+    jobs); in thread and inline mode it does nothing and the caller's own deadline has to do.
+    """
+    if (seconds <= 0 or not hasattr(signal, "setitimer") or multiprocessing.parent_process() is None
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+
+    def _expired(signum, frame):
+        raise ParseTimeout(f"Parsing did not finish within {seconds:g}s")
+
+    previous = signal.signal(signal.SIGALRM, _expired)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _limited(seconds: float, fn: Callable[..., Any], *args: Any) -> Any:
+    """Worker side of ParsePool.run: fn(*args) under time_limit(seconds)."""
+    with time_limit(seconds):
+        return fn(*args)
+
+
+class ParsePool:
+    """
+    Bounded executor for parse jobs.
+    Jobs beyond `max_queue` (running + waiting) are rejected instead of piling up,
+    so callers can shed load with a 503 rather than time out.
+    """
+
+    def __init__(self, mode: str = PARSE_EXECUTION_MODE, size: int = PARSE_POOL_SIZE,
+                 timeout: float = PARSE_JOB_TIMEOUT, max_queue: int = PARSE_MAX_QUEUE):
+        if mode not in ("process", "thread", "inline"):
+            raise ValueError(f"Unknown execution mode: {mode}")
+        self.mode = mode
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.max_queue = max(1, max_queue)
+        self._executor = None
+        self._manager = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        if self._executor is not None or self.mode == "inline":
+            return
+        if self.mode == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.size)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="parse")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def make_queue(self):
+        """
+        A queue the pool's workers can put to: in process mode a proxy from the pool's one Manager
+        process (shared by everyone asking), otherwise a plain queue.Queue.
+        """
+        if self.mode != "process":
+            return queue.Queue()
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.Manager()
+            return self._manager.Queue()
+
+    def _release(self, _fut: Future = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _reserve(self, bounded: bool = True) -> None:
+        with self._lock:
+            if bounded and self._pending >= self.max_queue:
+                raise PoolOverloaded(f"{self._pending} parse jobs pending (limit {self.max_queue})")
+            self._pending += 1
+
+    def submit(self, fn: Callable[..., Any], *args: Any, bounded: bool = True) -> Future:
+        """
+        Queue `fn(*args)` on the pool. Raises PoolOverloaded when the queue is full, unless
+        bounded=False (for callers that cap their own in-flight jobs, like the /jobs queue).
+        """
+        self._reserve(bounded)
+        if self.mode == "inline":
+            fut: Future = Future()
+            try:
+                fut.set_result(fn(*args))
+            except Exception as e:
+                fut.set_exception(e)
+            self._release()
+            return fut
+
+        self.start()
+        try:
+            fut = self._executor.submit(fn, *args)
+        except BrokenProcessPool:
+            # a worker died (e.g. OOM-killed); shut the broken pool down, replace it and retry once
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self.start()
+            try:
+                fut = self._executor.submit(fn, *args)
+            except Exception:
+                self._release()
+                raise
+        except Exception:
+            self._release()
+            raise
+        fut.add_done_callback(self._release)
+        return fut
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run `fn(*args)` on the pool without blocking the event loop.
+        Raises PoolOverloaded if the queue is full and ParseTimeout after `timeout` seconds.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        fut = self.submit(_limited, timeout, fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(fut), timeout=timeout)
+        except asyncio.TimeoutError:
+            # drops the job if it is still queued; in process mode a running job is stopped by
+            # time_limit in its worker, a thread's runs to the end
+            fut.cancel()
+            raise ParseTimeout(f"Parsing did not finish within {timeout:g}s")
+
+
+parse_pool = ParsePool()
@@ -0,0 +1,84 @@
+# backend/app/streaming.py
+import asyncio
+import threading
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from app.parser.extractor import stream_parse, PdfSource
+from app.pool import parse_pool, ParsePool
+
+
+def run_stream(stream_id: str, pdf: PdfSource, digest: Optional[str], event_queue) -> Dict[str, Any]:
+    """Worker entry point: parse one statement, sending each event back as it happens; returns the full result."""
+    try:
+        return stream_parse(pdf, lambda event: event_queue.put((stream_id, event)), digest=digest)
+    finally:
+        event_queue.put((stream_id, None))  # end of this stream's events
+
+
+class EventHub:
+    """
+    Carries parse events from pool workers (threads or processes) to the requests streaming them.
+    Workers put (stream_id, event) on one shared queue; a listener thread hands each event to the
+    asyncio queue of the stream it belongs to. A None event marks the end of a stream.
+    """
+
+    def __init__(self, pool: ParsePool = parse_pool):
+        self.pool = pool
+        self._streams: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = {}
+        self._lock = threading.Lock()
+        self._events = None
+        self._listener: Optional[threading.Thread] = None
+
+    @property
+    def events(self):
+        """The queue to hand to run_stream."""
+        self.start()
+        return self._events
+
+    def start(self) -> None:
+        if self._events is not None:
+            return
+        self._events = self.pool.make_queue()
+        self._listener = threading.Thread(target=self._listen, name="stream-events", daemon=True)
+        self._listener.start()
+
+    def shutdown(self) -> None:
+        if self._events is not None:
+            self._events.put(None)
+            self._listener.join(timeout=5)
+            self._events = None
+
+    def open(self) -> Tuple[str, asyncio.Queue]:
+        """Register a new stream on the running loop; returns its id and the queue its events arrive on."""
+        stream_id = uuid.uuid4().hex
+        events: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            self._streams[stream_id] = (asyncio.get_running_loop(), events)
+        return stream_id, events
+
+    def close(self, stream_id: str) -> None:
+        with self._lock:
+            self._streams.pop(stream_id, None)
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                msg = self._events.get()
+            except (EOFError, OSError):
+                return
+            if msg is None:
+                return
+            stream_id, event = msg
+            with self._lock:
+                target = self._streams.get(stream_id)
+            if target is None:
+                continue  # the client went away; drop the rest of its events
+            loop, events = target
+            try:
+                loop.call_soon_threadsafe(events.put_nowait, event)
+            except RuntimeError:
+                self.close(stream_id)  # its loop is closed
+
+
+event_hub = EventHub()
@@ -0,0 +1,237 @@
+# backend/app/uploads.py
+import hashlib
+import os
+import tempfile
+from typing import AsyncIterator, Callable, Dict, List, Optional, Union
+
+from multipart.multipart import MultipartParser, parse_options_header
+
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", "0")) or 50 * 1024 * 1024  # per PDF
+# uploads up to this size stay in memory; larger ones are spooled to a temp file (0 = always spool)
+UPLOAD_SPOOL_BYTES = int(os.getenv("UPLOAD_SPOOL_BYTES", str(1024 * 1024)))
+UPLOAD_TMP_DIR = os.getenv("UPLOAD_TMP_DIR") or None  # default: the system temp dir
+UPLOAD_CHUNK_BYTES = 256 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised as soon as an upload grows past its size cap."""
+
+
+def too_large_message(max_bytes: int) -> str:
+    size = f"{max_bytes / (1024 * 1024):.0f} MB" if max_bytes >= 1024 * 1024 else f"{max_bytes / 1024:.0f} KB"
+    return f"File is larger than the {size} limit."
+
+
+class SpooledPdf:
+    """
+    An uploaded PDF written in chunks: held in memory while small, rolled over to a named temp file
+    once it passes `spool_bytes`. `source` is what the extractor takes -- the bytes, or the file's
+    path, which worker processes can open (pypdf memory-maps it, poppler reads it directly) without
+    the document being pickled across. The sha256 is computed on the way in.
+    Use as a context manager, or call close(), to delete the temp file.
+    """
+
+    def __init__(self, max_bytes: int = MAX_UPLOAD_BYTES, spool_bytes: int = UPLOAD_SPOOL_BYTES):
+        self.max_bytes = max_bytes
+        self.spool_bytes = spool_bytes
+        self.size = 0
+        self.path: Optional[str] = None
+        self._chunks = []
+        self._file = None
+        self._sha = hashlib.sha256()
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLarge(too_large_message(self.max_bytes))
+        self._sha.update(chunk)
+        if self._file is None and self.size > self.spool_bytes:
+            self._file = tempfile.NamedTemporaryFile(prefix="upload-", suffix=".pdf", dir=UPLOAD_TMP_DIR, delete=False)
+            self.path = self._file.name
+            for c in self._chunks:
+                self._file.write(c)
+            self._chunks = []
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def finish(self) -> None:
+        """Done writing: flush the temp file (if any) so other processes see all of it."""
+        if self._file is not None:
+            self._file.close()
+        elif len(self._chunks) > 1:
+            self._chunks = [b"".join(self._chunks)]
+
+    @property
+    def digest(self) -> str:
+        return self._sha.hexdigest()
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        if self.path is not None:
+            return self.path
+        return self._chunks[0] if self._chunks else b""
+
+    def close(self) -> None:
+        self._chunks = []
+        if self._file is not None:
+            self._file.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+    def __enter__(self) -> "SpooledPdf":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BadUpload(Exception):
+    """Raised when a request body is not a multipart upload carrying the expected file."""
+
+
+class UploadPart:
+    """
+    One file of a multipart body. `spool` holds its bytes; it is None when the part was not stored
+    (its name was refused by the `limit` it was read with, or it went over its cap -- see `error`).
+    """
+    __slots__ = ("field", "filename", "spool", "error")
+
+    def __init__(self, field: str, filename: str, spool: Optional[SpooledPdf]):
+        self.field = field
+        self.filename = filename
+        self.spool = spool
+        self.error: Optional[str] = None
+
+    def close(self) -> None:
+        if self.spool is not None:
+            self.spool.close()
+
+
+class _FormReader:
+    """python-multipart callbacks that write each file part straight into its own SpooledPdf."""
+
+    def __init__(self, limit: Callable[[str], Optional[int]], spool_bytes: int, fail_fast: bool):
+        self.limit = limit
+        self.spool_bytes = spool_bytes
+        self.fail_fast = fail_fast
+        self.done: List[UploadPart] = []
+        self._part: Optional[UploadPart] = None
+        self._headers: Dict[bytes, bytes] = {}
+        self._name = b""
+        self._value = b""
+
+    def callbacks(self) -> Dict[str, Callable]:
+        return {name: getattr(self, name) for name in (
+            "on_part_begin", "on_header_field", "on_header_value", "on_header_end",
+            "on_headers_finished", "on_part_data", "on_part_end",
+        )}
+
+    def on_part_begin(self) -> None:
+        self._part = None
+        self._headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._name.lower()] = self._value
+        self._name = self._value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if b"filename" not in options:
+            return  # a plain form field; nothing reads those
+        field = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options[b"filename"].decode("utf-8", "replace")
+        cap = self.limit(filename)
+        self._part = UploadPart(field, filename, SpooledPdf(cap, self.spool_bytes) if cap else None)
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        part = self._part
+        if part is None or part.spool is None:
+            return
+        try:
+            part.spool.write(data[start:end])
+        except UploadTooLarge as e:
+            # keep reading past it (the next part may be fine) but store nothing more
+            part.close()
+            part.spool, part.error = None, str(e)
+            if self.fail_fast:
+                raise
+
+    def on_part_end(self) -> None:
+        part, self._part = self._part, None
+        if part is not None:
+            if part.spool is not None:
+                part.spool.finish()
+            self.done.append(part)
+
+    def close(self) -> None:
+        """Delete whatever was spooled but not handed out."""
+        for part in self.done + ([self._part] if self._part is not None else []):
+            part.close()
+        self.done, self._part = [], None
+
+
+async def iter_uploads(request, limit: Callable[[str], Optional[int]] = lambda filename: MAX_UPLOAD_BYTES,
+                       spool_bytes: int = UPLOAD_SPOOL_BYTES, fail_fast: bool = False) -> AsyncIterator[UploadPart]:
+    """
+    Read a multipart/form-data body straight off request.stream() and yield each file part as
+    soon as it is complete. Each part goes into its own SpooledPdf while it arrives -- there is no
+    intermediate copy -- capped at limit(filename) bytes; limit() returning None (or 0) discards the
+    part unread. A part over its cap gets `error` set, or with fail_fast raises UploadTooLarge at
+    once, so even a chunked upload (no Content-Length) is cut off at the cap.
+    The caller owns, and must close, every part it receives.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise BadUpload("Expected a multipart/form-data upload.")
+    reader = _FormReader(limit, spool_bytes, fail_fast)
+    parser = MultipartParser(params[b"boundary"], reader.callbacks())
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            while reader.done:
+                yield reader.done.pop(0)
+        parser.finalize()
+        while reader.done:
+            yield reader.done.pop(0)
+    finally:
+        reader.close()
+
+
+async def spool_request(request, field: str = "file", max_bytes: int = MAX_UPLOAD_BYTES,
+                        spool_bytes: int = UPLOAD_SPOOL_BYTES) -> UploadPart:
+    """
+    The PDF in the `field` file field of a multipart request, spooled while the body arrives.
+    A non-PDF file name comes back with spool=None and its bytes are not stored. Raises
+    UploadTooLarge as soon as the file passes `max_bytes` (nothing past the cap is read), and
+    BadUpload if there is no such field.
+    """
+    found: Optional[UploadPart] = None
+    parts = iter_uploads(request, lambda filename: max_bytes if filename.lower().endswith(".pdf") else None,
+                         spool_bytes, fail_fast=True)
+    try:
+        async for part in parts:
+            if found is None and part.field == field:
+                found = part
+            else:
+                part.close()
+    except BaseException:
+        if found is not None:
+            found.close()
+        raise
+    finally:
+        await parts.aclose()
+    if found is None:
+        raise BadUpload(f'Missing the "{field}" file.')
+    return found
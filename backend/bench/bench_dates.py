@@ -0,0 +1,86 @@
+# backend/bench/bench_dates.py
+"""
+Microbenchmark for the date engine against the per-call dateutil / strptime-loop approach it replaced.
+
+    cd backend && python -m bench.bench_dates [--tokens 2000] [--distinct 30]
+
+"cold" clears the LRU before every pass (shape dispatch only); "warm" is the memoised steady state,
+which is what a statement with a few dozen repeating dates sees.
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+
+from dateutil import parser as dateparser
+
+from app.parser import dates
+
+
+def legacy_normalize_date(s):
+    try:
+        return dateparser.parse(s, dayfirst=True, fuzzy=True).date().isoformat()
+    except Exception:
+        return None
+
+
+def _legacy_strptime(s, fmts):
+    for f in fmts:
+        try:
+            return datetime.strptime(s, f).strftime("%Y-%m-%d")
+        except Exception:
+            continue
+    return s
+
+
+def legacy_normalize_date_icici(s):
+    s0 = " ".join(s.strip().replace(".", "").replace(",", "").split())
+    return _legacy_strptime(s0, ("%d %b %Y", "%d %B %Y", "%b %d %Y", "%B %d %Y", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d"))
+
+
+def legacy_normalize_date_hdfc(s):
+    return _legacy_strptime(s.strip().replace(",", ""), ("%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%d-%m-%Y"))
+
+
+CASES = [
+    # name, legacy, engine, token shape
+    ("normalize_date dd/mm/yyyy", legacy_normalize_date, dates.normalize_date, "{d:02d}/09/2025"),
+    ("normalize_date dd-Mon-yyyy", legacy_normalize_date, dates.normalize_date, "{d:02d}-Sep-2025"),
+    ("normalize_date_icici Mon d, yyyy", legacy_normalize_date_icici, dates.normalize_date_icici, "September {d}, 2025"),
+    ("normalize_date_icici dd/mm/yyyy", legacy_normalize_date_icici, dates.normalize_date_icici, "{d:02d}/09/2025"),
+    ("normalize_date_hdfc dd Mon, yyyy", legacy_normalize_date_hdfc, dates.normalize_date_hdfc, "{d:02d} Sep, 2025"),
+    ("normalize_date_hdfc dd/mm/yyyy", legacy_normalize_date_hdfc, dates.normalize_date_hdfc, "{d:02d}/09/2025"),
+]
+
+
+def run(fn, tokens, clear=None) -> float:
+    best = float("inf")
+    for _ in range(3):
+        if clear:
+            clear()
+        start = time.perf_counter()
+        for t in tokens:
+            fn(t)
+        best = min(best, time.perf_counter() - start)
+    return best / len(tokens) * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--tokens", type=int, default=2000, help="date tokens per pass")
+    ap.add_argument("--distinct", type=int, default=30, help="distinct dates among them")
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'case':<36}{'legacy us':>11}{'cold us':>10}{'warm us':>10}{'speedup':>9}")
+    for name, legacy, engine, shape in CASES:
+        tokens = [shape.format(d=1 + rng.randrange(args.distinct) % 28) for _ in range(args.tokens)]
+        assert [legacy(t) for t in tokens] == [engine(t) for t in tokens], name
+        t_legacy = run(legacy, tokens)
+        t_cold = run(engine.__wrapped__, tokens)
+        t_warm = run(engine, tokens)
+        print(f"{name:<36}{t_legacy:>11.2f}{t_cold:>10.2f}{t_warm:>10.2f}{t_legacy / t_warm:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
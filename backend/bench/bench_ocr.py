@@ -0,0 +1,53 @@
+# backend/bench/bench_ocr.py
+"""
+OCR throughput per engine on synthetic scanned pages (no PDF rendering, just recognition).
+
+    cd backend && python -m bench.bench_ocr [--pages 16] [--threads 4] [--engines tesserocr,pytesseract]
+
+Each engine OCRs the same pages on `--threads` threads, the way the extractor does; pages/sec is
+reported per engine and per thread. Engines that are not installed are skipped.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.parser.ocr import create_engine
+from bench.samples import BANKS, page_images, statement_pages
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", type=int, default=16)
+    ap.add_argument("--threads", type=int, default=4)
+    ap.add_argument("--engines", default="tesserocr,pytesseract")
+    args = ap.parse_args()
+
+    pages = []
+    for i in range(args.pages):
+        pages.append(statement_pages(BANKS[i % len(BANKS)], 40, 1, seed=i)[0])
+    images = page_images(pages)
+
+    print(f"{'engine':<14}{'pages/s':>10}{'per thread':>12}{'chars':>10}")
+    for name in [e.strip() for e in args.engines.split(",") if e.strip()]:
+        engine = create_engine(name, args.threads)
+        if engine.name != name:
+            print(f"{name:<14}  not available (not installed)")
+            continue
+        try:
+            try:
+                engine.image_to_string(images[0])  # warm-up: model load is a one-off per handle
+            except Exception as e:
+                print(f"{name:<14}  not available: {e}")
+                continue
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.threads) as pool:
+                texts = list(pool.map(engine.image_to_string, images))
+            elapsed = time.perf_counter() - start
+        finally:
+            engine.close()
+        rate = len(images) / elapsed
+        print(f"{name:<14}{rate:>10.2f}{rate / args.threads:>12.2f}{sum(map(len, texts)):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# backend/bench/bench_parsers.py
+"""
+Time each bank parser on synthetic statement text.
+
+    cd backend && python -m bench.bench_parsers [--transactions 200] [--repeat 50]
+"""
+import argparse
+import time
+
+from app.parser import bank_parsers
+from bench.samples import BANKS, statement_text
+
+PARSERS = {
+    "KOTAK": bank_parsers.parse_kotak,
+    "ICICI": bank_parsers.parse_icici,
+    "AXIS": bank_parsers.parse_axis,
+    "HDFC": bank_parsers.parse_hdfc,
+    "SBI": bank_parsers.parse_sbi,
+}
+
+
+def time_call(fn, arg, repeat: int) -> float:
+    """Best-of-3 mean seconds per call."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn(arg)
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--transactions", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=50)
+    args = ap.parse_args()
+
+    print(f"{'bank':<8}{'parse_* ms':>12}{'detect+parse ms':>18}")
+    for bank in BANKS:
+        text = statement_text(bank, args.transactions)
+        t_parse = time_call(PARSERS[bank], text, args.repeat)
+        t_detect = time_call(bank_parsers.detect_bank_and_parse, text, args.repeat)
+        print(f"{bank:<8}{t_parse * 1000:>12.3f}{t_detect * 1000:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
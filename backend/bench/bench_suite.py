@@ -0,0 +1,191 @@
+# backend/bench/bench_suite.py
+"""
+End-to-end benchmark: every bank's statement through detection, its parse_* function and the full
+PDF pipeline, digital and image-only, with throughput, peak memory and a baseline comparison.
+
+    cd backend && python -m bench.bench_suite [--transactions 200] [--pages 3] [--repeat 20]
+    python -m bench.bench_suite --save-baseline bench/baseline.json      # on the base branch
+    python -m bench.bench_suite --baseline bench/baseline.json           # on the change
+
+Cases per bank:
+    detect       detect_bank_and_parse on the statement text
+    parse        the bank's parse_* function on the same text
+    pdf          parse_pdf_bytes on a digital PDF of it (pypdf extraction + parsing)
+    pdf_summary  the same with mode="summary" (stops at the page with the header fields)
+    pdf_image    parse_pdf_bytes on an image-only PDF (poppler + Tesseract); skipped when either is missing
+
+Times are the best-of-3 mean per call; peak memory is tracemalloc's high-water mark for one call
+(Python allocations only -- poppler and Tesseract run as subprocesses). The page text cache is
+disabled so every PDF call really extracts. With --baseline, any case slower or hungrier than the
+baseline by more than --tolerance is flagged and the exit status is 1. Baselines are machine
+specific: record one and compare against it on the same box.
+"""
+import argparse
+import json
+import platform
+import shutil
+import sys
+import time
+import tracemalloc
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+import pytesseract
+
+from app.parser import extractor
+from app.parser.bank_parsers import detect_bank_and_parse
+from app.parser.cache import ResultCache
+from app.parser.ocr import get_engine
+from bench.bench_parsers import PARSERS, time_call
+from bench.samples import BANKS, statement_pdf, statement_text
+
+def ocr_available() -> bool:
+    if shutil.which("pdftoppm") is None and extractor._poppler_path() is None:
+        return False
+    if get_engine(extractor.OCR_WORKERS).name == "tesserocr":
+        return True
+    try:
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def peak_kb(fn: Callable[[Any], Any], arg: Any) -> float:
+    tracemalloc.start()
+    try:
+        fn(arg)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(fn: Callable[[Any], Dict[str, Any]], arg: Any, repeat: int,
+             expect_bank: Optional[str] = None) -> Dict[str, Any]:
+    """Time `fn(arg)`; `expect_bank` means fn returns {"bank", "fields"}, otherwise it returns the fields."""
+    result = fn(arg)
+    seconds = time_call(fn, arg, repeat)
+    fields = (result.get("fields") or {}) if expect_bank else result
+    txs = len(fields.get("transactions") or [])
+    return {
+        "ms": round(seconds * 1000, 3),
+        "per_sec": round(1 / seconds, 1) if seconds else 0.0,
+        "tx_per_sec": round(txs / seconds) if seconds else 0,
+        "peak_kb": round(peak_kb(fn, arg), 1),
+        "bank_ok": result.get("bank") == expect_bank if expect_bank else None,
+        "transactions": txs,
+    }
+
+
+def run_suite(banks: List[str], transactions: int, pages: int, repeat: int, image: Optional[bool] = None,
+              image_repeat: int = 1) -> Dict[str, Any]:
+    """{"meta": {...}, "results": {"KOTAK/detect": {"ms", "per_sec", "tx_per_sec", "peak_kb", ...}, ...}}"""
+    extractor.text_cache = ResultCache(max_items=0, path="")  # measure extraction, not the cache
+    if image is None:
+        image = ocr_available()
+    results: Dict[str, Dict[str, Any]] = {}
+    for bank in banks:
+        text = statement_text(bank, transactions)
+        results[f"{bank}/detect"] = run_case(detect_bank_and_parse, text, repeat, bank)
+        results[f"{bank}/parse"] = run_case(PARSERS[bank], text, repeat)
+        pdf = statement_pdf(bank, transactions, pages)
+        results[f"{bank}/pdf"] = run_case(extractor.parse_pdf_bytes, pdf, max(3, repeat // 4), bank)
+        results[f"{bank}/pdf_summary"] = run_case(partial(extractor.parse_pdf_bytes, mode="summary"), pdf, repeat, bank)
+        if image:
+            scan = statement_pdf(bank, transactions, pages, image=True)
+            results[f"{bank}/pdf_image"] = run_case(extractor.parse_pdf_bytes, scan, image_repeat, bank)
+    return {
+        "meta": {
+            "transactions": transactions,
+            "pages": pages,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Names of cases (with the metric) that got worse than the baseline by more than `tolerance`."""
+    regressions = []
+    for name, now in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for metric in ("ms", "peak_kb"):
+            if base[metric] and now[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f"{name} {metric}")
+        if base.get("bank_ok") and not now["bank_ok"]:
+            regressions.append(f"{name} bank")
+    return regressions
+
+
+def _delta(now: float, base: Optional[float]) -> str:
+    if not base:
+        return ""
+    return f"{(now - base) / base * 100:+.0f}%"
+
+
+def _bank(ok: Optional[bool]) -> str:
+    return "-" if ok is None else "ok" if ok else "MISS"
+
+
+def report(current: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    base_results = (baseline or {}).get("results", {})
+    print(f"{'case':<18}{'ms':>10}{'Δ':>7}{'docs/s':>10}{'tx/s':>10}{'peak KB':>10}{'Δ':>7}  bank")
+    for name, r in current["results"].items():
+        base = base_results.get(name, {})
+        print(f"{name:<18}{r['ms']:>10.3f}{_delta(r['ms'], base.get('ms')):>7}{r['per_sec']:>10.1f}"
+              f"{r['tx_per_sec']:>10}{r['peak_kb']:>10.1f}{_delta(r['peak_kb'], base.get('peak_kb')):>7}"
+              f"  {_bank(r['bank_ok'])} ({r['transactions']} tx)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m bench.bench_suite", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--banks", default=",".join(BANKS), help="comma-separated subset of " + ",".join(BANKS))
+    ap.add_argument("--transactions", type=int, default=200)
+    ap.add_argument("--pages", type=int, default=3)
+    ap.add_argument("--repeat", type=int, default=20, help="calls per timing pass (digital PDF cases use a quarter)")
+    ap.add_argument("--image", action=argparse.BooleanOptionalAction, default=None,
+                    help="run the image-only PDF cases (default: when poppler and Tesseract are installed)")
+    ap.add_argument("--image-repeat", type=int, default=1)
+    ap.add_argument("--baseline", help="baseline JSON to compare against")
+    ap.add_argument("--save-baseline", help="write this run's results as a baseline JSON")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown / memory growth (default: 0.2)")
+    args = ap.parse_args(argv)
+
+    banks = [b.strip().upper() for b in args.banks.split(",") if b.strip()]
+    unknown = [b for b in banks if b not in BANKS]
+    if unknown:
+        ap.error(f"unknown bank(s): {', '.join(unknown)}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        meta = baseline.get("meta", {})
+        if (meta.get("transactions"), meta.get("pages")) != (args.transactions, args.pages):
+            print(f"❌ Baseline was recorded with --transactions {meta.get('transactions')} "
+                  f"--pages {meta.get('pages')}; rerun with the same sizes.", file=sys.stderr)
+            return 2
+
+    current = run_suite(banks, args.transactions, args.pages, max(1, args.repeat), args.image, max(1, args.image_repeat))
+    report(current, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"💾 Baseline written to {args.save_baseline}")
+    if baseline is not None:
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            return 1
+        print(f"✅ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+# backend/bench/samples.py
+"""
+Synthetic statements per bank, shaped like what pypdf extracts from real statements: as plain text,
+as a digital PDF (real text objects, what pypdf reads) or as an image-only PDF (one raster per page,
+what a scanned statement looks like and what sends the extractor to OCR).
+Used by the benchmarks; the numbers are made up and deterministic.
+"""
+import io
+import random
+from typing import List, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+BANKS = ["KOTAK", "ICICI", "AXIS", "HDFC", "SBI"]
+
+MERCHANTS = [
+    "AMAZON PAY INDIA", "SWIGGY BANGALORE", "ZOMATO GURGAON", "UBER INDIA", "FLIPKART INTERNET",
+    "BIGBASKET", "IRCTC RAIL", "BOOKMYSHOW", "APOLLO PHARMACY", "INDIAN OIL PETROL",
+]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def _amount(rng: random.Random) -> str:
+    return f"{rng.randint(50, 250000) / 100:,.2f}"
+
+
+def _rows(bank: str, n: int, rng: random.Random) -> List[str]:
+    rows = []
+    for i in range(n):
+        day = 1 + i % 28
+        merchant = rng.choice(MERCHANTS)
+        amt = _amount(rng)
+        credit = rng.random() < 0.1
+        if bank in ("KOTAK", "ICICI"):
+            rows.append(f"{day:02d}/09/2025 {merchant} {amt}{' Cr' if credit else ''}")
+        elif bank == "AXIS":
+            rows.append(f"{day:02d} Sep '25 {merchant} ₹ {amt} {'Cr' if credit else 'Dr'}")
+        elif bank == "HDFC":
+            rows.append(f"{day:02d}/09/2025 | {10 + i % 12}:{i % 60:02d} {merchant} C {amt}")
+        else:
+            rows.append(f"{day:02d} Sep 25 {merchant} {amt} {'C' if credit else 'D'}")
+    return rows
+
+
+def statement_parts(bank: str, n_transactions: int = 20, seed: int = 0) -> Tuple[List[str], List[str], List[str]]:
+    """(summary lines, transaction rows, footer lines) of a synthetic statement for `bank`."""
+    rng = random.Random(seed)
+    rows = _rows(bank, n_transactions, rng)
+    total, minimum = _amount(rng), _amount(rng)
+    if bank == "KOTAK":
+        head = [
+            "Kotak Mahindra Bank Credit Card Statement",
+            "Primary Card Transactions- 4166 XXXX XXXX 8253",
+            "Statement Date 21-Sep-2025",
+            "Transaction details from 22-Aug-2025 to 21-Sep-2025",
+            f"Total Amount Due Rs. {total}",
+            f"Minimum Amount Due Rs. {minimum}",
+            "Remember to pay by 09-Oct-2025",
+        ]
+        tail = ["End of statement"]
+    elif bank == "ICICI":
+        head = [
+            "ICICI Bank Credit Card Statement",
+            "Card Number 4375 XXXX XXXX 1234",
+            "Statement Date October 14, 2025",
+            "Statement period : September 15, 2025 to October 14, 2025",
+            "Payment Due Date : November 1, 2025",
+            f"Total Amount due ₹ {total}",
+            f"Minimum Amount due ₹ {minimum}",
+            "Transaction Details",
+        ]
+        tail = ["Please pay on time to avoid late payment charges"]
+    elif bank == "AXIS":
+        head = [
+            "Axis Bank Credit Card Statement",
+            "Card No: 5329 XXXX XXXX 4321",
+            "Selected Statement Month: Sep 2025",
+            "Statement Period: 01 Sep '25 to 30 Sep '25",
+            f"Total Payment Due ₹ {total}",
+            f"Minimum Payment Due ₹ {minimum}",
+            "Payment Due Date",
+            "20 Oct '25",
+            "Transaction Details",
+        ]
+        tail = ["End of Statement"]
+    elif bank == "HDFC":
+        head = [
+            "HDFC Bank Millennia Credit Card Statement",
+            "Card No 5522 XXXX XXXX 9876",
+            "Statement Date 30 Sep, 2025",
+            "Billing Period 01 Sep, 2025 - 30 Sep, 2025",
+            "TOTAL AMOUNT DUE",
+            f"C {total}",
+            "MINIMUM DUE",
+            f"C {minimum}",
+            "DUE DATE",
+            "20 Oct, 2025",
+            "Domestic Transactions",
+        ]
+        tail = ["Rewards Program Points", "Opening Balance 1,200"]
+    elif bank == "SBI":
+        head = [
+            "SBI Card Monthly Statement",
+            "Credit Card Number XXXX XXXX XXXX XX46",
+            "for Statement Period : 01 Sep 25 to 30 Sep 25",
+            "Statement Date 30 Sep 2025",
+            "Payment Due Date 20 Oct 2025",
+            f"Total Amount Due {total}",
+            f"Minimum Amount Due {minimum}",
+            "TRANSACTIONS FOR JOHN DOE",
+        ]
+        tail = ["Important: Schedule of charges"]
+    else:
+        raise ValueError(f"Unknown bank: {bank}")
+    return head, rows, tail
+
+
+def statement_text(bank: str, n_transactions: int = 20, seed: int = 0) -> str:
+    """Plain text of a synthetic statement for `bank` with `n_transactions` rows."""
+    head, rows, tail = statement_parts(bank, n_transactions, seed)
+    return "\n".join(head + rows + tail)
+
+
+# printed at the foot of every page, so on a long statement it falls between transaction rows
+PAGE_FOOTER = "Important Information: Terms and Conditions apply. Page {page} of {pages}"
+
+
+def statement_pages(bank: str, n_transactions: int = 20, pages: int = 1, seed: int = 0) -> List[List[str]]:
+    """
+    The statement's lines split over `pages` pages: summary first, rows spread evenly, the closing
+    lines last, and PAGE_FOOTER at the foot of each page.
+    """
+    head, rows, tail = statement_parts(bank, n_transactions, seed)
+    pages = max(1, pages)
+    per_page = -(-len(rows) // pages) if rows else 0
+    out = [rows[i * per_page:(i + 1) * per_page] for i in range(pages)]
+    out[0] = head + out[0]
+    out[-1] = out[-1] + tail
+    return [lines + [PAGE_FOOTER.format(page=i + 1, pages=pages)] for i, lines in enumerate(out)]
+
+
+# ---------------------- digital PDF ----------------------
+# A hand-written PDF with one Helvetica text object per line. WinAnsi has no rupee sign, so it is
+# drawn as byte 0x80 and mapped back to U+20B9 through a ToUnicode CMap, like real statements do.
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 in points
+FONT_SIZE, LEADING, MARGIN = 9, 12, 40
+RUPEE_CODE = b"\x80"
+
+TO_UNICODE = b"""/CIDInit /ProcSet findresource begin
+12 dict begin
+begincmap
+/CMapName /SyntheticWinAnsi def
+/CMapType 2 def
+1 begincodespacerange
+<00> <FF>
+endcodespacerange
+1 beginbfrange
+<20> <7E> <0020>
+endbfrange
+1 beginbfchar
+<80> <20B9>
+endbfchar
+endcmap
+CMapName currentdict /CMap defineresource pop
+end
+end"""
+
+
+def _pdf_string(line: str) -> bytes:
+    raw = line.replace("₹", "\x00").encode("ascii", "replace").replace(b"\x00", RUPEE_CODE)
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _content_stream(lines: List[str]) -> bytes:
+    ops = [b"BT", b"/F1 %d Tf" % FONT_SIZE, b"%d TL" % LEADING, b"%d %d Td" % (MARGIN, PAGE_HEIGHT - MARGIN)]
+    for line in lines:
+        ops.append(_pdf_string(line) + b" '")
+    ops.append(b"ET")
+    return b"\n".join(ops)
+
+
+def _stream(body: bytes) -> bytes:
+    return b"<< /Length %d >>\nstream\n" % len(body) + body + b"\nendstream"
+
+
+def write_pdf(objects: List[bytes]) -> bytes:
+    """Serialise objects 1..n (object 1 the catalog) into a PDF with a correct xref table."""
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % i + obj + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.writelines(b"%010d 00000 n \n" % off for off in offsets)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def text_pdf(pages: List[List[str]]) -> bytes:
+    """A digital PDF with one page per list of lines."""
+    # 1 catalog, 2 pages, 3 font, 4 ToUnicode, then (page, contents) per page
+    kids = [5 + 2 * i for i in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(pages)),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding /ToUnicode 4 0 R >>",
+        _stream(TO_UNICODE),
+    ]
+    for kid, lines in zip(kids, pages):
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % (PAGE_WIDTH, PAGE_HEIGHT, kid + 1)
+        )
+        objects.append(_stream(_content_stream(lines)))
+    return write_pdf(objects)
+
+
+# ---------------------- image-only PDF ----------------------
+IMAGE_DPI = 150
+IMAGE_FONT_PX = 20
+
+
+def _font() -> ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", IMAGE_FONT_PX)
+    except OSError:
+        return ImageFont.load_default()  # tiny bitmap font: OCR quality suffers, timing still holds
+
+
+def page_images(pages: List[List[str]], dpi: int = IMAGE_DPI) -> List[Image.Image]:
+    """Each page as a greyscale raster of its lines, like a scan rendered at `dpi`."""
+    font = _font()
+    width, height = PAGE_WIDTH * dpi // 72, PAGE_HEIGHT * dpi // 72
+    line_px = int(IMAGE_FONT_PX * 1.5)
+    margin = MARGIN * dpi // 72
+    images = []
+    for lines in pages:
+        img = Image.new("L", (width, max(height, 2 * margin + line_px * len(lines))), 255)
+        draw = ImageDraw.Draw(img)
+        for i, line in enumerate(lines):
+            draw.text((margin, margin + i * line_px), line, fill=0, font=font)
+        images.append(img)
+    return images
+
+
+def image_pdf(pages: List[List[str]], dpi: int = IMAGE_DPI) -> bytes:
+    """A scanned-looking PDF: each page a greyscale raster of its lines, no text layer."""
+    images = page_images(pages, dpi)
+    buf = io.BytesIO()
+    images[0].save(buf, "PDF", resolution=dpi, save_all=True, append_images=images[1:])
+    return buf.getvalue()
+
+
+def statement_pdf(bank: str, n_transactions: int = 20, pages: int = 1, image: bool = False, seed: int = 0) -> bytes:
+    """A synthetic `bank` statement as PDF bytes, digital or (image=True) image-only."""
+    split = statement_pages(bank, n_transactions, pages, seed)
+    return image_pdf(split) if image else text_pdf(split)
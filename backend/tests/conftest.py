@@ -0,0 +1,44 @@
+# backend/tests/conftest.py
+from functools import partial
+
+import pytest
+
+from app.parser import extractor
+from app.parser.cache import ResultCache
+
+
+@pytest.fixture
+def no_text_cache(monkeypatch):
+    """Every parse reads its pages, rather than text a previous test cached."""
+    cache = ResultCache(max_items=0, path="")
+    monkeypatch.setattr(extractor, "text_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def text_cache(monkeypatch):
+    """An empty in-memory text cache, for tests of what a parse leaves in it."""
+    cache = ResultCache(max_items=64, path="")
+    monkeypatch.setattr(extractor, "text_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def client(monkeypatch, no_text_cache):
+    """
+    A TestClient on the app with the result cache off, parsing on an inline ParsePool (no worker
+    processes; tests that need another pool patch main.parse_pool again).
+    """
+    from fastapi.testclient import TestClient
+
+    from app import batch, main
+    from app.parser import cache
+    from app.pool import ParsePool
+
+    results = ResultCache(max_items=0, path="")
+    for module in (main, batch, cache):
+        monkeypatch.setattr(module, "result_cache", results)
+    pool = ParsePool(mode="inline")
+    monkeypatch.setattr(main, "parse_pool", pool)
+    monkeypatch.setattr(main, "parse_batch", partial(batch.parse_batch, pool=pool))
+    return TestClient(main.app)
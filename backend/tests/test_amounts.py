@@ -0,0 +1,54 @@
+# backend/tests/test_amounts.py
+import pytest
+
+from app.parser.amounts import format_paise, money, parse_amount, parse_amounts, to_decimal, to_paise
+from app.parser.columnar import transaction_sink
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("1,234.5", ("₹1234.50", 123450)),
+    ("1,23,456.00", ("₹123456.00", 12345600)),
+    ("₹ 1,23,456.00 Cr", ("₹123456.00", -12345600)),
+    ("(12.00)", ("-₹12.00", -1200)),
+    ("1.005", ("₹1.01", 101)),
+    ("12.00)", ("", None)),
+    ("abc", ("", None)),
+    ("", ("", None)),
+    (None, ("", None)),
+])
+def test_money(raw, expected):
+    assert money(raw) == expected
+
+
+def test_money_credit_is_negative():
+    assert money("5.00", "", credit=True) == ("5.00", -500)
+    assert money("-5.00", "", credit=True) == ("-5.00", -500)
+
+
+def test_parse_amount_flags():
+    assert parse_amount("Rs. 1,234.50 Dr") == (123450, False)
+    assert parse_amount("INR 1234.5") == (123450, None)
+    assert parse_amount("2,000.00 Cr") == (200000, True)
+    assert parse_amount("-3.10") == (-310, None)
+    assert parse_amount("twelve") is None
+
+
+def test_batch_and_format():
+    assert parse_amounts(["1.00", None, "x", "2,000.00 Cr"]) == [100, None, None, 200000]
+    assert format_paise(-5) == "-₹0.05"
+    assert format_paise(123450, "") == "1234.50"
+    assert str(to_decimal("1,234.5")) == "1234.50"
+
+
+@pytest.mark.parametrize("raw", ["1,234.50", "1,,2.00", "0.05", "1.5.50", ",5.00", "12.5", "1,234.50 Cr", " 1.00"])
+def test_batch_fast_path_matches_to_paise(raw):
+    assert parse_amounts([raw]) == [to_paise(raw)]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_add_rows_converts_amounts_like_money(columnar):
+    sink = transaction_sink(columnar, "₹")
+    sink.add_rows(["2025-09-01", "2025-09-02", None], ["A", "B", "C"], ["1,234.50", "5.00", "x"], ["Debit", "Credit", ""])
+    rows = sink.to_dicts() if columnar else list(sink)
+    assert [(r["amount"], r["amount_paise"]) for r in rows] == [
+        money("1,234.50"), money("5.00", credit=True), ("", None)]
@@ -0,0 +1,114 @@
+# backend/tests/test_batch.py
+import asyncio
+import io
+import json
+import time
+import zipfile
+from functools import partial
+
+import pytest
+
+from app import batch, main
+from app.batch import BatchFile, parse_batch
+from app.parser.cache import ResultCache
+from app.pool import ParsePool
+from bench.samples import statement_pdf
+
+
+def _zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buf.getvalue()
+
+
+def _lines(r):
+    return [json.loads(line) for line in r.text.splitlines()]
+
+
+def _slow_parse(*args):
+    time.sleep(0.5)
+
+
+def _collect(files, **kw):
+    async def run():
+        return [item async for item in parse_batch(files, **kw)]
+    return sorted(asyncio.run(run()))
+
+
+def test_batch_streams_a_line_per_file_then_a_summary(client):
+    archive = _zip({"sep.pdf": statement_pdf("AXIS", 4), "notes.txt": b"hello", "__MACOSX/._sep.pdf": b"", "dir/": b""})
+    files = [
+        ("files", ("sbi.pdf", statement_pdf("SBI", 3), "application/pdf")),
+        ("files", ("bills.zip", archive, "application/zip")),
+        ("files", ("photo.png", b"\x89PNG", "image/png")),
+        ("other", ("ignored.pdf", statement_pdf("ICICI", 1), "application/pdf")),
+    ]
+    r = client.post("/parse-batch", files=files)
+    assert r.status_code == 200 and r.headers["content-type"] == "application/x-ndjson"
+    *results, done = _lines(r)
+    by_file = {line["file"]: line for line in results}
+    assert sorted(line["index"] for line in results) == [0, 1, 2, 3]
+    assert by_file["sbi.pdf"]["bank"] == "SBI" and len(by_file["sbi.pdf"]["fields"]["transactions"]) == 3
+    assert by_file["bills.zip/sep.pdf"]["bank"] == "AXIS"
+    assert by_file["bills.zip/notes.txt"] == {"index": 2, "file": "bills.zip/notes.txt", "success": False,
+                                              "error": batch.UNSUPPORTED_FILE_ERROR}
+    assert by_file["photo.png"]["error"] == batch.UNSUPPORTED_FILE_ERROR
+    assert {k: done[k] for k in ("done", "files", "succeeded", "failed")} == {
+        "done": True, "files": 4, "succeeded": 2, "failed": 2}
+
+
+def test_bad_zip_and_unreadable_pdf_fail_only_their_own_line(client):
+    files = [
+        ("files", ("broken.zip", b"PK not really", "application/zip")),
+        ("files", ("garbage.pdf", b"%PDF-1.4 garbage", "application/pdf")),
+        ("files", ("hdfc.pdf", statement_pdf("HDFC", 2), "application/pdf")),
+    ]
+    *results, done = _lines(client.post("/parse-batch", files=files))
+    by_file = {line["file"]: line for line in results}
+    assert by_file["broken.zip"]["error"] == "Not a valid ZIP archive."
+    assert by_file["garbage.pdf"]["success"] is False
+    assert by_file["hdfc.pdf"]["success"] is True
+    assert (done["succeeded"], done["failed"]) == (1, 2)
+
+
+def test_batch_over_the_file_limit_is_413(client, monkeypatch):
+    monkeypatch.setattr(main, "collect_files", partial(batch.collect_files, max_files=2))
+    archive = _zip({f"{i}.pdf": statement_pdf("SBI", 1) for i in range(3)})
+    r = client.post("/parse-batch", files=[("files", ("three.zip", archive, "application/zip"))])
+    assert r.status_code == 413 and r.json() == {"error": "A batch may contain at most 2 files."}
+
+
+def test_batch_without_files_is_422(client):
+    r = client.post("/parse-batch", files=[("file", ("s.pdf", statement_pdf("SBI", 1), "application/pdf"))])
+    assert r.status_code == 422 and "files" in r.json()["error"]
+
+
+@pytest.fixture
+def slow_parse(monkeypatch):
+    monkeypatch.setattr(batch, "parse_pdf", _slow_parse)
+    monkeypatch.setattr(batch, "result_cache", ResultCache(max_items=0, path=""))
+
+
+@pytest.mark.usefixtures("slow_parse")
+def test_file_timeout_fails_that_file():
+    pool = ParsePool(mode="thread", size=2)
+    try:
+        results = _collect([BatchFile("slow.pdf", b"%PDF-1"), BatchFile("bad.txt", None, "rejected")],
+                           file_timeout=0.05, pool=pool)
+    finally:
+        pool.shutdown()
+    assert [(r.name, r.error) for r in results] == [
+        ("slow.pdf", "Parsing did not finish within 0.05s"), ("bad.txt", "rejected")]
+
+
+@pytest.mark.usefixtures("slow_parse")
+def test_batch_timeout_reports_unfinished_files():
+    pool = ParsePool(mode="thread", size=1)
+    try:
+        results = _collect([BatchFile(f"{i}.pdf", b"%%PDF-%d" % i) for i in range(2)],
+                           timeout=0.1, concurrency=1, pool=pool)
+    finally:
+        pool.shutdown()
+    assert [r.error for r in results] == ["Batch did not finish within 0.1s"] * 2
@@ -0,0 +1,43 @@
+# backend/tests/test_cache.py
+from app.parser.cache import ResultCache, content_key, document_digest
+from app.parser.extractor import parse_pdf
+from bench.samples import statement_pdf
+
+
+def test_memory_round_trip_and_lru():
+    cache = ResultCache(max_items=2, ttl=60, path="")
+    cache.put("a", {"x": 1})
+    cache.put("b", {"x": 2})
+    assert cache.get("a") == {"x": 1}  # now most recently used
+    cache.put("c", {"x": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"x": 1} and cache.get("c") == {"x": 3}
+    assert cache.stats()["hits"] == 3 and cache.stats()["misses"] == 1
+
+
+def test_expired_entries_miss():
+    cache = ResultCache(max_items=4, ttl=-1, path="")
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+
+def test_sqlite_tier_round_trips_a_parse_result(tmp_path):
+    pdf = statement_pdf("SBI", 12)
+    result = parse_pdf(pdf)
+    result.pop("timings")
+    key = content_key(pdf)
+    path = str(tmp_path / "cache.db")
+    ResultCache(max_items=0, ttl=60, path=path).put(key, result)
+
+    restarted = ResultCache(max_items=4, ttl=60, path=path)
+    assert restarted.get(key) == result
+    assert restarted.stats()["disk_hits"] == 1
+    assert restarted.get(key) == result  # now from memory
+    assert restarted.stats()["disk_hits"] == 1
+
+
+def test_digest_is_the_same_for_bytes_and_path(tmp_path):
+    pdf = statement_pdf("AXIS", 3)
+    path = tmp_path / "s.pdf"
+    path.write_bytes(pdf)
+    assert document_digest(pdf) == document_digest(str(path))
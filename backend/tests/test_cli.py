@@ -0,0 +1,53 @@
+# backend/tests/test_cli.py
+import json
+
+from app.cli import run
+from bench.samples import statement_pdf
+
+
+def _write_pdfs(folder, banks):
+    folder.mkdir(exist_ok=True)
+    for i, bank in enumerate(banks):
+        (folder / f"{i}_{bank.lower()}.pdf").write_bytes(statement_pdf(bank, 8, seed=i))
+
+
+def _records(out):
+    with open(out, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_rerun_resumes_from_the_checkpoint(tmp_path):
+    pdfs = tmp_path / "pdfs"
+    out = str(tmp_path / "out.jsonl")
+    _write_pdfs(pdfs, ["SBI", "AXIS"])
+    stats = run([str(pdfs)], out, workers=1, progress_every=60)
+    assert (stats["found"], stats["skipped"], stats["parsed"], stats["failed"]) == (2, 0, 2, 0)
+
+    # a rerun after more files arrive parses only the new one
+    _write_pdfs(pdfs, ["SBI", "AXIS", "HDFC"])
+    stats = run([str(pdfs)], out, workers=1, progress_every=60)
+    assert (stats["found"], stats["skipped"], stats["parsed"]) == (3, 2, 1)
+    records = _records(out)
+    assert sorted(r["bank"] for r in records) == ["AXIS", "HDFC", "SBI"]
+    assert len({r["file"] for r in records}) == 3
+
+    stats = run([str(pdfs)], out, workers=1, fresh=True, progress_every=60)
+    assert (stats["skipped"], stats["parsed"]) == (0, 3)
+    assert len(_records(out)) == 3
+
+
+def test_files_missing_from_the_checkpoint_are_parsed_again(tmp_path):
+    # as after a crash: the output was written but only one file made it into the checkpoint
+    pdfs = tmp_path / "pdfs"
+    out = str(tmp_path / "out.jsonl")
+    _write_pdfs(pdfs, ["KOTAK", "ICICI"])
+    run([str(pdfs)], out, workers=1, progress_every=60)
+    checkpoint = tmp_path / "out.jsonl.checkpoint"
+    first = checkpoint.read_text(encoding="utf-8").splitlines()[0]
+    checkpoint.write_text(first + "\n", encoding="utf-8")
+
+    stats = run([str(pdfs)], out, workers=1, progress_every=60)
+    assert (stats["skipped"], stats["parsed"]) == (1, 1)
+    records = _records(out)
+    assert len(records) == 3  # at least once: the unrecorded file's result is written again
+    assert set(checkpoint.read_text(encoding="utf-8").splitlines()) == {r["file"] for r in records}
@@ -0,0 +1,37 @@
+# backend/tests/test_dates.py
+import pytest
+
+from app.parser.dates import normalize_date, normalize_date_hdfc, normalize_date_icici
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("21-Sep-2025", "2025-09-21"),
+    ("07/11/2025", "2025-11-07"),  # day first
+    ("30 Sep 25", "2025-09-30"),
+    ("", None),
+])
+def test_normalize_date(raw, expected):
+    assert normalize_date(raw) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("14 Oct, 2025", "2025-10-14"),
+    ("October 14 2025", "2025-10-14"),
+    ("14/10/2025", "2025-10-14"),
+    ("Oct 2025", "2025-10-01"),
+    ("garbage", "garbage"),  # unparseable input comes back stripped
+    ("", ""),
+])
+def test_normalize_date_icici(raw, expected):
+    assert normalize_date_icici(raw) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("14 Oct, 2025", "2025-10-14"),
+    ("15/09/2025", "2025-09-15"),
+    ("15-09-2025", "2025-09-15"),
+    (" ", ""),
+    ("nope", "nope"),
+])
+def test_normalize_date_hdfc(raw, expected):
+    assert normalize_date_hdfc(raw) == expected
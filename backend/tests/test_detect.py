@@ -0,0 +1,24 @@
+# backend/tests/test_detect.py
+import pytest
+
+from app.parser.bank_parsers import detect_bank_and_parse
+from app.parser.detect import DETECT_HEAD_CHARS, detect_bank
+from bench.samples import BANKS, statement_text
+
+
+@pytest.mark.parametrize("bank", BANKS)
+def test_detects_each_bank(bank):
+    assert detect_bank(statement_text(bank, 10)) == (bank, 1.0)
+    assert detect_bank_and_parse(statement_text(bank, 10))["bank"] == bank
+
+
+@pytest.mark.parametrize("text", ["", "hello", "random text SBI merchant"])
+def test_unknown(text):
+    assert detect_bank(text) == ("UNKNOWN", 0.0)
+
+
+def test_past_the_head_only_strong_fingerprints_count():
+    filler = "Statement of account\n" + "\n" * DETECT_HEAD_CHARS
+    assert detect_bank(filler + "Payments to HDFC BANK LTD")[0] == "HDFC"
+    # a bare "KOTAK" that deep in is a merchant ("KOTAK LIFE INSURANCE"), not the issuer
+    assert detect_bank(filler + "01/10/2025 KOTAK LIFE INSURANCE 100.00") == ("UNKNOWN", 0.0)
@@ -0,0 +1,167 @@
+# backend/tests/test_jobs.py
+import threading
+import time
+
+import pytest
+
+from app import jobs, main
+from app.parser.cache import ResultCache
+from app.parser.extractor import parse_pdf
+from app.pool import ParsePool, PoolOverloaded
+from bench.samples import statement_pdf
+
+pytestmark = pytest.mark.usefixtures("no_text_cache")
+
+
+@pytest.fixture
+def results(monkeypatch):
+    cache = ResultCache(max_items=0, path="")
+    monkeypatch.setattr(jobs, "result_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def thread_pool():
+    pool = ParsePool(mode="thread", size=2)
+    yield pool
+    pool.shutdown()
+
+
+def _wait(queue, job, status="done", seconds=5.0):
+    deadline = time.monotonic() + seconds
+    while queue.get(job.id).status != status:
+        assert time.monotonic() < deadline, f"job still {job.status} ({job.error})"
+        time.sleep(0.01)
+    return job
+
+
+def _blocking_parse(release: threading.Event):
+    def parse(pdf, progress=None, digest=None):
+        progress("extract", 1, 2)
+        release.wait(5)
+        return {"bank": "SBI", "fields": {}}
+    return parse
+
+
+@pytest.mark.usefixtures("results")
+def test_job_result_is_the_parse_result(thread_pool):
+    queue = jobs.JobQueue(pool=thread_pool)
+    pdf = statement_pdf("ICICI", 40, pages=2)
+    try:
+        job = _wait(queue, queue.submit(pdf))
+    finally:
+        queue.shutdown()
+    expected = parse_pdf(pdf)
+    expected.pop("timings")
+    assert job.result == expected and job.timings["total_ms"] > 0
+
+
+@pytest.mark.usefixtures("results")
+def test_running_job_reports_page_progress(monkeypatch, thread_pool):
+    release = threading.Event()
+    monkeypatch.setattr(jobs, "parse_pdf", _blocking_parse(release))
+    queue = jobs.JobQueue(pool=thread_pool)
+    try:
+        job = queue.submit(b"%PDF")
+        deadline = time.monotonic() + 5
+        while job.page == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert job.to_dict()["progress"] == {"stage": "extract", "page": 1, "pages": 2}
+        assert job.status == "running"
+        release.set()
+        _wait(queue, job)
+    finally:
+        release.set()
+        queue.shutdown()
+
+
+def test_cached_result_makes_a_finished_job(monkeypatch, thread_pool):
+    cache = ResultCache(max_items=8, path="")
+    monkeypatch.setattr(jobs, "result_cache", cache)
+    pdf = statement_pdf("SBI", 3)
+    cache.put(jobs.content_key(pdf), {"bank": "SBI", "fields": {"last4": "1234"}})
+    queue = jobs.JobQueue(pool=thread_pool)
+    try:
+        job = queue.submit(pdf)
+    finally:
+        queue.shutdown()
+    assert job.status == "done" and job.result["fields"] == {"last4": "1234"}
+
+
+@pytest.mark.usefixtures("results")
+def test_at_most_workers_jobs_run_and_pending_jobs_are_capped(monkeypatch, thread_pool):
+    release = threading.Event()
+    monkeypatch.setattr(jobs, "parse_pdf", _blocking_parse(release))
+    queue = jobs.JobQueue(pool=thread_pool, workers=1, max_pending=2)
+    try:
+        first, second = queue.submit(b"%PDF-1"), queue.submit(b"%PDF-2")
+        _wait(queue, first, "running")
+        assert second.status == "queued"
+        with pytest.raises(PoolOverloaded):
+            queue.submit(b"%PDF-3")
+        release.set()
+        _wait(queue, first)
+        _wait(queue, second)
+    finally:
+        release.set()
+        queue.shutdown()
+
+
+@pytest.mark.usefixtures("results")
+def test_failed_parse_fails_the_job(monkeypatch, thread_pool):
+    def broken(pdf, progress=None, digest=None):
+        raise ValueError("not a PDF")
+
+    monkeypatch.setattr(jobs, "parse_pdf", broken)
+    queue = jobs.JobQueue(pool=thread_pool)
+    try:
+        job = _wait(queue, queue.submit(b"nonsense"), "failed")
+    finally:
+        queue.shutdown()
+    assert job.error == "Parsing failed: not a PDF"
+
+
+@pytest.mark.usefixtures("results")
+def test_job_over_its_timeout_is_failed(monkeypatch, thread_pool):
+    release = threading.Event()
+    monkeypatch.setattr(jobs, "parse_pdf", _blocking_parse(release))
+    queue = jobs.JobQueue(pool=thread_pool, timeout=0.05)
+    try:
+        job = _wait(queue, queue.submit(b"%PDF"), "failed")
+        release.set()
+        time.sleep(0.05)
+        assert queue.get(job.id).status == "failed"  # the late result doesn't revive it
+    finally:
+        release.set()
+        queue.shutdown()
+    assert job.error == "Parsing did not finish within 0.05s"
+
+
+@pytest.mark.usefixtures("results")
+def test_finished_jobs_expire(thread_pool):
+    queue = jobs.JobQueue(pool=thread_pool, ttl=0)
+    try:
+        job = queue.submit(b"nonsense")
+        deadline = time.monotonic() + 5
+        while job.finished_at is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.01)
+        assert queue.get(job.id) is None
+    finally:
+        queue.shutdown()
+
+
+def test_jobs_endpoints(client, monkeypatch, results):
+    queue = jobs.JobQueue(pool=main.parse_pool)
+    monkeypatch.setattr(main, "job_queue", queue)
+    try:
+        r = client.post("/jobs", files={"file": ("s.pdf", statement_pdf("HDFC", 10), "application/pdf")})
+        assert r.status_code == 202 and r.json()["success"] is True
+        body = client.get(f"/jobs/{r.json()['job_id']}", params={"timings": "true"}).json()
+    finally:
+        queue.shutdown()
+    assert body["status"] == "done" and body["bank"] == "HDFC"
+    assert len(body["fields"]["transactions"]) == 10
+    assert body["timings"]["cache"] == "miss"
+    r = client.get("/jobs/unknown")
+    assert r.status_code == 404 and r.json() == {"error": "Job not found or expired."}
@@ -0,0 +1,61 @@
+# backend/tests/test_lines.py
+import pytest
+
+from app.parser.bank_parsers import (
+    extract_sbi_transactions,
+    extract_transactions,
+    extract_transactions_axis,
+    extract_transactions_hdfc,
+)
+from app.parser.lines import tokenize
+
+
+@pytest.mark.parametrize("line, tokens", [
+    ("01/09/2025 AMAZON PAY 1,234.50 Cr", ("01/09/2025", " AMAZON PAY ", "1,234.50", "Cr")),
+    ("30 Sep 25 TPS*PHONEPE WALLET 5,150.00 D", ("30 Sep 25", " TPS*PHONEPE WALLET ", "5,150.00", "D")),
+    ("09 Oct '25 ZOMATO ₹ 1,492.63 Dr", ("09 Oct '25", " ZOMATO ₹ ", "1,492.63", "Dr")),
+    ("2025-10-09 UBER ₹ 1,492.63", ("2025-10-09", " UBER ₹ ", "1,492.63", "")),
+    ("01/09/2025 | 10:00 IRCTC RAIL", ("01/09/2025", " | 10:00 IRCTC RAIL", "", "")),
+    ("01/09/2025 1.00 2.00", ("01/09/2025", " 1.00 ", "2.00", "")),
+    ("12 items", ("", "12 items", "", "")),
+])
+def test_records(line, tokens):
+    (record,) = tokenize(f"Header\n  {line}  \n").records
+    assert (record.index, record.text) == (1, line)
+    assert (record.date, record.body, record.amount, record.flag) == tokens
+
+
+def test_only_digit_led_lines_are_typed():
+    lines = tokenize("Statement\n\n01/09/2025 A 1.00\r\nTotal 5.00\n")
+    assert lines.texts == ["Statement", "", "01/09/2025 A 1.00", "Total 5.00"]
+    assert [r.index for r in lines.records] == [2]
+
+
+def test_generic_and_sbi_rows_follow_their_row_patterns():
+    text = "\n".join([
+        "01/09/2025 AMAZON 1,234.50",
+        "02/09/2025 REFUND 10.00 Cr",
+        "03/09/2025 FEE 5.00 Dr",        # Dr isn't a Kotak/ICICI flag
+        "04/09/25 SHORT YEAR 5.00",
+        "30 Sep 25 PHONEPE 5,150.00 D",
+        "01 Oct 25 PAYMENT 100.00 C",
+        "01 Sept 25 LONG MONTH 1.00 D",  # SBI months are three letters
+    ])
+    assert [(t["date"], t["description"], t["amount_paise"]) for t in extract_transactions(text)] == [
+        ("2025-09-01", "AMAZON", 123450), ("2025-09-02", "REFUND", -1000)]
+    assert [(t["date"], t["description"], t["amount_paise"]) for t in extract_sbi_transactions(text)] == [
+        ("2025-09-30", "PHONEPE", 515000), ("2025-10-01", "PAYMENT", -10000)]
+
+
+def test_axis_rows_start_at_column_zero_and_run_to_the_next_date_line():
+    text = "Transaction Details\n09 Oct '25 ZOMATO\nGURGAON ₹ 1,492.63 Dr\n  10 Oct '25 indented\n11 Oct '25 REFUND ₹ 5.00 Cr\n"
+    assert [(t["date"], t["description"], t["amount_paise"]) for t in extract_transactions_axis(text)] == [
+        ("2025-10-09", "ZOMATO GURGAON", 149263), ("2025-10-11", "REFUND", -500)]
+
+
+def test_hdfc_rows_wrap_and_may_share_the_header_line():
+    text = ("Domestic Transactions 01/09/2025 | 10:00 IRCTC C 1,987.43\n"
+            "02/09/2025 | 11:00 AMAZON\nPAY INDIA C 500.00\n"
+            "03/09/2025 REFUND C 20.00\nTotal Outstanding")
+    assert [(t["date"], t["description"], t["amount_paise"]) for t in extract_transactions_hdfc(text)] == [
+        ("2025-09-01", "IRCTC", 198743), ("2025-09-02", "AMAZON PAY INDIA", 50000), ("2025-09-03", "REFUND", -2000)]
@@ -0,0 +1,101 @@
+# backend/tests/test_metrics.py
+import threading
+
+from app.metrics import CACHE_LOOKUPS, DOCUMENTS, STAGE_SECONDS, Counter, Histogram, observe_parse
+from app.parser import extractor
+from app.parser.timing import StageTimer
+from bench.samples import statement_pdf
+
+
+def _lookups():
+    return {(cache, result): CACHE_LOOKUPS.value(cache=cache, result=result)
+            for cache in ("result", "text", "ocr_page") for result in ("hit", "miss")}
+
+
+def _delta(before, after):
+    return {key: n - before[key] for key, n in after.items() if n != before[key]}
+
+
+def test_stage_timer_is_safe_across_threads():
+    timer = StageTimer()
+
+    def work():
+        for _ in range(2000):
+            timer.sample("ocr_page", 0.001)
+            timer.count("ocr_pages")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    timings = timer.as_dict()
+    assert len(timings["ocr_page_ms"]) == timings["ocr_pages"] == 16000
+
+
+def test_counter_and_histogram_render():
+    counter = Counter("c_total", "A counter.", labels=["bank"])
+    counter.inc(bank="SBI")
+    counter.inc(2, bank="SBI")
+    assert counter.render()[2:] == ['c_total{bank="SBI"} 3']
+    hist = Histogram("h_seconds", "A histogram.", buckets=(0.1, 1))
+    hist.observe(0.05)
+    hist.observe(5)
+    assert hist.render()[2:] == ['h_seconds_bucket{le="0.1"} 1', 'h_seconds_bucket{le="1"} 1',
+                                 'h_seconds_bucket{le="+Inf"} 2', "h_seconds_sum 5.050000", "h_seconds_count 2"]
+
+
+def test_observe_parse_records_stages_and_cache_lookups():
+    before, docs, ocr_seconds = _lookups(), DOCUMENTS.value(ocr="yes"), STAGE_SECONDS._series.get(("ocr_page",))
+    ocr_count = ocr_seconds[-1] if ocr_seconds else 0
+    result = {"bank": "SBI", "fields": {}, "timings": {
+        "total_ms": 40.0, "ocr_page_ms": [10.0, 12.0], "text_cache_misses": 1, "ocr_cache_hits": 1, "ocr_pages": 2}}
+    timings = observe_parse(result, cached=False)
+    assert "timings" not in result and timings["ocr_pages"] == 2
+    assert _delta(before, _lookups()) == {
+        ("result", "miss"): 1, ("text", "miss"): 1, ("ocr_page", "hit"): 1, ("ocr_page", "miss"): 2}
+    assert DOCUMENTS.value(ocr="yes") == docs + 1
+    assert STAGE_SECONDS._series[("ocr_page",)][-1] == ocr_count + 2
+
+
+def test_page_ocr_cache_counts(monkeypatch, text_cache):
+    ocr_calls = []
+
+    def fake_ocr(pdf, page_nos, **kw):
+        ocr_calls.append(page_nos)
+        return {p: f"page {p}" for p in page_nos}
+
+    monkeypatch.setattr(extractor, "ocr_pdf_pages", fake_ocr)
+    first, second = StageTimer(), StageTimer()
+    extractor._ocr_pages_cached(b"%PDF", "digest", [1, 2], timer=first)
+    assert extractor._ocr_pages_cached(b"%PDF", "digest", [1, 2, 3], timer=second) == {
+        1: "page 1", 2: "page 2", 3: "page 3"}
+    assert ocr_calls == [[1, 2], [3]]
+    assert first.counts == {"ocr_pages": 2}
+    assert second.counts == {"ocr_cache_hits": 2, "ocr_pages": 1}
+
+
+def test_document_text_cache_counts(text_cache):
+    pdf = statement_pdf("ICICI", 5)
+    assert extractor.parse_pdf(pdf)["timings"]["text_cache_misses"] == 1
+    timings = extractor.parse_pdf(pdf)["timings"]
+    assert timings["text_cache_hits"] == 1 and "text_cache_misses" not in timings
+
+
+def test_metrics_endpoint(client, text_cache):
+    before = _lookups()
+    pdf = statement_pdf("SBI", 5)
+    for _ in range(2):
+        r = client.post("/parse", files={"file": ("s.pdf", pdf, "application/pdf")})
+        assert r.status_code == 200
+    # the result cache is off in tests, so the second parse is answered from the text cache
+    assert _delta(before, _lookups()) == {("result", "miss"): 2, ("text", "miss"): 1, ("text", "hit"): 1}
+
+    r = client.get("/metrics")
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = r.text.splitlines()
+    assert "# TYPE surefinance_cache_lookups_total counter" in lines
+    hits = CACHE_LOOKUPS.value(cache="text", result="hit")
+    assert f'surefinance_cache_lookups_total{{cache="text",result="hit"}} {hits:g}' in lines
+    assert any(line.startswith('surefinance_parse_stage_seconds_count{stage="total"}') for line in lines)
+    assert any(line.startswith('surefinance_request_seconds_count{endpoint="/parse"}') for line in lines)
@@ -0,0 +1,108 @@
+# backend/tests/test_ocr.py
+import sys
+import types
+
+import pytest
+
+from app.parser import ocr
+
+
+class FakeHandle:
+    """A PyTessBaseAPI stand-in: reads back whatever string it was given as the image."""
+    ended = 0
+
+    def __init__(self, lang, path=None):
+        self.lang = lang
+        self.img = None
+
+    def SetImage(self, img):
+        self.img = img
+
+    def GetUTF8Text(self):
+        return self.img
+
+    def MeanTextConf(self):
+        return 91
+
+    def Clear(self):
+        self.img = None
+
+    def End(self):
+        FakeHandle.ended += 1
+
+
+@pytest.fixture
+def fake_tesserocr(monkeypatch):
+    module = types.SimpleNamespace(PyTessBaseAPI=FakeHandle)
+    monkeypatch.setitem(sys.modules, "tesserocr", module)
+    return module
+
+
+@pytest.fixture
+def no_tesserocr(monkeypatch):
+    monkeypatch.setitem(sys.modules, "tesserocr", None)  # import raises ImportError
+
+
+def test_engine_is_abstract():
+    with pytest.raises(TypeError):
+        ocr.OcrEngine()
+
+    class TextOnly(ocr.OcrEngine):
+        def image_to_string(self, img):
+            return ""
+
+    with pytest.raises(TypeError):
+        TextOnly()
+
+
+@pytest.mark.parametrize("name", ["auto", "tesserocr"])
+def test_tesserocr_is_preferred_when_installed(fake_tesserocr, name):
+    engine = ocr.create_engine(name, size=2)
+    assert isinstance(engine, ocr.TesserocrEngine) and engine.size == 2
+    assert engine.image_to_string("01/09/2025 A 1.00") == "01/09/2025 A 1.00"
+    assert engine.recognize("text") == ("text", 91.0)
+    assert engine.recognize("  ") == ("  ", None)
+
+
+def test_pytesseract_is_chosen_by_name(fake_tesserocr):
+    assert isinstance(ocr.create_engine("pytesseract"), ocr.PytesseractEngine)
+
+
+@pytest.mark.parametrize("name", ["auto", "tesserocr"])
+def test_falls_back_to_pytesseract_without_tesserocr(no_tesserocr, name):
+    assert isinstance(ocr.create_engine(name), ocr.PytesseractEngine)
+
+
+def test_falls_back_to_pytesseract_when_the_model_will_not_load(monkeypatch, fake_tesserocr):
+    def broken(**kwargs):
+        raise RuntimeError("Failed to init API, possibly an invalid tessdata path")
+
+    monkeypatch.setattr(fake_tesserocr, "PyTessBaseAPI", broken)
+    assert isinstance(ocr.create_engine("auto"), ocr.PytesseractEngine)
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        ocr.create_engine("easyocr")
+
+
+def test_handles_are_created_on_demand_up_to_size(fake_tesserocr):
+    engine = ocr.TesserocrEngine(size=2)
+    assert engine._created == 1  # loaded up front
+    first, second = engine._checkout(), engine._checkout()
+    assert engine._created == 2 and first is not second
+    engine._free.put(first)
+    assert engine._checkout() is first  # reused, not a third handle
+    engine._free.put(first)
+    engine._free.put(second)
+    ended = FakeHandle.ended
+    engine.close()
+    assert FakeHandle.ended == ended + 2
+
+
+def test_get_engine_is_created_once_per_process(monkeypatch, fake_tesserocr):
+    monkeypatch.setattr(ocr, "_engine", None)
+    monkeypatch.setattr(ocr, "OCR_ENGINE", "auto")
+    engine = ocr.get_engine(4)
+    assert isinstance(engine, ocr.TesserocrEngine) and engine.size == 4
+    assert ocr.get_engine(1) is engine
@@ -0,0 +1,83 @@
+# backend/tests/test_ocr_pages.py
+import pytest
+from PIL import Image
+
+from app.parser import extractor
+from app.parser.ocr import OcrEngine
+from app.parser.timing import StageTimer
+
+# mean word confidence Tesseract gives each page, at the low and the high DPI
+CONFIDENCE = {1: {150: 90.0, 300: 95.0}, 2: {150: 50.0, 300: 80.0}, 3: {150: 40.0, 300: 30.0}, 4: {150: None, 300: 60.0}}
+
+
+class FakeEngine(OcrEngine):
+    """Reads back which page and DPI it was shown, with that rendering's confidence."""
+    name = "fake"
+
+    def __init__(self):
+        self.seen = []
+
+    def image_to_string(self, img) -> str:
+        self.seen.append((img.info["page"], img.info["dpi"]))
+        return f"page {img.info['page']} at {img.info['dpi']}"
+
+    def recognize(self, img):
+        return self.image_to_string(img), CONFIDENCE[img.info["page"]][img.info["dpi"]]
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    def render(path, dpi, poppler_path=None, first_page=1, last_page=1, thread_count=1):
+        images = []
+        for page in range(first_page, last_page + 1):
+            img = Image.new("L", (40, 40), 255)
+            img.info.update(page=page, dpi=dpi)
+            images.append(img)
+        return images
+
+    engine = FakeEngine()
+    monkeypatch.setattr(extractor, "convert_from_path", render)
+    monkeypatch.setattr(extractor, "get_engine", lambda size=1: engine)
+    monkeypatch.setattr(extractor, "ocr_crops", lambda img, bank=None: [img])
+    return engine
+
+
+@pytest.fixture
+def adaptive(monkeypatch):
+    monkeypatch.setattr(extractor, "OCR_ADAPTIVE", True)
+    monkeypatch.setattr(extractor, "OCR_LOW_DPI", 150)
+    monkeypatch.setattr(extractor, "OCR_HIGH_DPI", 300)
+    monkeypatch.setattr(extractor, "OCR_MIN_CONFIDENCE", 75.0)
+
+
+@pytest.mark.usefixtures("adaptive")
+def test_only_low_confidence_pages_are_rerendered(engine):
+    timer = StageTimer()
+    pages = extractor.ocr_pdf_pages(b"%PDF", [1, 2, 3, 4], timer=timer)
+    assert pages == {
+        1: "page 1 at 150",  # confident at low DPI: rendered once
+        2: "page 2 at 300",  # re-rendered, and more confident
+        3: "page 3 at 150",  # re-rendered, but the low-DPI reading was better
+        4: "page 4 at 300",  # no words at low DPI
+    }
+    assert sorted(dpi for page, dpi in engine.seen if page == 1) == [150]
+    assert timer.counts["ocr_rerendered"] == 3
+    assert len(timer.samples["ocr_page"]) == 7
+
+
+def test_fixed_dpi_renders_each_page_once(monkeypatch, engine):
+    monkeypatch.setattr(extractor, "OCR_ADAPTIVE", False)
+    assert extractor.ocr_pdf_pages(b"%PDF", [1, 2]) == {1: f"page 1 at {extractor.OCR_DPI}",
+                                                          2: f"page 2 at {extractor.OCR_DPI}"}
+    assert engine.seen == [(1, extractor.OCR_DPI), (2, extractor.OCR_DPI)]
+
+
+@pytest.mark.usefixtures("adaptive")
+def test_pages_ocr_fails_on_are_left_out(monkeypatch, engine):
+    def recognize(img):
+        if img.info["page"] == 2:
+            raise RuntimeError("tesseract crashed")
+        return FakeEngine.recognize(engine, img)
+
+    monkeypatch.setattr(engine, "recognize", recognize)
+    assert extractor.ocr_pdf_pages(b"%PDF", [1, 2]) == {1: "page 1 at 150"}
@@ -0,0 +1,94 @@
+# backend/tests/test_pageprep.py
+import pytest
+from PIL import Image, ImageDraw
+
+from app.parser import extractor, pageprep
+from app.parser.pageprep import is_blank, ocr_crops, page_ink
+from app.parser.timing import StageTimer
+
+
+def _page(fill=255, ink=(), size=(400, 600)):
+    """A greyscale page of `fill`, with a black rectangle at each (left, top, right, bottom) of `ink`."""
+    img = Image.new("L", size, fill)
+    draw = ImageDraw.Draw(img)
+    for box in ink:
+        draw.rectangle(box, fill=0)
+    return img
+
+
+@pytest.mark.parametrize("img", [
+    _page(),                        # white separator page
+    _page(fill=0),                  # solid black fill
+    _page(fill=150),                # flat grey just on the ink side of INK_LEVEL
+    _page(ink=[(200, 300, 200, 300)]),  # a lone scan speck, averaged away by the downscale
+], ids=["white", "black", "grey", "speck"])
+def test_blank_pages_are_not_ocrd(img):
+    assert is_blank(page_ink(img))
+    assert ocr_crops(img) == []
+
+
+def test_page_is_cropped_to_its_ink_plus_padding():
+    img = _page(ink=[(100, 200, 299, 249)])
+    ink = page_ink(img)
+    assert not is_blank(ink)
+    assert ink.bbox == (100, 200, 300, 250)
+    (crop,) = ocr_crops(img)
+    pad = round(img.width * pageprep.CROP_PADDING)
+    assert crop.size == (200 + 2 * pad, 50 + 2 * pad)
+
+
+def test_colour_pages_are_measured_in_grey():
+    img = _page(ink=[(10, 10, 49, 29)]).convert("RGB")
+    assert page_ink(img).bbox == (10, 10, 50, 30)
+
+
+def test_checks_can_be_turned_off(monkeypatch):
+    monkeypatch.setattr(pageprep, "OCR_SKIP_BLANK", False)
+    monkeypatch.setattr(pageprep, "OCR_CROP_MARGINS", False)
+    img = _page()
+    assert ocr_crops(img) == [img]
+
+
+def test_regions_crop_each_box_and_drop_blank_ones(monkeypatch):
+    monkeypatch.setattr(pageprep, "OCR_REGIONS", {"HDFC": [(0, 0, 1, 0.5), (0, 0.5, 1, 1)]})
+    img = _page(ink=[(50, 50, 149, 99)])  # ink in the top half only
+    (crop,) = ocr_crops(img, "HDFC")
+    pad = round(img.width * pageprep.CROP_PADDING)
+    assert crop.size == (100 + 2 * pad, 50 + 2 * pad)
+    assert len(ocr_crops(img, "SBI")) == 1  # no regions for SBI: the whole page, cropped
+
+
+@pytest.mark.parametrize("raw, regions", [
+    ("", {}),
+    ('{"hdfc": [[0, 0, 1, 0.35]]}', {"HDFC": [(0.0, 0.0, 1.0, 0.35)]}),
+    ('{"HDFC": [[0, 0.5, 1, 0.4]]}', {}),  # top below bottom
+    ('{"HDFC": [[0, 0, 1]]}', {}),
+    ("not json", {}),
+])
+def test_load_regions(raw, regions):
+    assert pageprep._load_regions(raw) == regions
+
+
+def test_numpy_and_pillow_measure_the_same():
+    numpy = pytest.importorskip("numpy")
+    img = _page(ink=[(100, 200, 299, 249), (10, 500, 40, 590)])
+    with_numpy = page_ink(img)
+    pageprep.np = None
+    try:
+        with_pillow = page_ink(img)
+    finally:
+        pageprep.np = numpy
+    assert with_numpy.bbox == with_pillow.bbox
+    assert with_numpy.ink == pytest.approx(with_pillow.ink)
+    assert with_numpy.stddev == pytest.approx(with_pillow.stddev, rel=1e-3)
+
+
+def test_blank_page_skips_the_engine(monkeypatch):
+    def no_engine(size=1):
+        raise AssertionError("a blank page reached OCR")
+
+    monkeypatch.setattr(extractor, "get_engine", no_engine)
+    timer = StageTimer()
+    assert extractor._ocr_page(1, _page(), timer, scored=True) == ("", 100.0)
+    assert extractor._ocr_page(2, _page(), timer) == ""
+    assert timer.counts == {"ocr_blank_pages": 2}
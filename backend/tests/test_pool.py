@@ -0,0 +1,68 @@
+# backend/tests/test_pool.py
+import asyncio
+import os
+import time
+
+import pytest
+
+from app import main
+from app.pool import ParsePool, ParseTimeout
+from bench.samples import statement_pdf
+
+
+def _sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def _slow_parse(*args):
+    time.sleep(0.5)
+
+
+def test_parse_is_503_when_the_pool_is_full(client, monkeypatch):
+    monkeypatch.setattr(main.parse_pool, "max_queue", 0)
+    r = client.post("/parse", files={"file": ("s.pdf", statement_pdf("SBI", 2), "application/pdf")})
+    assert r.status_code == 503 and r.headers["retry-after"] == "5"
+
+
+def test_parse_is_504_when_parsing_times_out(client, monkeypatch):
+    pool = ParsePool(mode="thread", size=1, timeout=0.05)
+    monkeypatch.setattr(main, "parse_pool", pool)
+    monkeypatch.setattr(main, "parse_pdf", _slow_parse)
+    try:
+        r = client.post("/parse", files={"file": ("s.pdf", statement_pdf("SBI", 2), "application/pdf")})
+    finally:
+        pool.shutdown()
+    assert r.status_code == 504 and "0.05s" in r.json()["error"]
+
+
+def test_parse_succeeds_on_the_pool(client):
+    r = client.post("/parse", files={"file": ("s.pdf", statement_pdf("SBI", 2), "application/pdf")})
+    assert r.status_code == 200 and r.json()["bank"] == "SBI"
+
+
+def test_timed_out_job_frees_its_worker_process():
+    pool = ParsePool(mode="process", size=1)
+    try:
+        with pytest.raises(ParseTimeout):
+            asyncio.run(pool.run(_sleep, 5, timeout=0.3))
+        # the worker stopped the first job itself, so the next one doesn't wait the 5 s out
+        started = time.monotonic()
+        assert asyncio.run(pool.run(_sleep, 0, timeout=3)) == 0
+        assert time.monotonic() - started < 3
+    finally:
+        pool.shutdown()
+
+
+def test_broken_process_pool_is_shut_down_and_replaced():
+    pool = ParsePool(mode="process", size=1)
+    try:
+        with pytest.raises(Exception):
+            pool.submit(os._exit, 1).result(timeout=10)  # kills the worker: the pool is broken
+        broken, shutdowns = pool._executor, []
+        broken.shutdown = lambda **kw: shutdowns.append(kw)
+        assert pool.submit(abs, -3).result(timeout=10) == 3
+        assert pool._executor is not broken and shutdowns == [{"wait": False, "cancel_futures": True}]
+        assert pool.pending == 0
+    finally:
+        pool.shutdown()
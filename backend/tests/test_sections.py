@@ -0,0 +1,37 @@
+# backend/tests/test_sections.py
+import pytest
+
+from app.parser.bank_parsers import detect_bank_and_parse
+from app.parser.extractor import parse_pdf
+from app.parser.sections import SectionIndex
+from bench.samples import BANKS, PAGE_FOOTER, statement_pages, statement_parts, statement_pdf
+
+FOOTER = PAGE_FOOTER.format(page=1, pages=2)
+
+
+def test_transactions_block_runs_past_page_footers():
+    text = "\n".join(["Summary", "Transaction Details", "01/09/2025 A 1.00", FOOTER, "02/09/2025 B 2.00"])
+    sections = SectionIndex(text)
+    assert sections.span("transactions") == (text.index("Transaction Details"), len(text))
+    assert sections.span("footer")[0] == text.index("Important Information")
+    records = sections.section_lines("transactions").records
+    assert [(r.date, r.amount) for r in records] == [("01/09/2025", "1.00"), ("02/09/2025", "2.00")]
+
+
+@pytest.mark.parametrize("bank, rows", [
+    ("ICICI", ["01/09/2025 AMAZON 1.00", "02/09/2025 SWIGGY 2.00", "03/09/2025 UBER 3.00"]),
+    ("SBI", ["01 Sep 25 AMAZON 1.00 D", "02 Sep 25 SWIGGY 2.00 D", "03 Sep 25 UBER 3.00 C"]),
+])
+def test_rows_between_page_footers(bank, rows):
+    head, _, _ = statement_parts(bank, 0)
+    text = "\n".join(head + rows[:1] + [FOOTER] + rows[1:2] + [FOOTER, "Reward Points"] + rows[2:])
+    txs = detect_bank_and_parse(text)["fields"]["transactions"]
+    assert [t["amount_paise"] for t in txs] == [100, 200, -300 if bank == "SBI" else 300]
+
+
+@pytest.mark.parametrize("bank", BANKS)
+def test_multi_page_statement_keeps_every_row(bank):
+    pages = statement_pages(bank, 45, pages=3)
+    assert sum(PAGE_FOOTER[:20] in line for page in pages for line in page) == 3
+    result = parse_pdf(statement_pdf(bank, 45, pages=3))
+    assert len(result["fields"]["transactions"]) == 45
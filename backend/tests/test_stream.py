@@ -0,0 +1,71 @@
+# backend/tests/test_stream.py
+import pytest
+
+from app.parser import extractor
+from app.parser.cache import document_digest
+from app.parser.extractor import _StreamPublisher, extract_pages_from_pdf_bytes, parse_pdf, result_events, stream_parse
+from bench.samples import BANKS, statement_pdf
+
+ROWS = [{"date": f"2025-09-0{i}", "description": f"row {i}", "amount": "1.00", "type": "Debit",
+         "amount_paise": 100} for i in range(1, 5)]
+RESULT = {"bank": "SBI", "confidence": 1.0, "fields": {"last4": "1234", "transactions": ROWS}}
+
+pytestmark = pytest.mark.usefixtures("no_text_cache")
+
+
+def _parse(pdf, **kw):
+    result = parse_pdf(pdf, **kw)
+    result.pop("timings")
+    return result
+
+
+def test_publisher_sends_only_rows_the_stream_lacks():
+    events = []
+    publisher = _StreamPublisher(events.append)
+    publisher.add(ROWS[:2], 1, 2)
+    publisher.add([], 1, 2)
+    publisher.publish(RESULT, 2, 2, final=True)
+    assert [e["event"] for e in events] == ["transactions", "bank", "summary", "transactions"]
+    assert events[0]["transactions"] == ROWS[:2] and events[-1]["transactions"] == ROWS[2:]
+    assert not any(e.get("reset") for e in events)
+
+
+def test_publisher_resets_rows_the_final_parse_changed():
+    events = []
+    publisher = _StreamPublisher(events.append)
+    publisher.add([dict(ROWS[0], description="row 1 (continued on next page)")], 1, 2)
+    publisher.publish(RESULT, 2, 2, final=True)
+    last = events[-1]
+    assert last["reset"] is True and last["transactions"] == ROWS
+    assert publisher.sent == ROWS
+
+
+def test_result_events_for_a_cached_result():
+    events = result_events(RESULT)
+    assert [e["event"] for e in events] == ["bank", "summary", "transactions"]
+    assert events[1]["fields"] == {"last4": "1234"}
+
+
+@pytest.mark.parametrize("bank", BANKS)
+def test_stream_parse_matches_parse_pdf(bank):
+    pdf = statement_pdf(bank, 90, pages=4)
+    events = []
+    result = stream_parse(pdf, events.append)
+    result.pop("timings")
+    assert result == _parse(pdf)
+    pages = [e["page"] for e in events if e["event"] == "transactions"]
+    sent = [tx for e in events if e["event"] == "transactions" for tx in e["transactions"]]
+    assert sent == result["fields"]["transactions"]
+    assert len(set(pages)) > 1  # rows arrived while pages were still being read
+    assert not any(e.get("reset") for e in events)
+
+
+def test_stream_parse_leaves_the_pages_for_the_next_parse(text_cache):
+    pdf = statement_pdf("HDFC", 60, pages=3)
+    streamed = stream_parse(pdf, lambda event: None)
+    pages = text_cache.get(f"{document_digest(pdf)}:pages:{extractor.OCR_CACHE_TAG}")
+    assert pages == extract_pages_from_pdf_bytes(pdf)
+    result = parse_pdf(pdf)
+    assert result.pop("timings")["text_cache_hits"] == 1
+    streamed.pop("timings")
+    assert result == streamed
@@ -0,0 +1,65 @@
+# backend/tests/test_summary.py
+import pytest
+
+from app.parser import extractor
+from app.parser.cache import document_digest
+from app.parser.extractor import extract_pages_from_pdf_bytes, parse_pdf
+from bench.samples import BANKS, statement_pdf, statement_text, text_pdf
+
+pytestmark = pytest.mark.usefixtures("no_text_cache")
+
+
+def _parse(pdf, **kw):
+    result = parse_pdf(pdf, **kw)
+    result.pop("timings")
+    return result
+
+
+@pytest.mark.parametrize("bank", BANKS)
+def test_summary_mode_matches_full_parse(bank):
+    pdf = statement_pdf(bank, 60, pages=3)
+    full = _parse(pdf)
+    full["fields"].pop("transactions")
+    assert _parse(pdf, mode="summary") == full
+
+
+def test_axis_summary_derives_the_billing_cycle_from_the_rows():
+    lines = [l for l in statement_text("AXIS", 30).split("\n") if "Statement Period" not in l]
+    pdf = text_pdf([lines[:20], lines[20:]])
+    full = _parse(pdf)
+    assert full["fields"]["billing_cycle_start"]
+    full["fields"].pop("transactions")
+    assert _parse(pdf, mode="summary") == full
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        parse_pdf(b"", mode="everything")
+
+
+def _cached_pages(cache, pdf):
+    return cache.get(f"{document_digest(pdf)}:pages:{extractor.OCR_CACHE_TAG}")
+
+
+def test_summary_caches_the_pages_once_it_has_read_them_all(text_cache):
+    lines = [l for l in statement_text("AXIS", 30).split("\n") if "Statement Period" not in l]
+    pdf = text_pdf([lines[:20], lines[20:]])  # the billing cycle needs every page
+    summary = _parse(pdf, mode="summary")
+    assert _cached_pages(text_cache, pdf) == extract_pages_from_pdf_bytes(pdf)
+    again = parse_pdf(pdf, mode="summary")
+    assert again.pop("timings")["text_cache_hits"] == 1
+    assert again == summary
+
+
+def test_summary_that_stops_early_caches_nothing(text_cache):
+    pdf = statement_pdf("ICICI", 60, pages=3)
+    assert parse_pdf(pdf, mode="summary")["timings"]["pages_read"] < 3
+    assert _cached_pages(text_cache, pdf) is None
+
+
+def test_pages_are_not_cached_when_ocr_fails(monkeypatch, text_cache):
+    monkeypatch.setattr(extractor, "_ocr_pages_cached", lambda *args, **kw: {})
+    lines = [l for l in statement_text("AXIS", 30).split("\n") if "Statement Period" not in l]
+    pdf = text_pdf([lines[:20], [], lines[20:]])  # a page with no text layer, as a scan has
+    assert parse_pdf(pdf, mode="summary")["timings"]["pages_read"] == 3
+    assert _cached_pages(text_cache, pdf) is None
@@ -0,0 +1,146 @@
+# backend/tests/test_uploads.py
+import asyncio
+import hashlib
+import os
+from functools import partial
+
+import pytest
+
+from app import main, uploads
+from app.uploads import BadUpload, SpooledPdf, UploadTooLarge, iter_uploads, spool_request
+from bench.samples import statement_pdf
+
+BOUNDARY = "test-boundary"
+
+
+def _multipart(*files):
+    """A multipart/form-data body of (field, filename, data) file parts."""
+    body = b""
+    for field, filename, data in files:
+        body += (f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+                 f"Content-Type: application/octet-stream\r\n\r\n").encode() + data + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+class FakeRequest:
+    """Just what iter_uploads reads: the content type and the body, `chunk` bytes at a time."""
+
+    def __init__(self, body, chunk=7, content_type=f"multipart/form-data; boundary={BOUNDARY}"):
+        self.headers = {"content-type": content_type}
+        self.body = body
+        self.chunk = chunk
+        self.read = 0
+
+    async def stream(self):
+        for i in range(0, len(self.body), self.chunk):
+            self.read = i + self.chunk
+            yield self.body[i:i + self.chunk]
+
+
+def _parts(request, **kw):
+    async def run():
+        return [part async for part in iter_uploads(request, **kw)]
+    return asyncio.run(run())
+
+
+def test_small_upload_stays_in_memory():
+    with SpooledPdf(max_bytes=100, spool_bytes=10) as spool:
+        spool.write(b"%PDF-")
+        spool.write(b"1.4")
+        spool.finish()
+        assert spool.path is None and spool.source == b"%PDF-1.4"
+        assert spool.digest == hashlib.sha256(b"%PDF-1.4").hexdigest()
+
+
+def test_large_upload_rolls_over_to_a_temp_file():
+    data = bytes(range(256)) * 4
+    spool = SpooledPdf(max_bytes=2048, spool_bytes=100)
+    for i in range(0, len(data), 64):
+        spool.write(data[i:i + 64])
+    spool.finish()
+    path = spool.source
+    assert path == spool.path and open(path, "rb").read() == data
+    assert spool.digest == hashlib.sha256(data).hexdigest()
+    spool.close()
+    assert not os.path.exists(path)
+
+
+def test_upload_over_its_cap_raises_at_once():
+    spool = SpooledPdf(max_bytes=10, spool_bytes=0)
+    spool.write(b"0123456789")
+    with pytest.raises(UploadTooLarge, match="limit"):
+        spool.write(b"x")
+    spool.close()
+
+
+def test_parts_arrive_in_small_chunks_and_spool():
+    pdf = statement_pdf("SBI", 3)
+    request = FakeRequest(_multipart(("file", "a.pdf", pdf), ("files", "b.txt", b"notes")))
+    parts = _parts(request, limit=lambda name: 1 << 20, spool_bytes=64)
+    try:
+        assert [(p.field, p.filename, p.error) for p in parts] == [("file", "a.pdf", None), ("files", "b.txt", None)]
+        assert open(parts[0].spool.source, "rb").read() == pdf
+        assert parts[1].spool.source == b"notes"
+    finally:
+        for part in parts:
+            part.close()
+
+
+def test_part_over_its_cap_is_dropped_and_the_rest_still_read():
+    request = FakeRequest(_multipart(("files", "big.pdf", b"x" * 100), ("files", "ok.pdf", b"%PDF")))
+    parts = _parts(request, limit=lambda name: 50)
+    assert [(p.filename, p.spool is None, p.error) for p in parts] == [
+        ("big.pdf", True, uploads.too_large_message(50)), ("ok.pdf", False, None)]
+    parts[1].close()
+
+
+def test_spool_request_stops_reading_at_the_cap():
+    body = _multipart(("file", "big.pdf", b"x" * 10000))
+    request = FakeRequest(body, chunk=100)
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(spool_request(request, max_bytes=1000))
+    assert request.read < 2000  # nothing much past the cap was read
+
+
+def test_spool_request_needs_its_field_and_a_multipart_body():
+    with pytest.raises(BadUpload, match='"file"'):
+        asyncio.run(spool_request(FakeRequest(_multipart(("other", "a.pdf", b"%PDF")))))
+    with pytest.raises(BadUpload, match="multipart"):
+        asyncio.run(spool_request(FakeRequest(b"{}", content_type="application/json")))
+    part = asyncio.run(spool_request(FakeRequest(_multipart(("file", "scan.png", b"\x89PNG")))))
+    assert part.spool is None  # not a PDF: not stored
+
+
+def test_declared_oversized_upload_is_413_before_the_body_is_read(client, monkeypatch):
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 1000)
+    monkeypatch.setattr(main, "MULTIPART_OVERHEAD_BYTES", 0)
+    for path in main.SINGLE_FILE_ENDPOINTS:
+        r = client.post(path, content=b"x" * 1001,
+                        headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"})
+        assert r.status_code == 413 and r.json() == {"error": "File is larger than the 1 KB limit."}
+
+
+def test_chunked_upload_over_the_cap_is_413(client, monkeypatch):
+    monkeypatch.setattr(main, "spool_request", partial(spool_request, max_bytes=1000))
+    body = _multipart(("file", "big.pdf", b"x" * 5000))
+
+    def chunks():  # no Content-Length: the cap is only found while reading
+        for i in range(0, len(body), 512):
+            yield body[i:i + 512]
+
+    r = client.post("/parse", content=chunks(), headers={"content-type": f"multipart/form-data; boundary={BOUNDARY}"})
+    assert r.status_code == 413 and r.json() == {"error": "File is larger than the 1 KB limit."}
+
+
+def test_upload_endpoint_errors(client):
+    r = client.post("/parse", files={"file": ("scan.png", b"\x89PNG", "image/png")})
+    assert r.status_code == 400
+    r = client.post("/parse", files={"document": ("s.pdf", statement_pdf("SBI", 1), "application/pdf")})
+    assert r.status_code == 422 and r.json() == {"error": 'Missing the "file" file.'}
+
+
+def test_spooled_upload_parses_from_its_temp_file(client, monkeypatch):
+    monkeypatch.setattr(main, "spool_request", partial(spool_request, spool_bytes=0))
+    pdf = statement_pdf("KOTAK", 12, pages=2)
+    r = client.post("/parse", files={"file": ("k.pdf", pdf, "application/pdf")})
+    assert r.status_code == 200 and len(r.json()["fields"]["transactions"]) == 12
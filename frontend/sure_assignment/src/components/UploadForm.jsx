@@ -1,5 +1,4 @@
 import React, { useState } from "react";
-import axios from "axios";
 import ResultCard from "./ResultCard";
 import { Loader2 } from "lucide-react";
 
@@ -17,6 +16,36 @@ export default function UploadForm() {
     setResult(null);
   };
 
+  // Apply one /parse-stream event to the result shown so far
+  const applyEvent = (event) => {
+    if (event.event === "bank") {
+      setResult((r) => ({
+        success: true,
+        bank: event.bank,
+        confidence: event.confidence,
+        fields: { transactions: [], ...(r?.fields || {}) },
+      }));
+    } else if (event.event === "summary") {
+      setResult((r) => ({
+        ...r,
+        fields: { ...event.fields, transactions: r?.fields?.transactions || [] },
+      }));
+    } else if (event.event === "transactions") {
+      setResult((r) => ({
+        ...r,
+        fields: {
+          ...r?.fields,
+          transactions: event.reset
+            ? event.transactions
+            : [...(r?.fields?.transactions || []), ...event.transactions],
+        },
+      }));
+    } else if (event.event === "error" || (event.event === "done" && !event.success)) {
+      setResult(null);
+      setError(event.error);
+    }
+  };
+
   const upload = async () => {
     if (!file) return setError("Please select a PDF file first.");
     setLoading(true);
@@ -27,17 +56,28 @@ export default function UploadForm() {
       const formData = new FormData();
       formData.append("file", file);
 
-      const res = await axios.post(`${API_BASE}/parse`, formData, {
-        headers: { "Content-Type": "multipart/form-data" },
-      });
-
-      setResult(res.data);
+      // NDJSON events: bank, then summary, then transactions page by page, then done
+      const res = await fetch(`${API_BASE}/parse-stream`, { method: "POST", body: formData });
+      if (!res.ok) {
+        const body = await res.json().catch(() => ({}));
+        setError(body.error || body.detail || "⚠️ Parsing failed.");
+        return;
+      }
+
+      const reader = res.body.getReader();
+      const decoder = new TextDecoder();
+      let buffered = "";
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split("\n");
+        buffered = lines.pop();
+        lines.filter((line) => line.trim()).forEach((line) => applyEvent(JSON.parse(line)));
+      }
     } catch (err) {
       console.error("Upload error:", err);
-      setError(
-        err.response?.data?.error ||
-          "⚠️ Unable to reach backend. Check if FastAPI is running."
-      );
+      setError("⚠️ Unable to reach backend. Check if FastAPI is running.");
     } finally {
       setLoading(false);
     }
@@ -124,8 +164,8 @@ export default function UploadForm() {
         </div>
       )}
 
-      {/* Loading Overlay */}
-      {loading && (
+      {/* Loading Overlay (until the first part of the result arrives) */}
+      {loading && !result && (
         <div className="fixed inset-0 bg-black/40 flex items-center justify-center z-50">
           <div className="bg-white p-6 rounded-xl shadow-xl flex flex-col items-center gap-3">
             <Loader2 className="animate-spin w-8 h-8 text-indigo-600" />